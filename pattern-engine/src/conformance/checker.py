@@ -20,7 +20,7 @@ References:
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from .deviations import (
     Deviation,
@@ -293,6 +293,54 @@ class ConformanceChecker:
             trace_length=len(trace)
         )
 
+    def quick_reject(
+        self,
+        activities: Iterable[str],
+        threshold: float = 0.8
+    ) -> bool:
+        """
+        Cheaply test whether a trace cannot reach a fitness threshold.
+
+        Only the set of executed activities is inspected. Each missing
+        mandatory activity and each activity unknown to the model is
+        guaranteed to yield at least one deviation, so their penalties
+        give an upper bound on the fitness check_trace() would return.
+
+        Args:
+            activities: Activity (event type) names seen in the trace
+            threshold: Fitness score the trace must be able to reach
+
+        Returns:
+            True if the trace's fitness is guaranteed to be below threshold;
+            False if a full check_trace() is needed to decide
+        """
+        executed: Set[str] = set()
+        for event_type in set(activities):
+            if not event_type:
+                continue
+            activity = self._model.get_activity_for_event(event_type)
+            executed.add(activity.name if activity else event_type)
+
+        if not executed:
+            # Empty traces produce no deviations
+            return False
+
+        penalty = 0.0
+        for activity_name in executed:
+            if self._model.get_activity(activity_name) is None:
+                severity = self._scorer.get_severity(
+                    DeviationType.UNEXPECTED_ACTIVITY, activity_name
+                )
+                penalty += self.SEVERITY_PENALTIES.get(severity, 0.1)
+
+        for activity_name in self._model.mandatory_activities - executed:
+            severity = self._scorer.get_severity(
+                DeviationType.MISSING_ACTIVITY, activity_name
+            )
+            penalty += self.SEVERITY_PENALTIES.get(severity, 0.1)
+
+        return round(max(0.0, 1.0 - penalty), 4) < threshold
+
     def check_log(
         self,
         event_log: List[Dict[str, Any]],
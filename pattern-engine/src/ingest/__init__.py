@@ -16,14 +16,22 @@ Benchmark Datasets:
 """
 
 from .loader import DataLoader
-from .csv_loader import CSVLoader, convert_csv_to_orders, load_csv_directory
+from .csv_loader import (
+    CSVLoader,
+    UnifiedDocument,
+    convert_csv_to_orders,
+    load_csv_directory,
+)
 from .salt_adapter import SALTAdapter, SALTLoadResult, load_salt_dataset
-from .bpi2019_adapter import BPI2019Adapter, BPI2019LoadResult, load_bpi2019_dataset
+from .bpi2019_adapter import (
+    BPI2019Adapter, BPI2019Event, BPI2019LoadResult, load_bpi2019_dataset,
+)
 
 __all__ = [
     # Core loaders
     'DataLoader',
     'CSVLoader',
+    'UnifiedDocument',
     'convert_csv_to_orders',
     'load_csv_directory',
     # SAP SALT adapter
@@ -32,6 +40,7 @@ __all__ = [
     'load_salt_dataset',
     # BPI 2019 adapter
     'BPI2019Adapter',
+    'BPI2019Event',
     'BPI2019LoadResult',
     'load_bpi2019_dataset',
 ]
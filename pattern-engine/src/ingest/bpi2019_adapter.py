@@ -25,8 +25,13 @@ Dataset Statistics:
 Example Usage:
     from ingest.bpi2019_adapter import BPI2019Adapter
 
-    # Load from CSV
+    # Load from a Parquet snapshot (requires pyarrow), reading only the
+    # columns the adapter understands
     adapter = BPI2019Adapter()
+    adapter.load_from_parquet("/path/to/BPI_Challenge_2019.parquet")
+
+    # Or from the CSV export (a fresh BPI_Challenge_2019.parquet next to it
+    # is picked up automatically)
     adapter.load_from_csv("/path/to/BPI_Challenge_2019.csv")
 
     # Convert to workflow mining format
@@ -36,16 +41,30 @@ Example Usage:
     adapter.load_from_xes("/path/to/BPI_Challenge_2019.xes")
 """
 
+import bisect
 import logging
 import csv
 import gzip
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from heapq import nlargest
+from itertools import islice, repeat
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Set,
+    Tuple, Union,
+)
+from collections import Counter
 import json
 import re
+import sys
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +76,24 @@ except ImportError:
     PANDAS_AVAILABLE = False
     pd = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pa_csv = None
+    pq = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 
 @dataclass
 class BPI2019LoadResult:
@@ -83,6 +120,51 @@ class BPI2019LoadResult:
         )
 
 
+class BPI2019Event(NamedTuple):
+    """
+    A single BPI 2019 event.
+
+    A tuple with named fields, much smaller than a per-event dict. Read-only
+    mapping access (event['activity'], get(), keys(), items()) is kept for
+    code written against dictionary events.
+    """
+
+    case_id: Optional[str]
+    activity: Optional[str]
+    timestamp: Optional[datetime]
+    document_number: Optional[str]
+    item_number: Optional[str]
+    vendor: Optional[str]
+    vendor_name: Optional[str]
+    company: Optional[str]
+    document_type: Optional[str]
+    item_category: Optional[str]
+    spend_area: Optional[str]
+    spend_classification: Optional[str]
+    resource: Optional[str]
+    gr_based_inv: bool = False
+    goods_receipt: bool = False
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default if there is no such field."""
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, in order."""
+        return self._fields
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """(field name, value) pairs, in order."""
+        return zip(self._fields, self)
+
+
 # Activity mapping: BPI 2019 activities → O2C equivalents
 # This maps P2P activities to conceptually similar O2C activities
 ACTIVITY_MAPPING = {
@@ -135,6 +217,205 @@ ACTIVITY_MAPPING = {
 }
 
 
+# Source column names per event field, in lookup order. CSV exports of the
+# log use "case Vendor" / "event concept:name" style headers; XES-derived
+# files use "case:Vendor" / "concept:name".
+COLUMN_ALIASES: Dict[str, List[str]] = {
+    'case_id': ['case concept:name', 'case:concept:name', 'Case ID'],
+    'activity': ['event concept:name', 'concept:name', 'Activity'],
+    'timestamp': ['event time:timestamp', 'time:timestamp', 'timestamp'],
+    'document_number': ['case Purchasing Document', 'case:Purchasing Document'],
+    'item_number': ['case Item', 'case:Item'],
+    'vendor': ['case Vendor', 'case:Vendor'],
+    'vendor_name': ['case Name', 'case:Name'],
+    'company': ['case Company', 'case:Company'],
+    'document_type': ['case Document Type', 'case:Document Type'],
+    'item_category': ['case Item Category', 'case:Item Category'],
+    'spend_area': ['case Spend area text', 'case:Spend area text'],
+    'spend_classification': ['case Spend classification text'],
+    'resource': ['event org:resource', 'org:resource', 'event User'],
+    'gr_based_inv': ['case GR-Based Inv. Verif.'],
+    'goods_receipt': ['case Goods Receipt'],
+}
+
+
+# Common BPI 2019 timestamp shapes that parse to a naive datetime: ISO date
+# and time, then fractional seconds (ignored, along with anything after
+# them) or a UTC designator
+_TIMESTAMP_RE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:\..*|(?:Z|\+00:00)*)$',
+    re.ASCII | re.DOTALL,
+)
+
+
+# Activity kinds for order date extraction, as bit flags: an activity can
+# mark several dates at once (e.g. 'Create Invoice')
+KIND_CREATE = 1
+KIND_GOODS_RECEIPT = 2
+KIND_INVOICE = 4
+
+
+def _classify_activity(activity: str) -> int:
+    """Return the KIND_* flags of an activity from its name."""
+    kind = 0
+    if 'Create' in activity or 'Record Purchase Order' in activity:
+        kind |= KIND_CREATE
+    if 'Goods Receipt' in activity or 'Receive Goods' in activity:
+        kind |= KIND_GOODS_RECEIPT
+    if 'Invoice' in activity:
+        kind |= KIND_INVOICE
+    return kind
+
+
+class _ActivityKinds(dict):
+    """Activity -> KIND_* flags, classifying unseen activities on first lookup."""
+
+    def __missing__(self, activity: str) -> int:
+        kind = self[activity] = _classify_activity(activity)
+        return kind
+
+
+# Known activities are classified at import; others on first sight
+ACTIVITY_KIND = _ActivityKinds({
+    activity: _classify_activity(activity) for activity in ACTIVITY_MAPPING
+})
+
+
+# Text fields shared by many events. Low-cardinality ones (a few dozen
+# activities, a few thousand vendors/users) go through sys.intern; case and
+# document identifiers, unique per few events, through a per-adapter pool.
+INTERNED_FIELDS = frozenset({
+    'activity', 'item_number', 'vendor', 'vendor_name', 'company',
+    'document_type', 'item_category', 'spend_area', 'spend_classification',
+    'resource',
+})
+POOLED_FIELDS = frozenset({'case_id', 'document_number'})
+
+
+# Read size for compressed exports: large enough to amortize decompression
+# calls, small enough to keep memory flat on multi-GB files
+GZIP_BLOCK_SIZE = 1 << 20
+
+# Events parsed per ingest chunk; statistics are reduced column-wise per chunk
+INGEST_CHUNK_SIZE = 65536
+
+
+def _open_csv_text(path: Path, encoding: str) -> io.TextIOBase:
+    """Open a (possibly gzipped) CSV export as text for the csv module."""
+    if path.suffix == '.gz':
+        raw = io.BufferedReader(gzip.open(path, 'rb'), buffer_size=GZIP_BLOCK_SIZE)
+        return io.TextIOWrapper(raw, encoding=encoding, newline='')
+    return open(path, 'r', encoding=encoding, newline='')
+
+
+class _InvalidRow(NamedTuple):
+    """Stand-in for a CSV row with the wrong number of fields (worker output)."""
+    expected_columns: int
+    actual_columns: int
+
+
+def _invalid_row_warning(number: Optional[int], expected: int, actual: int) -> str:
+    """Load warning for a skipped row, in the form Arrow's reader reports it."""
+    return f"Row {number}: expected {expected} fields, got {actual}"
+
+
+class _CsvRowNumbers:
+    """
+    CSV row numbers of a load, counted from 1 at the header.
+
+    Blank lines are not counted, as in Arrow's reader. Rows skipped for a
+    wrong field count are reported here as they are found, so a parse
+    failure in the i-th kept row can be given its number in the file.
+    """
+
+    def __init__(self, result: BPI2019LoadResult):
+        self.result = result
+        self._skipped: List[int] = []
+
+    def skip(self, number: Optional[int], expected: int, actual: int) -> None:
+        """Record a row skipped for having the wrong number of fields."""
+        if number is not None:
+            bisect.insort(self._skipped, number)
+        self.result.warnings.append(_invalid_row_warning(number, expected, actual))
+
+    def __call__(self, index: int) -> int:
+        """Row number of the data row at index among the rows kept."""
+        number = index + 2
+        for skipped in self._skipped:
+            if skipped > number:
+                break
+            number += 1
+        return number
+
+
+def _first_positions(values: Sequence[Any]) -> Dict[Any, int]:
+    """Position of the first occurrence of each distinct value, in order of appearance."""
+    # Building from the reversed column lets earlier positions overwrite later ones
+    first = dict(zip(reversed(values), range(len(values) - 1, -1, -1)))
+    return {value: first[value] for value in dict.fromkeys(values)}
+
+
+def _time_ranks(events: List[BPI2019Event]) -> Optional[np.ndarray]:
+    """
+    Rank events by timestamp (missing timestamps order as datetime.min).
+
+    Returns:
+        int64 array of dense ranks, one per event, or None if the
+        timestamps cannot be ordered (offset-aware mixed with naive)
+    """
+    keys = [e.timestamp or datetime.min for e in events]
+    try:
+        rank = {ts: i for i, ts in enumerate(sorted(set(keys)))}
+    except TypeError:
+        return None
+    return np.fromiter((rank[ts] for ts in keys), dtype=np.int64, count=len(keys))
+
+
+class _EventGroups(Mapping):
+    """
+    Read-only mapping of a field value -> events, backed by group offsets.
+
+    Groups are numbered in order of first appearance and event positions
+    are stably sorted by (group, time rank), so each group is a contiguous
+    slice of one integer array and lists its events in time order, ties
+    keeping ingest order. Without time ranks, groups keep ingest order and
+    time_ordered is False.
+    """
+
+    def __init__(
+        self,
+        events: List[BPI2019Event],
+        field_name: str,
+        time_ranks: Optional[np.ndarray] = None
+    ):
+        self._events = events
+        self._codes: Dict[Any, int] = {}
+        key = attrgetter(field_name)
+        group_codes = np.fromiter(
+            (self._codes.setdefault(key(e), len(self._codes)) for e in events),
+            dtype=np.int64,
+            count=len(events),
+        )
+        self.time_ordered = time_ranks is not None
+        if self.time_ordered:
+            self._order = np.lexsort((time_ranks, group_codes))
+        else:
+            self._order = np.argsort(group_codes, kind='stable')
+        sizes = np.bincount(group_codes, minlength=len(self._codes))
+        self._offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+    def __getitem__(self, value: Any) -> List[BPI2019Event]:
+        code = self._codes[value]
+        positions = self._order[self._offsets[code]:self._offsets[code + 1]]
+        return [self._events[i] for i in positions.tolist()]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+
 class BPI2019Adapter:
     """
     Adapter for BPI Challenge 2019 dataset.
@@ -167,113 +448,647 @@ class BPI2019Adapter:
 
     def __init__(self):
         """Initialize the BPI 2019 adapter."""
-        self._events: List[Dict[str, Any]] = []
-        self._cases: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._events: List[BPI2019Event] = []
+        self._case_index: Optional[_EventGroups] = None
+        self._doc_index: Optional[_EventGroups] = None
+        self._string_pool: Dict[str, str] = {}
         self._documents: Dict[str, Dict[str, Any]] = {}
         self._vendors: Dict[str, Dict[str, Any]] = {}
         self._load_result: Optional[BPI2019LoadResult] = None
+        self._stream_sources: List[Callable[[], Iterator[BPI2019Event]]] = []
+
+    @property
+    def _cases(self) -> _EventGroups:
+        """Events grouped by case_id in time order, indexed on first access after a load."""
+        if self._case_index is None:
+            self._build_indexes()
+        return self._case_index
+
+    @property
+    def _events_by_doc(self) -> _EventGroups:
+        """Events grouped by document_number in time order, indexed like _cases."""
+        if self._doc_index is None:
+            self._build_indexes()
+        return self._doc_index
+
+    def _build_indexes(self) -> None:
+        """Group loaded events by case and by document, sharing one time ranking."""
+        time_ranks = _time_ranks(self._events)
+        self._case_index = _EventGroups(self._events, 'case_id', time_ranks)
+        self._doc_index = _EventGroups(self._events, 'document_number', time_ranks)
+
+    def _invalidate_indexes(self) -> None:
+        """Drop the case and document indexes after events were added."""
+        self._case_index = None
+        self._doc_index = None
+
+    def iter_events(self) -> Iterator[BPI2019Event]:
+        """
+        Iterate over all loaded events.
+
+        Events held in memory come first; each load made with streaming=True
+        is then re-read from its source file, so those events are never
+        held in memory together.
+
+        Yields:
+            BPI2019Event in load order
+        """
+        yield from self._events
+        for source in self._stream_sources:
+            yield from source()
+
+    def materialize(self) -> int:
+        """
+        Read loads made with streaming=True into memory.
+
+        Required before APIs that need random access to events
+        (to_workflow_format, to_workflow_columns, get_process_variants).
+
+        Returns:
+            Number of events held in memory
+        """
+        if self._stream_sources:
+            for source in self._stream_sources:
+                self._events.extend(source())
+            self._stream_sources = []
+            self._invalidate_indexes()
+        return len(self._events)
+
+    def _require_materialized(self) -> None:
+        """Raise if some events are only available by streaming."""
+        if self._stream_sources:
+            raise ValueError(
+                "Events were loaded with streaming=True. Call materialize() first."
+            )
 
     def load_from_csv(
         self,
         file_path: str,
         encoding: str = 'latin-1',  # BPI 2019 uses latin-1/cp1252 encoding
-        max_rows: Optional[int] = None
+        max_rows: Optional[int] = None,
+        prefer_parquet: bool = True,
+        workers: int = 1,
+        streaming: bool = False
     ) -> BPI2019LoadResult:
         """
         Load BPI 2019 dataset from CSV file.
 
+        If a Parquet snapshot written by convert_csv_to_parquet() sits next
+        to the CSV and is at least as new, it is loaded instead: the
+        snapshot holds the same rows and is far cheaper to read. Otherwise,
+        with PyArrow installed the file is parsed by Arrow's multithreaded
+        columnar CSV reader, restricted to the columns the adapter uses, and
+        streamed in record batches; without it csv.reader is used, split
+        across worker processes if workers > 1.
+
         Args:
             file_path: Path to CSV file (can be gzipped)
             encoding: File encoding
             max_rows: Maximum rows to load (None for all)
+            prefer_parquet: Use a fresh sibling Parquet snapshot if present
+            workers: Processes for the csv.reader fallback. Splitting is by
+                     byte range at line boundaries, so it applies only to
+                     uncompressed files without newlines inside quoted
+                     values (true of the BPI 2019 export) and without
+                     max_rows; otherwise the file is read sequentially.
+            streaming: Compute load statistics and document/vendor metadata
+                       without keeping the events in memory. iter_events()
+                       and to_event_log() re-read the file; other event
+                       APIs need materialize() first.
+
+        Returns:
+            BPI2019LoadResult with load statistics
+        """
+        path = Path(file_path)
+
+        if prefer_parquet and PYARROW_AVAILABLE:
+            snapshot = self._default_parquet_path(path)
+            try:
+                fresh = snapshot.stat().st_mtime >= path.stat().st_mtime
+            except OSError:
+                fresh = False
+            if fresh:
+                logger.info(f"Using Parquet snapshot {snapshot} for {path}")
+                return self.load_from_parquet(
+                    str(snapshot), max_rows=max_rows, streaming=streaming
+                )
+
+        result = BPI2019LoadResult()
+
+        logger.info(f"Loading BPI 2019 from {path}...")
+
+        numbers = _CsvRowNumbers(result)
+        rows, parse_row = self._csv_rows(path, encoding, workers, max_rows, numbers)
+        self._ingest_rows(
+            rows, result, max_rows, parse_row, store=not streaming, row_number=numbers
+        )
+        if streaming:
+            self._stream_sources.append(lambda: self._iter_parsed(
+                *self._csv_rows(
+                    path, encoding, workers, max_rows, _CsvRowNumbers(BPI2019LoadResult())
+                ),
+                max_rows,
+            ))
+
+        self._load_result = result
+        logger.info(f"BPI 2019 loaded successfully:\n{result}")
+        return result
+
+    def load_from_parquet(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        max_rows: Optional[int] = None,
+        batch_size: int = 65536,
+        filters: Optional[List[Tuple[str, str, Any]]] = None,
+        streaming: bool = False
+    ) -> BPI2019LoadResult:
+        """
+        Load BPI 2019 dataset from a Parquet snapshot.
+
+        This is the preferred ingest path. Only the source columns backing
+        the requested event fields are read, so unused columns are never
+        decompressed or decoded, and row filters are pushed down to the
+        reader so row groups that cannot match are skipped.
+
+        Args:
+            file_path: Path to Parquet file
+            columns: Event fields to load (keys of COLUMN_ALIASES);
+                     None loads every field the adapter understands
+            max_rows: Maximum rows to load (None for all)
+            batch_size: Rows decoded per record batch
+            filters: Row filters on source columns in pyarrow's DNF form,
+                     e.g. [('case Company', '=', 'companyID_0000')]
+            streaming: Keep only statistics and metadata in memory
+                       (see load_from_csv)
 
         Returns:
             BPI2019LoadResult with load statistics
         """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow required. Install with: pip install pyarrow")
+
         result = BPI2019LoadResult()
         path = Path(file_path)
 
         logger.info(f"Loading BPI 2019 from {path}...")
 
-        # Handle gzipped files
-        if path.suffix == '.gz':
-            opener = lambda: gzip.open(path, 'rt', encoding=encoding)
+        rows, parse_row = self._parquet_rows(path, columns, batch_size, filters)
+        self._ingest_rows(rows, result, max_rows, parse_row, store=not streaming)
+        if streaming:
+            self._stream_sources.append(lambda: self._iter_parsed(
+                *self._parquet_rows(path, columns, batch_size, filters),
+                max_rows,
+            ))
+
+        self._load_result = result
+        logger.info(f"BPI 2019 loaded successfully:\n{result}")
+        return result
+
+    def _csv_rows(
+        self,
+        path: Path,
+        encoding: str,
+        workers: int,
+        max_rows: Optional[int],
+        numbers: _CsvRowNumbers
+    ) -> Tuple[Iterable[Any], Callable[[Any], BPI2019Event]]:
+        """
+        Open a CSV export as raw rows plus the parser for them.
+
+        Uses Arrow's streaming reader when PyArrow is installed, otherwise
+        the worker-process split or csv.reader (see load_from_csv). Rows
+        skipped for a wrong field count are reported to numbers.
+        """
+        if PYARROW_AVAILABLE:
+            batches = self._open_csv_batches(path, encoding, numbers)
+            header = batches.schema.names
+            return self._iter_batch_rows(batches, header), self._row_parser(header)
+
+        if workers > 1 and not max_rows and path.suffix != '.gz':
+            rows = self._parse_csv_parallel(path, encoding, workers, numbers)
+            return rows, self._unwrap_parsed
+
+        with _open_csv_text(path, encoding) as f:
+            header = next(csv.reader(f), [])
+        return self._iter_csv_rows(path, encoding, numbers), self._row_parser(header)
+
+    @staticmethod
+    def _iter_csv_rows(
+        path: Path,
+        encoding: str,
+        numbers: _CsvRowNumbers
+    ) -> Iterator[List[str]]:
+        """
+        Data rows of a CSV export read with csv.reader.
+
+        Behaves like the Arrow reader: blank lines are ignored, and rows
+        with the wrong number of fields are skipped and reported to
+        numbers, numbered from 1 at the header.
+        """
+        with _open_csv_text(path, encoding) as f:
+            # BPI 2019 CSV may have commas in quoted fields
+            reader = csv.reader(f)
+            width = len(next(reader, []))
+            number = 1
+            for row in reader:
+                if not row:
+                    continue
+                number += 1
+                if len(row) != width:
+                    numbers.skip(number, width, len(row))
+                    continue
+                yield row
+
+    def _parquet_rows(
+        self,
+        path: Path,
+        columns: Optional[List[str]],
+        batch_size: int,
+        filters: Optional[List[Tuple[str, str, Any]]]
+    ) -> Tuple[Iterable[Any], Callable[[Any], BPI2019Event]]:
+        """Open a Parquet snapshot as raw rows plus the parser for them."""
+        parquet_file = pq.ParquetFile(path)
+        projection = self._resolve_columns(
+            parquet_file.schema_arrow.names, columns
+        )
+
+        if filters:
+            table = pq.read_table(path, columns=projection, filters=filters)
+            batches = table.to_batches(max_chunksize=batch_size)
         else:
-            opener = lambda: open(path, 'r', encoding=encoding, newline='')
+            batches = parquet_file.iter_batches(batch_size=batch_size, columns=projection)
+        return self._iter_batch_rows(batches, projection), self._row_parser(projection)
+
+    @staticmethod
+    def _parse_csv_parallel(
+        path: Path,
+        encoding: str,
+        workers: int,
+        numbers: _CsvRowNumbers
+    ) -> Iterator[Union[BPI2019Event, str]]:
+        """
+        Parse an uncompressed CSV export in byte ranges across processes.
+
+        Yields events (or error messages for rows that failed) in file order.
+        Rows with the wrong number of fields are skipped and reported to
+        numbers, as by _iter_csv_rows.
+        """
+        with open(path, 'rb') as f:
+            header = next(csv.reader([f.readline().decode(encoding)]), [])
+            data_start = f.tell()
+        size = path.stat().st_size
+        step = max(1, -(-(size - data_start) // workers))
+        starts = list(range(data_start, size, step))
+        ends = [min(start + step, size) for start in starts]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(
+                _parse_csv_range,
+                repeat(str(path)), repeat(encoding), repeat(header), starts, ends,
+            )
+            # Workers drop blank lines, so rows are numbered here in file order
+            number = 1
+            for chunk in chunks:
+                for item in chunk:
+                    number += 1
+                    if isinstance(item, _InvalidRow):
+                        numbers.skip(number, *item)
+                        continue
+                    yield item
+
+    @staticmethod
+    def _unwrap_parsed(item: Union[BPI2019Event, str]) -> BPI2019Event:
+        """Row parser for worker output: re-raise rows that failed to parse."""
+        if isinstance(item, str):
+            raise ValueError(item)
+        return item
+
+    def _open_csv_batches(
+        self,
+        path: Path,
+        encoding: str,
+        numbers: _CsvRowNumbers,
+        block_size: Optional[int] = None
+    ) -> 'pa_csv.CSVStreamingReader':
+        """
+        Stream a CSV export as Arrow record batches of the adapter's columns.
+
+        Every column is read as a string so values reach the row parser
+        exactly as csv.reader would deliver them. Rows with the wrong
+        number of fields are skipped and reported to numbers.
+        Gzipped input is decoded in GZIP_BLOCK_SIZE blocks, plain files in
+        8 MiB blocks unless block_size is given.
+        """
+        if block_size is None:
+            block_size = GZIP_BLOCK_SIZE if path.suffix == '.gz' else 8 << 20
+        with _open_csv_text(path, encoding) as f:
+            header = next(csv.reader(f), [])
+        projection = self._resolve_columns(header)
+
+        def skip_invalid(row) -> str:
+            numbers.skip(row.number, row.expected_columns, row.actual_columns)
+            return 'skip'
+
+        return pa_csv.open_csv(
+            path,
+            read_options=pa_csv.ReadOptions(
+                encoding=encoding, block_size=block_size, use_threads=True
+            ),
+            parse_options=pa_csv.ParseOptions(
+                newlines_in_values=True, invalid_row_handler=skip_invalid
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=projection,
+                column_types={name: pa.string() for name in projection},
+            ),
+        )
+
+    @staticmethod
+    def _iter_batch_rows(
+        batches: Iterable['pa.RecordBatch'],
+        header: List[str]
+    ) -> Iterable[Tuple[Optional[str], ...]]:
+        """Yield record batch rows as tuples of CSV-style strings, in header order."""
+        for batch in batches:
+            columns = []
+            for name in header:
+                column = batch.column(name)
+                values = column.to_pylist()
+                if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+                    # Typed Parquet values (timestamps, booleans) are fed to
+                    # the row parser in their CSV string form
+                    values = [v if v is None or isinstance(v, str) else str(v) for v in values]
+                columns.append(values)
+            yield from zip(*columns)
+
+    @staticmethod
+    def _resolve_columns(
+        available: List[str],
+        fields: Optional[List[str]] = None
+    ) -> List[str]:
+        """Map event fields to the source column names present in a file."""
+        wanted = set()
+        for name in fields or COLUMN_ALIASES.keys():
+            wanted.update(COLUMN_ALIASES.get(name, [name]))
+        return [col for col in available if col.strip() in wanted]
+
+    @staticmethod
+    def _default_parquet_path(csv_path: Path) -> Path:
+        """Sibling Parquet snapshot path for a (possibly gzipped) CSV export."""
+        name = csv_path.name
+        stem = name[:-len('.csv.gz')] if name.endswith('.csv.gz') else csv_path.stem
+        return csv_path.with_name(f"{stem}.parquet")
+
+    @staticmethod
+    def convert_csv_to_parquet(
+        csv_path: str,
+        parquet_path: Optional[str] = None,
+        encoding: str = 'latin-1'
+    ) -> str:
+        """
+        Convert a BPI 2019 CSV export into a Parquet snapshot.
+
+        All columns are kept as strings so the snapshot parses exactly like
+        the CSV. Output is Snappy-compressed with dictionary-encoded columns,
+        and is renamed into place only once fully written.
+
+        Args:
+            csv_path: Path to CSV file (can be gzipped)
+            parquet_path: Output path (defaults to the CSV path with a
+                          .parquet suffix)
+            encoding: CSV file encoding
 
-        min_date = None
-        max_date = None
+        Returns:
+            Path to the written Parquet file
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow required. Install with: pip install pyarrow")
+
+        src = Path(csv_path)
+        if parquet_path is None:
+            parquet_path = str(BPI2019Adapter._default_parquet_path(src))
+
+        with _open_csv_text(src, encoding) as f:
+            header = next(csv.reader(f))
+
+        table = pa_csv.read_csv(
+            src,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header}
+            ),
+        )
+        # Write beside the target and rename into place, so an interrupted
+        # write never leaves a partial snapshot that looks fresh
+        target = Path(parquet_path)
+        partial = target.with_name(f".{target.name}.{os.getpid()}.partial")
+        try:
+            pq.write_table(table, partial, compression='snappy', use_dictionary=True)
+            os.replace(partial, target)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Wrote {table.num_rows:,} rows to {parquet_path}")
+        return parquet_path
+
+    def _ingest_rows(
+        self,
+        rows: Iterable[Any],
+        result: BPI2019LoadResult,
+        max_rows: Optional[int] = None,
+        parse_row: Optional[Callable[[Any], BPI2019Event]] = None,
+        store: bool = True,
+        row_number: Optional[Callable[[int], int]] = None
+    ) -> None:
+        """
+        Parse raw rows into events and fill in load statistics.
+
+        Args:
+            rows: Raw rows, in the form parse_row expects
+            result: Load result to fill in
+            max_rows: Maximum rows to load (None for all)
+            parse_row: Row parser (defaults to _parse_csv_row for dict rows)
+            store: Keep the events; otherwise only statistics and metadata
+                   are collected, and the event and case counts cover
+                   this load alone
+            row_number: Maps a row's position to the number reported in
+                        parse warnings (see _iter_parsed)
+        """
+        parse_row = parse_row or self._parse_csv_row
+        events = self._iter_parsed(rows, parse_row, max_rows, result, row_number)
         documents = set()
         vendors = set()
+        case_ids = set()
+        stamps = set()
+        total = 0
+
+        # Statistics are reduced per chunk over whole columns (set.update and
+        # dict construction run in C) rather than with per-event set adds
+        while True:
+            chunk = list(islice(events, INGEST_CHUNK_SIZE))
+            if not chunk:
+                break
+            total += len(chunk)
+            if store:
+                self._events.extend(chunk)
+            columns = BPI2019Event._make(zip(*chunk))
+
+            # Cases and documents are indexed lazily
+            if not store:
+                case_ids.update(columns.case_id)
+
+            # Track statistics
+            result.activities.update(columns.activity)
+            stamps.update(columns.timestamp)
+
+            # Build document metadata from each document's first event
+            first_doc_events = _first_positions(columns.document_number)
+            documents.update(first_doc_events)
+            for doc_num, i in first_doc_events.items():
+                if doc_num and doc_num not in self._documents:
+                    event = chunk[i]
+                    self._documents[doc_num] = {
+                        'document_number': doc_num,
+                        'vendor': event.vendor,
+                        'vendor_name': event.vendor_name,
+                        'company': event.company,
+                        'document_type': event.document_type,
+                        'spend_area': event.spend_area,
+                    }
+
+            # Build vendor metadata
+            first_vendor_events = _first_positions(columns.vendor)
+            vendors.update(first_vendor_events)
+            for vendor, i in first_vendor_events.items():
+                if vendor and vendor not in self._vendors:
+                    self._vendors[vendor] = {
+                        'customer_id': vendor,  # Mapped to customer for O2C compat
+                        'name': chunk[i].vendor_name,
+                    }
+
+        self._invalidate_indexes()
+        if store:
+            result.total_events = len(self._events)
+            result.total_cases = len(self._cases)
+        else:
+            result.total_events = total
+            result.total_cases = len(case_ids)
+        result.unique_documents = len(documents)
+        result.unique_vendors = len(vendors - {''})
+        result.date_range = self._date_range(stamps, result)
+
+    @staticmethod
+    def _iter_parsed(
+        rows: Iterable[Any],
+        parse_row: Callable[[Any], BPI2019Event],
+        max_rows: Optional[int] = None,
+        result: Optional[BPI2019LoadResult] = None,
+        row_number: Optional[Callable[[int], int]] = None
+    ) -> Iterator[BPI2019Event]:
+        """
+        Parse raw rows into events, skipping rows that fail to parse.
 
-        with opener() as f:
-            # BPI 2019 CSV may have commas in quoted fields
-            reader = csv.DictReader(f)
-
-            for i, row in enumerate(reader):
-                if max_rows and i >= max_rows:
-                    break
-
-                try:
-                    event = self._parse_csv_row(row)
-                    self._events.append(event)
-
-                    # Track by case
-                    case_id = event['case_id']
-                    self._cases[case_id].append(event)
-
-                    # Track statistics
-                    result.activities.add(event['activity'])
-                    documents.add(event.get('document_number', ''))
-                    vendors.add(event.get('vendor', ''))
-
-                    # Track date range
-                    ts = event.get('timestamp')
-                    if ts:
-                        if min_date is None or ts < min_date:
-                            min_date = ts
-                        if max_date is None or ts > max_date:
-                            max_date = ts
-
-                    # Build document metadata
-                    doc_num = event.get('document_number')
-                    if doc_num and doc_num not in self._documents:
-                        self._documents[doc_num] = {
-                            'document_number': doc_num,
-                            'vendor': event.get('vendor'),
-                            'vendor_name': event.get('vendor_name'),
-                            'company': event.get('company'),
-                            'document_type': event.get('document_type'),
-                            'spend_area': event.get('spend_area'),
-                        }
-
-                    # Build vendor metadata
-                    vendor = event.get('vendor')
-                    if vendor and vendor not in self._vendors:
-                        self._vendors[vendor] = {
-                            'customer_id': vendor,  # Mapped to customer for O2C compat
-                            'name': event.get('vendor_name'),
-                        }
-
-                except Exception as e:
-                    result.warnings.append(f"Row {i}: {str(e)}")
+        Failures are recorded as warnings on result when one is given,
+        numbered by row_number(position) (CSV loads pass a _CsvRowNumbers,
+        so they match the skipped-row warnings) or else by position.
+        """
+        for i, row in enumerate(rows):
+            if max_rows and i >= max_rows:
+                break
+
+            try:
+                event = parse_row(row)
+            except Exception as e:
+                if result is not None:
+                    number = row_number(i) if row_number is not None else i
+                    result.warnings.append(f"Row {number}: {str(e)}")
                     if len(result.warnings) <= 5:
-                        logger.warning(f"Error parsing row {i}: {e}")
+                        logger.warning(f"Error parsing row {number}: {e}")
+                continue
+            yield event
 
-        result.total_events = len(self._events)
-        result.total_cases = len(self._cases)
-        result.unique_documents = len(documents)
-        result.unique_vendors = len(vendors - {''})
-        result.date_range = (
-            min_date.isoformat() if min_date else None,
-            max_date.isoformat() if max_date else None
-        )
+    @staticmethod
+    def _date_range(
+        stamps: Set[Optional[datetime]],
+        result: BPI2019LoadResult
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Earliest and latest event timestamps as ISO strings.
 
-        self._load_result = result
-        logger.info(f"BPI 2019 loaded successfully:\n{result}")
-        return result
+        Reduces over the distinct timestamp objects (parsed timestamps are
+        shared between events) with the C-level min/max builtins.
+        """
+        stamps = stamps - {None}
+        if not stamps:
+            return (None, None)
+        try:
+            return (min(stamps).isoformat(), max(stamps).isoformat())
+        except TypeError as e:
+            # Offset-aware and naive timestamps cannot be ordered together
+            result.warnings.append(f"Date range unavailable: {e}")
+            return (None, None)
+
+    def _row_parser(
+        self,
+        header: Sequence[str]
+    ) -> Callable[[Sequence[Optional[str]]], BPI2019Event]:
+        """
+        Build a parser for positional rows laid out as header.
 
-    def _parse_csv_row(self, row: Dict[str, str]) -> Dict[str, Any]:
+        Column positions for each event field are resolved once, in the
+        same alias order (including trailing-space variants) that
+        _parse_csv_row probes per row, so the result is identical.
+        Repeated text values are shared (see INTERNED_FIELDS).
+        """
+        # Duplicate header names resolve to the last column, as in DictReader
+        positions = {name: i for i, name in enumerate(header)}
+        fields = [
+            (name, tuple(
+                positions[col]
+                for key in keys
+                for col in (key, key + ' ')
+                if col in positions
+            ), self._canonicalizer(name))
+            for name, keys in ((name, COLUMN_ALIASES[name]) for name in BPI2019Event._fields)
+        ]
+        width = len(header)
+        parse_timestamp = self._parse_timestamp
+        make_event = BPI2019Event._make
+        ts_pos = BPI2019Event._fields.index('timestamp')
+        flag_pos = [BPI2019Event._fields.index(f) for f in ('gr_based_inv', 'goods_receipt')]
+
+        def parse(row: Sequence[Optional[str]]) -> BPI2019Event:
+            if len(row) < width:
+                row = list(row) + [None] * (width - len(row))
+            values = []
+            for name, indices, canonical in fields:
+                value = None
+                for i in indices:
+                    if row[i]:
+                        value = row[i].strip()
+                        if canonical is not None:
+                            value = canonical(value)
+                        break
+                values.append(value)
+            values[ts_pos] = parse_timestamp(values[ts_pos])
+            for pos in flag_pos:
+                values[pos] = values[pos] == 'True'
+            return make_event(values)
+
+        return parse
+
+    def _canonicalizer(self, field_name: str) -> Optional[Callable[[str], str]]:
+        """Return the function that shares equal values of a text field, if any."""
+        if field_name in INTERNED_FIELDS:
+            return sys.intern
+        if field_name in POOLED_FIELDS:
+            pool = self._string_pool
+            return lambda value: pool.setdefault(value, value)
+        return None
+
+    def _parse_csv_row(self, row: Dict[str, str]) -> BPI2019Event:
         """Parse a single CSV row into event format."""
         # Handle different possible column name formats
         # BPI 2019 CSV has columns like "case Vendor", "event concept:name", etc.
@@ -287,44 +1102,77 @@ class BPI2019Adapter:
                     return row[key + ' '].strip()
             return None
 
-        # Parse timestamp - BPI 2019 uses "event time:timestamp"
-        ts_str = get_val([
-            'event time:timestamp',
-            'time:timestamp',
-            'timestamp',
-        ])
-        timestamp = None
-        if ts_str:
+        # BPI 2019 specific column mappings
+        return BPI2019Event(
+            case_id=get_val(COLUMN_ALIASES['case_id']),
+            activity=get_val(COLUMN_ALIASES['activity']),
+            # BPI 2019 uses "event time:timestamp"
+            timestamp=self._parse_timestamp(get_val(COLUMN_ALIASES['timestamp'])),
+            document_number=get_val(COLUMN_ALIASES['document_number']),
+            item_number=get_val(COLUMN_ALIASES['item_number']),
+            vendor=get_val(COLUMN_ALIASES['vendor']),
+            vendor_name=get_val(COLUMN_ALIASES['vendor_name']),
+            company=get_val(COLUMN_ALIASES['company']),
+            document_type=get_val(COLUMN_ALIASES['document_type']),
+            item_category=get_val(COLUMN_ALIASES['item_category']),
+            spend_area=get_val(COLUMN_ALIASES['spend_area']),
+            spend_classification=get_val(COLUMN_ALIASES['spend_classification']),
+            resource=get_val(COLUMN_ALIASES['resource']),
+            gr_based_inv=get_val(COLUMN_ALIASES['gr_based_inv']) == 'True',
+            goods_receipt=get_val(COLUMN_ALIASES['goods_receipt']) == 'True',
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _parse_timestamp(ts_str: Optional[str]) -> Optional[datetime]:
+        """
+        Parse a BPI 2019 timestamp string, returning None if unparseable.
+
+        Results are cached: many events in the log share a timestamp.
+        """
+        if not ts_str:
+            return None
+
+        # Fast path: fixed-layout timestamps are built from their fields
+        match = _TIMESTAMP_RE.match(ts_str)
+        if match:
+            try:
+                return datetime(*map(int, match.groups()))
+            except ValueError:
+                return None
+
+        try:
+            # Handle various timestamp formats
+            ts_str = ts_str.replace('+00:00', 'Z').replace(' ', 'T')
+            if '.' in ts_str:
+                ts_str = ts_str.split('.')[0] + 'Z'
+            return datetime.fromisoformat(ts_str.rstrip('Z'))
+        except ValueError:
             try:
-                # Handle various timestamp formats
-                ts_str = ts_str.replace('+00:00', 'Z').replace(' ', 'T')
-                if '.' in ts_str:
-                    ts_str = ts_str.split('.')[0] + 'Z'
-                timestamp = datetime.fromisoformat(ts_str.rstrip('Z'))
-            except:
-                try:
-                    timestamp = datetime.strptime(ts_str[:19], '%Y-%m-%dT%H:%M:%S')
-                except:
-                    pass
+                return datetime.strptime(ts_str[:19], '%Y-%m-%dT%H:%M:%S')
+            except ValueError:
+                return None
 
-        # BPI 2019 specific column mappings
-        return {
-            'case_id': get_val(['case concept:name', 'case:concept:name', 'Case ID']),
-            'activity': get_val(['event concept:name', 'concept:name', 'Activity']),
-            'timestamp': timestamp,
-            'document_number': get_val(['case Purchasing Document', 'case:Purchasing Document']),
-            'item_number': get_val(['case Item', 'case:Item']),
-            'vendor': get_val(['case Vendor', 'case:Vendor']),
-            'vendor_name': get_val(['case Name', 'case:Name']),
-            'company': get_val(['case Company', 'case:Company']),
-            'document_type': get_val(['case Document Type', 'case:Document Type']),
-            'item_category': get_val(['case Item Category', 'case:Item Category']),
-            'spend_area': get_val(['case Spend area text', 'case:Spend area text']),
-            'spend_classification': get_val(['case Spend classification text']),
-            'resource': get_val(['event org:resource', 'org:resource', 'event User']),
-            'gr_based_inv': get_val(['case GR-Based Inv. Verif.']) == 'True',
-            'goods_receipt': get_val(['case Goods Receipt']) == 'True',
-        }
+    @staticmethod
+    def _frame_field(df: 'pd.DataFrame', keys: List[str]) -> 'pd.Series':
+        """
+        Column-wise equivalent of the get_val() lookup in _parse_csv_row.
+
+        Takes the first non-empty value among the alias columns (and their
+        trailing-space variants), stripped; rows with none are None.
+        """
+        # A list, not a scalar: pandas fills Series(None, dtype=object) with NaN
+        values = pd.Series([None] * len(df), index=df.index, dtype=object)
+        missing = pd.Series(True, index=df.index)
+        for key in keys:
+            for col in (key, key + ' '):
+                if col not in df.columns:
+                    continue
+                source = df[col]
+                take = missing & source.notna() & (source != '')
+                values[take] = source[take].map(lambda v: str(v).strip())
+                missing &= ~take
+        return values
 
     def load_from_pandas(self, df: 'pd.DataFrame') -> BPI2019LoadResult:
         """
@@ -341,12 +1189,27 @@ class BPI2019Adapter:
 
         result = BPI2019LoadResult()
 
-        for _, row in df.iterrows():
-            event = self._parse_csv_row(row.to_dict())
+        # Resolve every event field column-wise, then emit the events in
+        # one pass; timestamps are parsed once per distinct value rather
+        # than once per row
+        fields = {name: self._frame_field(df, keys) for name, keys in COLUMN_ALIASES.items()}
+        columns = {name: values.tolist() for name, values in fields.items()}
+        for name, values in columns.items():
+            canonical = self._canonicalizer(name)
+            if canonical is not None:
+                shared = {v: canonical(v) for v in set(values) if v is not None}
+                columns[name] = [shared.get(v) for v in values]
+        parsed = {ts: self._parse_timestamp(ts) for ts in fields['timestamp'].dropna().unique()}
+        columns['timestamp'] = [parsed.get(ts) for ts in columns['timestamp']]
+        for flag in ('gr_based_inv', 'goods_receipt'):
+            columns[flag] = (fields[flag] == 'True').tolist()
+        events = map(BPI2019Event._make, zip(*(columns[f] for f in BPI2019Event._fields)))
+
+        for event in events:
             self._events.append(event)
-            self._cases[event['case_id']].append(event)
-            result.activities.add(event['activity'])
+            result.activities.add(event.activity)
 
+        self._invalidate_indexes()
         result.total_events = len(self._events)
         result.total_cases = len(self._cases)
         result.unique_documents = len(self._documents)
@@ -371,6 +1234,7 @@ class BPI2019Adapter:
         Returns:
             Dictionary with sales_orders, customers, deliveries, invoices, doc_flow
         """
+        self._require_materialized()
         if not self._events:
             raise ValueError("No data loaded. Call load_from_csv() first.")
 
@@ -388,28 +1252,20 @@ class BPI2019Adapter:
         if sample_documents:
             doc_nums = doc_nums[:sample_documents]
 
-        processed_docs = set()
-        delivery_map = {}  # Track which GRs we've created
-        invoice_map = {}   # Track which invoices we've created
+        events_by_doc = self._events_by_doc
 
+        # Document numbers are dictionary keys, so each is visited once
         for doc_num in doc_nums:
-            if doc_num in processed_docs:
-                continue
-            processed_docs.add(doc_num)
-
             doc_info = self._documents.get(doc_num, {})
 
-            # Find all events for this document
-            doc_events = [
-                e for e in self._events
-                if e.get('document_number') == doc_num
-            ]
+            # Events for this document, in time order
+            doc_events = events_by_doc.get(doc_num, [])
 
             if not doc_events:
                 continue
 
-            # Sort by timestamp
-            doc_events.sort(key=lambda x: x['timestamp'] or datetime.min)
+            if not events_by_doc.time_ordered:
+                doc_events.sort(key=lambda x: x.timestamp or datetime.min)
 
             # Extract key dates from events
             created_date = None
@@ -417,24 +1273,27 @@ class BPI2019Adapter:
             invoice_date = None
 
             for event in doc_events:
-                activity = event['activity']
-                ts = event['timestamp']
+                ts = event.timestamp
 
                 if not ts:
                     continue
 
+                kind = ACTIVITY_KIND[event.activity]
+                if not kind:
+                    continue
+
                 # Find creation date
-                if 'Create' in activity or 'Record Purchase Order' in activity:
+                if kind & KIND_CREATE:
                     if created_date is None or ts < created_date:
                         created_date = ts
 
                 # Find goods receipt date
-                if 'Goods Receipt' in activity or 'Receive Goods' in activity:
+                if kind & KIND_GOODS_RECEIPT:
                     if gr_date is None:
                         gr_date = ts
 
                 # Find invoice date
-                if 'Invoice' in activity:
+                if kind & KIND_INVOICE:
                     if invoice_date is None:
                         invoice_date = ts
 
@@ -452,18 +1311,19 @@ class BPI2019Adapter:
             items = []
             seen_items = set()
             for event in doc_events:
-                item_num = event.get('item_number')
+                item_num = event.item_number
                 if item_num and item_num not in seen_items:
                     seen_items.add(item_num)
                     items.append({
                         'item_number': item_num,
-                        'item_category': event.get('item_category', ''),
+                        'item_category': event.item_category,
                     })
             order['items'] = items
 
             result['sales_orders'].append(order)
 
             # Create delivery (goods receipt)
+            delivery_num = None
             if gr_date:
                 delivery_num = f"GR{doc_num}"
                 result['deliveries'].append({
@@ -472,7 +1332,6 @@ class BPI2019Adapter:
                     'actual_gi_date': gr_date.isoformat(),
                     'customer': doc_info.get('vendor', ''),
                 })
-                delivery_map[doc_num] = delivery_num
 
                 # Doc flow: PO → GR
                 result['doc_flow'].append({
@@ -490,12 +1349,11 @@ class BPI2019Adapter:
                     'billing_date': invoice_date.isoformat(),
                     'customer': doc_info.get('vendor', ''),
                 })
-                invoice_map[doc_num] = invoice_num
 
                 # Doc flow: GR → Invoice (if GR exists) or PO → Invoice
-                if doc_num in delivery_map:
+                if delivery_num:
                     result['doc_flow'].append({
-                        'preceding_doc': delivery_map[doc_num],
+                        'preceding_doc': delivery_num,
                         'subsequent_doc': invoice_num,
                         'preceding_category': 'R',
                         'subsequent_category': 'P',  # Invoice
@@ -525,37 +1383,224 @@ class BPI2019Adapter:
 
         return result
 
+    def to_workflow_columns(
+        self,
+        sample_documents: Optional[int] = None
+    ) -> Dict[str, 'pd.DataFrame']:
+        """
+        Convert BPI 2019 events to workflow tables as DataFrames.
+
+        Column-oriented counterpart of to_workflow_format(): the same tables,
+        built with pandas group operations instead of per-document loops
+        and without materializing row dictionaries. Line items are returned
+        as a separate 'sales_order_items' table keyed by document_number.
+
+        Args:
+            sample_documents: Limit number of documents
+
+        Returns:
+            Dictionary mapping table names (sales_orders, sales_order_items,
+            deliveries, invoices, customers, doc_flow, materials) to DataFrames
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError("Pandas required. Install with: pip install pandas")
+        self._require_materialized()
+        if not self._events:
+            raise ValueError("No data loaded. Call load_from_csv() first.")
+
+        doc_nums = list(self._documents.keys())
+        if sample_documents:
+            doc_nums = doc_nums[:sample_documents]
+
+        docs = pd.DataFrame.from_records(
+            [self._documents[d] for d in doc_nums],
+            columns=['document_number', 'vendor', 'company', 'document_type', 'spend_area'],
+        )
+        doc_pos = pd.Series(range(len(doc_nums)), index=doc_nums)
+
+        events = self._events_frame()[
+            ['document_number', 'activity', 'timestamp', 'item_number', 'item_category']
+        ]
+        events = events[events['document_number'].isin(doc_pos.index)]
+        ts = pd.to_datetime(events['timestamp'])
+        activity = events['activity'].fillna('')
+        kinds = activity.map({a: ACTIVITY_KIND[a] for a in activity.unique()})
+
+        def first_date(mask: 'pd.Series') -> 'pd.Series':
+            """Earliest timestamp per document among matching events, as ISO text."""
+            mask = mask & ts.notna()
+            first = ts[mask].groupby(events.loc[mask, 'document_number']).min()
+            # reindex rather than map: mapping through an empty datetime
+            # Series (no event of this kind) fails to cast to float64
+            dates = pd.Series(
+                first.reindex(docs['document_number']).array, index=docs.index
+            )
+            return dates.map(lambda t: t.isoformat() if pd.notna(t) else None)
+
+        created = first_date((kinds & KIND_CREATE) != 0)
+        gr_date = first_date((kinds & KIND_GOODS_RECEIPT) != 0)
+        invoice_date = first_date((kinds & KIND_INVOICE) != 0)
+
+        sales_orders = pd.DataFrame({
+            'document_number': docs['document_number'],
+            'created_date': created,
+            'order_type': docs['document_type'],
+            'customer': docs['vendor'],  # Vendor mapped to customer
+            'sales_org': docs['company'],
+            'texts': docs['spend_area'],
+        })
+
+        # Distinct items per document, in event-time order
+        items = events.assign(
+            _pos=events['document_number'].map(doc_pos),
+            _ts=ts.fillna(pd.Timestamp.min),
+        ).sort_values(['_pos', '_ts'], kind='mergesort')
+        items = items[items['item_number'].fillna('') != '']
+        items = items.drop_duplicates(['document_number', 'item_number'])
+        sales_order_items = items[
+            ['document_number', 'item_number', 'item_category']
+        ].reset_index(drop=True)
+
+        # Goods receipts -> deliveries, invoice receipts -> invoices
+        has_gr = gr_date.notna()
+        has_inv = invoice_date.notna()
+        delivery_num = 'GR' + docs['document_number']
+        invoice_num = 'IR' + docs['document_number']
+
+        deliveries = pd.DataFrame({
+            'document_number': delivery_num[has_gr],
+            'created_date': gr_date[has_gr],
+            'actual_gi_date': gr_date[has_gr],
+            'customer': docs.loc[has_gr, 'vendor'],
+        }).reset_index(drop=True)
+        invoices = pd.DataFrame({
+            'document_number': invoice_num[has_inv],
+            'billing_date': invoice_date[has_inv],
+            'customer': docs.loc[has_inv, 'vendor'],
+        }).reset_index(drop=True)
+
+        # Doc flow: PO -> GR, then GR -> Invoice (or PO -> Invoice without GR)
+        inv_after_gr = has_inv & has_gr
+        positions = pd.Series(range(len(docs)), index=docs.index)
+        doc_flow = pd.concat([
+            pd.DataFrame({
+                'preceding_doc': docs.loc[has_gr, 'document_number'],
+                'subsequent_doc': delivery_num[has_gr],
+                'preceding_category': 'F',  # PO
+                'subsequent_category': 'R',  # GR (custom)
+                '_order': positions[has_gr] * 2,
+            }),
+            pd.DataFrame({
+                'preceding_doc': delivery_num.where(inv_after_gr, docs['document_number'])[has_inv],
+                'subsequent_doc': invoice_num[has_inv],
+                'preceding_category': pd.Series('R', index=docs.index).where(inv_after_gr, 'F')[has_inv],
+                'subsequent_category': 'P',  # Invoice
+                '_order': positions[has_inv] * 2 + 1,
+            }),
+        ]).sort_values('_order', kind='mergesort').drop(columns='_order').reset_index(drop=True)
+
+        customers = pd.DataFrame.from_records(
+            [{'customer_id': vendor_id, 'name': info.get('name', '')}
+             for vendor_id, info in self._vendors.items()],
+            columns=['customer_id', 'name'],
+        )
+
+        tables = {
+            'sales_orders': sales_orders.reset_index(drop=True),
+            'sales_order_items': sales_order_items,
+            'deliveries': deliveries,
+            'invoices': invoices,
+            'customers': customers,
+            'doc_flow': doc_flow,
+            'materials': pd.DataFrame(columns=['material_id']),
+        }
+
+        logger.info(
+            f"Converted to workflow columns: "
+            f"{len(sales_orders)} orders, "
+            f"{len(deliveries)} deliveries, "
+            f"{len(invoices)} invoices, "
+            f"{len(customers)} customers"
+        )
+
+        return tables
+
     def to_event_log(
         self,
-        map_activities: bool = True
-    ) -> List[Dict[str, Any]]:
+        map_activities: bool = True,
+        as_dataframe: bool = False
+    ) -> Union[List[Dict[str, Any]], 'pd.DataFrame']:
         """
         Get events in simple event log format.
 
         Args:
             map_activities: Map P2P activities to O2C equivalents
+            as_dataframe: Return a pandas DataFrame (one row per event)
+                instead of a list of dictionaries
 
         Returns:
-            List of event dictionaries
+            List of event dictionaries, or a DataFrame if as_dataframe is set
         """
-        events = []
-        for event in self._events:
-            activity = event['activity']
-            if map_activities and activity in ACTIVITY_MAPPING:
-                activity = ACTIVITY_MAPPING[activity]
+        if as_dataframe:
+            return self._event_log_frame(map_activities)
 
+        # One lookup per event (activities are interned, so their hashes are
+        # cached); unmapped activities pass through unchanged
+        mapping = ACTIVITY_MAPPING if map_activities else {}
+        replaced = frozenset({'case_id', 'activity', 'timestamp', 'resource'})
+
+        events = []
+        for event in self.iter_events():
+            activity = event.activity
             events.append({
-                'case_id': event['document_number'],  # Use document as case
-                'activity': activity,
-                'timestamp': event['timestamp'].isoformat() if event['timestamp'] else None,
-                'resource': event['resource'],
-                'item': event['item_number'],
-                **{k: v for k, v in event.items()
-                   if k not in ['case_id', 'activity', 'timestamp', 'resource']}
+                'case_id': event.document_number,  # Use document as case
+                'activity': mapping.get(activity, activity),
+                'timestamp': event.timestamp.isoformat() if event.timestamp else None,
+                'resource': event.resource,
+                'item': event.item_number,
+                **{k: v for k, v in zip(event._fields, event) if k not in replaced}
             })
 
         return events
 
+    def _events_frame(self) -> 'pd.DataFrame':
+        """Loaded events as a DataFrame with one column per event field."""
+        return pd.DataFrame.from_records(self.iter_events(), columns=BPI2019Event._fields)
+
+    def _event_log_frame(self, map_activities: bool) -> 'pd.DataFrame':
+        """Columnar equivalent of to_event_log() built with pandas ops."""
+        if not PANDAS_AVAILABLE:
+            raise ImportError("Pandas required. Install with: pip install pandas")
+
+        raw = self._events_frame()
+        if raw.empty:
+            return pd.DataFrame(columns=['case_id', 'activity', 'timestamp', 'resource', 'item'])
+
+        activity = raw['activity']
+        if map_activities:
+            # Map each distinct activity once, then expand by integer code
+            codes, uniques = pd.factorize(activity)
+            mapped = np.array(
+                [ACTIVITY_MAPPING.get(a, a) for a in uniques] + [None], dtype=object
+            )
+            activity = pd.Series(mapped[codes], index=activity.index, name='activity')
+
+        # Object dtype keeps missing timestamps as None (a str column would
+        # turn them into NaN), matching the list path
+        timestamps = pd.Series(
+            [ts.isoformat() if pd.notna(ts) else None for ts in raw['timestamp']],
+            index=raw.index, dtype=object,
+        )
+        df = pd.DataFrame({
+            'case_id': raw['document_number'],  # Use document as case
+            'activity': activity,
+            'timestamp': timestamps,
+            'resource': raw['resource'],
+            'item': raw['item_number'],
+        })
+        extra = raw.drop(columns=['case_id', 'activity', 'timestamp', 'resource'])
+        return pd.concat([df, extra.drop(columns=[c for c in extra.columns if c in df])], axis=1)
+
     def save_to_json(
         self,
         output_dir: str,
@@ -579,8 +1624,14 @@ class BPI2019Adapter:
         for table_name, records in data.items():
             if records:
                 file_path = output_path / f"{table_name}.json"
-                with open(file_path, 'w') as f:
-                    json.dump(records, f, indent=2, default=str)
+                if ORJSON_AVAILABLE:
+                    # Native encoder, written as one bytes buffer
+                    file_path.write_bytes(
+                        orjson.dumps(records, default=str, option=orjson.OPT_INDENT_2)
+                    )
+                else:
+                    with open(file_path, 'w') as f:
+                        json.dump(records, f, indent=2, default=str)
                 saved_files[table_name] = str(file_path)
                 logger.info(f"Saved {len(records)} records to {file_path}")
 
@@ -599,26 +1650,24 @@ class BPI2019Adapter:
         Returns:
             List of (variant_string, count) tuples
         """
-        variant_counts = defaultdict(int)
+        self._require_materialized()
 
-        for case_id, events in self._cases.items():
-            # Sort events by timestamp
-            sorted_events = sorted(
-                events,
-                key=lambda x: x['timestamp'] or datetime.min
+        # Count activity tuples; only the returned variants are joined into
+        # strings. The case index already lists events in time order.
+        cases = self._cases
+        if cases.time_ordered:
+            sequences = cases.values()
+        else:
+            sequences = (
+                sorted(events, key=lambda x: x.timestamp or datetime.min)
+                for events in cases.values()
             )
-            # Create variant string
-            variant = ' → '.join(e['activity'] for e in sorted_events)
-            variant_counts[variant] += 1
-
-        # Sort by count
-        sorted_variants = sorted(
-            variant_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        variant_counts = Counter(tuple(e.activity for e in events) for events in sequences)
+
+        # Top variants by count, without sorting the whole tail
+        top_variants = nlargest(top_n, variant_counts.items(), key=itemgetter(1))
 
-        return sorted_variants[:top_n]
+        return [(' → '.join(variant), count) for variant, count in top_variants]
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about loaded data."""
@@ -639,6 +1688,48 @@ class BPI2019Adapter:
         return stats
 
 
+def _parse_csv_range(
+    path: str,
+    encoding: str,
+    header: List[str],
+    start: int,
+    end: int
+) -> List[Union[BPI2019Event, str, _InvalidRow]]:
+    """
+    Parse the CSV rows of an uncompressed export that begin in [start, end).
+
+    Runs in a worker process of BPI2019Adapter.load_from_csv. Blank lines
+    are dropped; rows that fail to parse are returned as error messages and
+    rows with the wrong number of fields as _InvalidRow in their place, so
+    the caller can number them.
+    """
+    parse = BPI2019Adapter()._row_parser(header)
+    with open(path, 'rb') as f:
+        # Skip to the first line that begins at or after start (the byte
+        # before start is the header's newline for the first range)
+        f.seek(start - 1)
+        f.readline()
+        lines = []
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line.decode(encoding))
+
+    parsed: List[Union[BPI2019Event, str, _InvalidRow]] = []
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        if len(row) != len(header):
+            parsed.append(_InvalidRow(len(header), len(row)))
+            continue
+        try:
+            parsed.append(parse(row))
+        except Exception as e:
+            parsed.append(str(e))
+    return parsed
+
+
 def load_bpi2019_dataset(
     file_path: str,
     sample_documents: Optional[int] = None,
@@ -648,7 +1739,7 @@ def load_bpi2019_dataset(
     Convenience function to load BPI 2019 dataset.
 
     Args:
-        file_path: Path to BPI 2019 CSV file
+        file_path: Path to BPI 2019 CSV file, or a Parquet snapshot
         sample_documents: Limit number of documents
         output_dir: If provided, save to JSON files
 
@@ -656,7 +1747,10 @@ def load_bpi2019_dataset(
         Workflow mining format data
     """
     adapter = BPI2019Adapter()
-    adapter.load_from_csv(file_path)
+    if Path(file_path).suffix == '.parquet':
+        adapter.load_from_parquet(file_path)
+    else:
+        adapter.load_from_csv(file_path)
 
     if output_dir:
         adapter.save_to_json(output_dir, sample_documents=sample_documents)
@@ -18,14 +18,32 @@ Usage:
     )
 """
 
+import codecs
 import csv
 import hashlib
 import logging
-import random
+import os
+import re
+import sys
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Optional: PyArrow for the multithreaded C++ CSV reader
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +255,118 @@ VBFA_FIELD_MAP = {
     'Created Date': 'erdat',
 }
 
+# Bytes of CSV text parsed per record batch when streaming with PyArrow
+CSV_BLOCK_SIZE = 8 << 20
+
+# Read buffer for full passes over a CSV file in Python, so large exports
+# are pulled in with far fewer read calls than the default 8 KB buffer
+CSV_READ_BUFFER = 1 << 20
+
+# Leading bytes used to rule out encodings before a full decode check
+ENCODING_SAMPLE_SIZE = 1 << 16
+
+# Delimiters recognized in the first DELIMITER_SAMPLE_SIZE characters
+DELIMITERS = (',', ';', '\t', '|')
+DELIMITER_SAMPLE_SIZE = 4096
+
+
+# Date formats tried in order on the first 10 characters of a date value
+DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%Y%m%d',
+    '%d.%m.%Y',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%Y-%m-%dT%H:%M:%S',
+]
+
+# Shapes used to guess a date column's format from a sample. Only the
+# slash formats can match the same value, and a slash shape maps to the
+# earlier of the two, so trying the guess first never changes a result.
+DATE_FORMAT_SHAPES = [
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}$'), '%Y-%m-%d'),
+    (re.compile(r'\d{8}$'), '%Y%m%d'),
+    (re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}$'), '%d.%m.%Y'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}$'), '%m/%d/%Y'),
+]
+DATE_FORMAT_SAMPLE_SIZE = 50
+
+
+# Cell values and dates repeat heavily across SAP exports (order types,
+# currencies, plants, creation dates), so their conversions are memoized.
+# Both caches are keyed on strings only and hold immutable results.
+
+def _clean_string_cell(value: Optional[str]) -> str:
+    """Strip and intern a string-field cell, mapping missing cells to ''."""
+    return sys.intern(value.strip()) if value else ''
+
+
+def _clean_category_cell(value: Optional[str]) -> str:
+    """Strip, upper-case and intern a document category cell."""
+    return sys.intern(value.strip().upper()) if value else ''
+
+
+@lru_cache(maxsize=65536)
+def _clean_str(value: str) -> Any:
+    """Clean and convert a string cell value (see CSVLoader._clean_value)."""
+    value = value.strip()
+
+    if value == '' or value.upper() in ('NULL', 'NA', 'N/A', '#N/A'):
+        return None
+
+    # Try numeric conversion
+    try:
+        # Check for integer
+        if value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
+            return int(value)
+
+        # Check for float (handle European format with comma decimal)
+        if ',' in value and '.' not in value:
+            value = value.replace(',', '.')
+
+        float_val = float(value.replace(',', ''))
+        return float_val
+    except (ValueError, AttributeError):
+        pass
+
+    return value
+
+
+@lru_cache(maxsize=65536)
+def _to_number(value: Optional[str]) -> Any:
+    """
+    Convert a numeric-field cell, trying plain integers and decimals first.
+
+    Anything else (thousands separators, European decimals, null markers,
+    non-numeric text) falls back to _clean_str, so results are identical.
+    """
+    if value is None:
+        return None
+
+    stripped = value.strip()
+    if stripped.isdecimal() or (stripped[:1] == '-' and stripped[1:].isdecimal()):
+        return int(stripped)
+
+    if ',' not in stripped:
+        try:
+            return float(stripped)
+        except ValueError:
+            pass
+
+    return _clean_str(value)
+
+
+@lru_cache(maxsize=65536)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """Parse a stripped, non-empty date string (see CSVLoader._parse_date)."""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str[:len('YYYY-MM-DD')], fmt)
+        except (ValueError, IndexError):
+            continue
+
+    return None
+
 
 @dataclass
 class CSVValidationResult:
@@ -260,6 +390,125 @@ class CSVLoadResult:
     validation: Dict[str, CSVValidationResult] = field(default_factory=dict)
     stats: Dict[str, int] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
+    # Documents not yet built, for loads made with streaming=True
+    _pending: Optional[Iterator[Any]] = field(default=None, repr=False, compare=False)
+
+    def documents_iter(self) -> Iterator[Any]:
+        """
+        Iterate over the loaded documents.
+
+        Documents of a streaming load are built as they are consumed and are
+        not kept, so they can be iterated only once unless materialize() is
+        called first.
+
+        Yields:
+            Documents in VBAK order
+        """
+        yield from self.documents
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            yield from pending
+
+    def materialize(self) -> List[Any]:
+        """
+        Build any pending streamed documents into the documents list.
+
+        Returns:
+            The documents list
+        """
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self.documents.extend(pending)
+        return self.documents
+
+
+class UnifiedOrder(NamedTuple):
+    """
+    Sales order header of a unified document, in compact form.
+
+    Values the dict form repeats under SAP and English names (vbeln and
+    document_number, kunnr and customer, erdat and created_date, vdatu
+    and requested_delivery_date) are stored once, and items are the VBAP
+    records themselves; to_dict() expands both.
+    """
+    document_number: str
+    auart: Any
+    vkorg: Any
+    vtweg: Any
+    spart: Any
+    kunnr: Any
+    created_date: Optional[str]
+    requested_delivery_date: Optional[str]
+    netwr: Any
+    waerk: Any
+    items: List[Dict[str, Any]]
+    header_texts: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Expand to the order dict of the unified document format."""
+        return {
+            'document_number': self.document_number,
+            'vbeln': self.document_number,
+            'auart': self.auart,
+            'vkorg': self.vkorg,
+            'vtweg': self.vtweg,
+            'spart': self.spart,
+            'kunnr': self.kunnr,
+            'customer': self.kunnr,
+            'created_date': self.created_date,
+            'erdat': self.created_date,
+            'requested_delivery_date': self.requested_delivery_date,
+            'vdatu': self.requested_delivery_date,
+            'netwr': self.netwr,
+            'waerk': self.waerk,
+            'items': CSVLoader._format_items(self.items),
+            'header_texts': [{'text': t} for t in self.header_texts],
+        }
+
+
+class UnifiedDocument(NamedTuple):
+    """
+    Unified document record in compact form.
+
+    Holds each value once in a tuple instead of a tree of dicts; the
+    customer, dates, sales_org and count entries of the dict form are
+    derived from the order and flow lists by to_dict().
+    """
+    doc_key: str
+    consolidated_text: str
+    order: UnifiedOrder
+    deliveries: List[Dict[str, Any]]
+    invoices: List[Dict[str, Any]]
+    actual_delivery_date: Optional[str]
+    invoice_date: Optional[str]
+    timing: Dict[str, Optional[int]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Expand to the unified document dict expected by the pattern engine."""
+        order = self.order
+        return {
+            'doc_key': self.doc_key,
+            'consolidated_text': self.consolidated_text,
+            'order': order.to_dict(),
+            'deliveries': self.deliveries,
+            'invoices': self.invoices,
+            'customer': {
+                'customer_id': order.kunnr,
+                'kunnr': order.kunnr,
+            },
+            'dates': {
+                'order_date': order.created_date,
+                'requested_delivery_date': order.requested_delivery_date,
+                'actual_delivery_date': self.actual_delivery_date,
+                'invoice_date': self.invoice_date,
+            },
+            'timing': self.timing,
+            'sales_org': order.vkorg,
+            'customer_industry': '',
+            'source_files': ['csv_import'],
+            'n_deliveries': len(self.deliveries),
+            'n_invoices': len(self.invoices),
+        }
 
 
 class CSVLoader:
@@ -309,6 +558,17 @@ class CSVLoader:
         ],
     }
 
+    # Uniform draws per order for synthetic text: high-value pattern,
+    # credit-check pattern, and the hash-rolled rush/handling/backorder one
+    SYNTHETIC_TEXT_DRAWS = 3
+
+    # Extra pattern kind for each order hash bucket (hash % 10): 20% rush,
+    # 20% special handling, 10% backorder, 50% none
+    HASH_BUCKET_PATTERNS = (
+        'rush', 'rush', 'special_handling', 'special_handling', 'backorder',
+        None, None, None, None, None,
+    )
+
     # Order type to description mapping
     ORDER_TYPE_DESC = {
         'OR': 'Standard Order',
@@ -333,7 +593,18 @@ class CSVLoader:
         self.delimiter = delimiter
         self.encoding = encoding
         self.random_seed = random_seed
-        self._rng = random.Random(random_seed)
+        self._rng = np.random.default_rng(random_seed)
+        # Detected (encoding, delimiter) per (path, size, mtime)
+        self._formats: Dict[Tuple[str, int, int], Tuple[str, str]] = {}
+        # Patterns as tuples so a draw indexes them directly
+        self._text_patterns = {
+            kind: tuple(patterns) for kind, patterns in self.TEXT_PATTERNS.items()
+        }
+        # Patterns for each order hash bucket, looked up instead of branching
+        self._hash_bucket_patterns = tuple(
+            self._text_patterns[kind] if kind else ()
+            for kind in self.HASH_BUCKET_PATTERNS
+        )
 
     def load_from_csv(
         self,
@@ -341,6 +612,9 @@ class CSVLoader:
         vbap_csv: Union[str, Path],
         text_csv: Optional[Union[str, Path]] = None,
         vbfa_csv: Optional[Union[str, Path]] = None,
+        as_dicts: bool = True,
+        workers: int = 1,
+        streaming: bool = False,
     ) -> CSVLoadResult:
         """
         Load SAP data from CSV exports and convert to unified format.
@@ -350,6 +624,14 @@ class CSVLoader:
             vbap_csv: Path to VBAP (sales order item) CSV
             text_csv: Optional path to text CSV (STXH/STXL combined)
             vbfa_csv: Optional path to VBFA (document flow) CSV
+            as_dicts: Return documents as unified document dicts; if False
+                      they are compact UnifiedDocument tuples (see to_dict())
+            workers: Threads used to read the CSV files concurrently; PyArrow
+                     releases the GIL while parsing, so files overlap well
+            streaming: Build documents lazily as result.documents_iter() is
+                       consumed, leaving result.documents empty until
+                       result.materialize() is called. Peak memory then
+                       no longer grows with the number of documents.
 
         Returns:
             CSVLoadResult with loaded documents and validation info
@@ -368,44 +650,44 @@ class CSVLoader:
             result.errors.append(f"VBAP file not found: {vbap_path}")
             return result
 
-        # Load and validate VBAK
-        logger.info(f"Loading VBAK from {vbak_path}")
-        vbak_validation = self._validate_csv(vbak_path, VBAK_FIELD_MAP, 'vbeln')
+        # Validate headers first so that a bad required file fails fast,
+        # before any file is parsed
+        vbak_validation = self._validate_csv(
+            vbak_path, VBAK_FIELD_MAP, 'vbeln', count_rows=False
+        )
         result.validation['vbak'] = vbak_validation
 
         if not vbak_validation.valid:
             result.errors.append(f"VBAK validation failed: {vbak_validation.errors}")
             return result
 
-        vbak_records = self._load_csv(vbak_path, VBAK_FIELD_MAP)
-        logger.info(f"Loaded {len(vbak_records)} VBAK records")
-        result.stats['vbak_records'] = len(vbak_records)
-
-        # Load and validate VBAP
-        logger.info(f"Loading VBAP from {vbap_path}")
-        vbap_validation = self._validate_csv(vbap_path, VBAP_FIELD_MAP, 'vbeln')
+        vbap_validation = self._validate_csv(
+            vbap_path, VBAP_FIELD_MAP, 'vbeln', count_rows=False
+        )
         result.validation['vbap'] = vbap_validation
 
         if not vbap_validation.valid:
             result.errors.append(f"VBAP validation failed: {vbap_validation.errors}")
             return result
 
-        vbap_records = self._load_csv(vbap_path, VBAP_FIELD_MAP)
-        logger.info(f"Loaded {len(vbap_records)} VBAP records")
-        result.stats['vbap_records'] = len(vbap_records)
+        # Items are grouped by order batch by batch, so the full VBAP
+        # record list is never held alongside the grouped index
+        loads = {
+            'vbak': (self._load_csv, vbak_path, VBAK_FIELD_MAP),
+            'vbap': (self._load_csv_grouped, vbap_path, VBAP_FIELD_MAP, 'vbeln'),
+        }
 
-        # Load optional text file
-        text_records = []
+        # Validate optional text file
         if text_csv:
             text_path = Path(text_csv)
             if text_path.exists():
-                logger.info(f"Loading texts from {text_path}")
-                text_validation = self._validate_csv(text_path, TEXT_FIELD_MAP, 'tdname')
+                text_validation = self._validate_csv(
+                    text_path, TEXT_FIELD_MAP, 'tdname', count_rows=False
+                )
                 result.validation['text'] = text_validation
 
                 if text_validation.valid:
-                    text_records = self._load_csv(text_path, TEXT_FIELD_MAP)
-                    logger.info(f"Loaded {len(text_records)} text records")
+                    loads['text'] = (self._load_csv, text_path, TEXT_FIELD_MAP)
                 else:
                     result.validation['text'].warnings.append(
                         f"Text file validation failed, will generate synthetic texts"
@@ -415,48 +697,108 @@ class CSVLoader:
         else:
             logger.info("No text file provided, will generate synthetic texts")
 
-        result.stats['text_records'] = len(text_records)
-
-        # Load optional document flow
-        vbfa_records = []
+        # Validate optional document flow
         if vbfa_csv:
             vbfa_path = Path(vbfa_csv)
             if vbfa_path.exists():
-                logger.info(f"Loading VBFA from {vbfa_path}")
-                vbfa_validation = self._validate_csv(vbfa_path, VBFA_FIELD_MAP, 'vbelv')
+                vbfa_validation = self._validate_csv(
+                    vbfa_path, VBFA_FIELD_MAP, 'vbelv', count_rows=False
+                )
                 result.validation['vbfa'] = vbfa_validation
 
                 if vbfa_validation.valid:
-                    vbfa_records = self._load_csv(vbfa_path, VBFA_FIELD_MAP)
-                    logger.info(f"Loaded {len(vbfa_records)} VBFA records")
+                    loads['vbfa'] = (self._load_csv, vbfa_path, VBFA_FIELD_MAP)
                 else:
                     logger.warning("VBFA validation failed, skipping document flow")
             else:
                 logger.warning(f"VBFA file not found: {vbfa_path}")
 
+        loaded = self._run_loads(loads, workers)
+
+        vbak_records = loaded['vbak']
+        vbak_validation.row_count = len(vbak_records)
+        logger.info(f"Loaded {len(vbak_records)} VBAK records")
+        result.stats['vbak_records'] = len(vbak_records)
+
+        items_by_order, vbap_count = loaded['vbap']
+        vbap_validation.row_count = vbap_count
+        logger.info(f"Loaded {vbap_count} VBAP records")
+        result.stats['vbap_records'] = vbap_count
+
+        text_records = loaded.get('text', [])
+        if 'text' in loaded:
+            result.validation['text'].row_count = len(text_records)
+            logger.info(f"Loaded {len(text_records)} text records")
+        result.stats['text_records'] = len(text_records)
+
+        vbfa_records = loaded.get('vbfa', [])
+        if 'vbfa' in loaded:
+            result.validation['vbfa'].row_count = len(vbfa_records)
+            logger.info(f"Loaded {len(vbfa_records)} VBFA records")
         result.stats['vbfa_records'] = len(vbfa_records)
 
         # Convert to unified document format
         logger.info("Converting CSV records to unified document format...")
         documents = self._convert_to_documents(
             vbak_records=vbak_records,
-            vbap_records=vbap_records,
+            vbap_records=[],
             text_records=text_records,
             vbfa_records=vbfa_records,
+            items_by_order=items_by_order,
+            lazy=streaming,
         )
 
-        result.documents = documents
-        result.stats['documents'] = len(documents)
+        if as_dicts:
+            documents = map(UnifiedDocument.to_dict, documents)
+
+        if streaming:
+            result._pending = iter(documents)
+            result.stats['documents'] = sum(
+                1 for vbak in vbak_records if str(vbak.get('vbeln', '')).strip()
+            )
+        else:
+            result.documents = list(documents)
+            result.stats['documents'] = len(result.documents)
         result.success = True
 
-        logger.info(f"Created {len(documents)} unified documents")
+        logger.info(f"Created {result.stats['documents']} unified documents")
         return result
 
+    def _run_loads(
+        self,
+        loads: Dict[str, Tuple],
+        workers: int
+    ) -> Dict[str, Any]:
+        """
+        Run independent file loads, in a thread pool if workers > 1.
+
+        Args:
+            loads: Name -> (load function, *args)
+            workers: Maximum number of concurrent loads
+
+        Returns:
+            Name -> load result
+        """
+        for name, (_, path, *_) in loads.items():
+            logger.info(f"Loading {name.upper()} from {path}")
+
+        if workers <= 1 or len(loads) == 1:
+            return {name: func(*args) for name, (func, *args) in loads.items()}
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(loads)), thread_name_prefix="csv-load"
+        ) as pool:
+            futures = {
+                name: pool.submit(func, *args) for name, (func, *args) in loads.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def _validate_csv(
         self,
         file_path: Path,
         field_map: Dict[str, str],
-        required_key: str
+        required_key: str,
+        count_rows: bool = True
     ) -> CSVValidationResult:
         """
         Validate a CSV file structure and column mappings.
@@ -465,6 +807,9 @@ class CSVLoader:
             file_path: Path to CSV file
             field_map: Field name mappings
             required_key: Required key field name (normalized)
+            count_rows: Count all rows, which rescans the whole file. When
+                        False only the first 100 rows are counted, for
+                        callers that set row_count from their own load.
 
         Returns:
             CSVValidationResult with validation details
@@ -472,75 +817,60 @@ class CSVLoader:
         result = CSVValidationResult(valid=True, file_path=str(file_path))
 
         try:
-            # Try different encodings
-            for encoding in [self.encoding, 'utf-8-sig', 'latin-1', 'cp1252']:
-                try:
-                    with open(file_path, 'r', encoding=encoding, newline='') as f:
-                        # Try to detect delimiter
-                        sample = f.read(4096)
+            encoding, delimiter = self._csv_format(file_path)
+            with open(file_path, 'r', encoding=encoding, newline='',
+                      buffering=CSV_READ_BUFFER) as f:
+                reader = csv.DictReader(f, delimiter=delimiter)
+                headers = reader.fieldnames or []
+
+                if not headers:
+                    result.errors.append("No headers found in CSV")
+                    result.valid = False
+                    return result
+
+                result.detected_columns = list(headers)
+                result.column_count = len(headers)
+
+                # Map columns
+                for header in headers:
+                    header_clean = header.strip()
+                    if header_clean in field_map:
+                        result.mapped_columns[header_clean] = field_map[header_clean]
+                    else:
+                        result.unmapped_columns.append(header_clean)
+
+                # Check for required key field
+                has_key = any(
+                    field_map.get(h.strip()) == required_key
+                    for h in headers
+                )
+
+                if not has_key:
+                    result.errors.append(
+                        f"Required field '{required_key}' not found. "
+                        f"Expected one of: {[k for k, v in field_map.items() if v == required_key]}"
+                    )
+                    result.valid = False
+
+                # Count rows (sample first 100)
+                row_count = 0
+                for _ in reader:
+                    row_count += 1
+                    if row_count >= 100:
+                        if not count_rows:
+                            break
+                        # Estimate total
                         f.seek(0)
-
-                        # Auto-detect delimiter
-                        delimiter = self._detect_delimiter(sample)
-
-                        reader = csv.DictReader(f, delimiter=delimiter)
-                        headers = reader.fieldnames or []
-
-                        if not headers:
-                            result.errors.append("No headers found in CSV")
-                            result.valid = False
-                            return result
-
-                        result.detected_columns = list(headers)
-                        result.column_count = len(headers)
-
-                        # Map columns
-                        for header in headers:
-                            header_clean = header.strip()
-                            if header_clean in field_map:
-                                result.mapped_columns[header_clean] = field_map[header_clean]
-                            else:
-                                result.unmapped_columns.append(header_clean)
-
-                        # Check for required key field
-                        has_key = any(
-                            field_map.get(h.strip()) == required_key
-                            for h in headers
-                        )
-
-                        if not has_key:
-                            result.errors.append(
-                                f"Required field '{required_key}' not found. "
-                                f"Expected one of: {[k for k, v in field_map.items() if v == required_key]}"
-                            )
-                            result.valid = False
-
-                        # Count rows (sample first 100)
-                        row_count = 0
-                        for _ in reader:
-                            row_count += 1
-                            if row_count >= 100:
-                                # Estimate total
-                                f.seek(0)
-                                total_lines = sum(1 for _ in f) - 1  # Subtract header
-                                row_count = total_lines
-                                break
-
-                        result.row_count = row_count
-
-                        if result.unmapped_columns:
-                            result.warnings.append(
-                                f"Unmapped columns: {result.unmapped_columns}"
-                            )
-
-                        # Successfully read with this encoding
+                        total_lines = sum(1 for _ in f) - 1  # Subtract header
+                        row_count = total_lines
                         break
 
-                except UnicodeDecodeError:
-                    continue
-            else:
-                result.errors.append(f"Could not decode file with any supported encoding")
-                result.valid = False
+                result.row_count = row_count
+
+                if result.unmapped_columns:
+                    result.warnings.append(
+                        f"Unmapped columns: {result.unmapped_columns}"
+                    )
 
         except Exception as e:
             result.errors.append(f"Error reading CSV: {str(e)}")
@@ -548,18 +878,60 @@ class CSVLoader:
 
         return result
 
+    def _csv_format(self, file_path: Path) -> Tuple[str, str]:
+        """
+        Detect a file's encoding and delimiter once.
+
+        The encoding is the first supported one that decodes the whole file.
+        Candidates are screened on a leading sample, and the first survivor
+        is confirmed by decoding the rest of the raw bytes in large chunks,
+        so a wrong guess never costs a full CSV parse. The delimiter comes
+        from the start of the decoded sample. Results are cached per file
+        version (path, size, mtime), so validation and loading share them.
+
+        Args:
+            file_path: Path to CSV file
+
+        Returns:
+            Tuple of (encoding, delimiter)
+        """
+        stat = file_path.stat()
+        key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        if key in self._formats:
+            return self._formats[key]
+
+        detected = self.encoding
+        with open(file_path, 'rb') as f:
+            sample = f.read(ENCODING_SAMPLE_SIZE)
+            for encoding in [self.encoding, 'utf-8-sig', 'latin-1', 'cp1252']:
+                decoder = codecs.getincrementaldecoder(encoding)()
+                try:
+                    decoder.decode(sample)
+                    f.seek(len(sample))
+                    for chunk in iter(lambda: f.read(CSV_READ_BUFFER), b''):
+                        decoder.decode(chunk)
+                    decoder.decode(b'', final=True)
+                except UnicodeDecodeError:
+                    continue
+                detected = encoding
+                break
+
+        text = codecs.getincrementaldecoder(detected)().decode(sample)
+        self._formats[key] = (detected, self._detect_delimiter(text))
+        return self._formats[key]
+
+    def _detect_encoding(self, file_path: Path) -> str:
+        """Detect the encoding to open a CSV file with (see _csv_format)."""
+        return self._csv_format(file_path)[0]
+
     def _detect_delimiter(self, sample: str) -> str:
         """Detect CSV delimiter from sample content."""
-        # Count occurrences of common delimiters
-        delimiters = {
-            ',': sample.count(','),
-            ';': sample.count(';'),
-            '\t': sample.count('\t'),
-            '|': sample.count('|'),
-        }
+        # Count occurrences of common delimiters in a bounded sample;
+        # str.count scans in C, far faster than one pass in Python
+        sample = sample[:DELIMITER_SAMPLE_SIZE]
 
-        # Return most common delimiter
-        return max(delimiters, key=delimiters.get)
+        # Return most common delimiter (first listed wins ties)
+        return max(DELIMITERS, key=sample.count)
 
     # Fields that should remain as strings (document numbers, item numbers, etc.)
     STRING_FIELDS = {
@@ -569,6 +941,12 @@ class CSVLoader:
         'vbtyp_v', 'vbtyp_n',
     }
 
+    # Document category codes (VBTYP), stored upper-case
+    CATEGORY_FIELDS = {'vbtyp_v', 'vbtyp_n'}
+
+    # Fields that are always quantities or amounts
+    NUMERIC_FIELDS = {'netwr', 'kwmeng', 'rfmng'}
+
     def _load_csv(
         self,
         file_path: Path,
@@ -585,73 +963,235 @@ class CSVLoader:
             List of records with normalized field names
         """
         records = []
+        for batch in self._load_csv_batched(file_path, field_map):
+            records.extend(batch)
+        return records
+
+    def _load_csv_grouped(
+        self,
+        file_path: Path,
+        field_map: Dict[str, str],
+        key: str
+    ) -> Tuple[Dict[str, List[Dict]], int]:
+        """
+        Load CSV file straight into records grouped by a key field.
+
+        Args:
+            file_path: Path to CSV file
+            field_map: Field name mappings
+            key: Key field to group by (normalized)
+
+        Returns:
+            Tuple of (grouped records, number of records loaded)
+        """
+        grouped: Dict[str, List[Dict]] = {}
+        count = 0
+
+        for batch in self._load_csv_batched(file_path, field_map):
+            count += len(batch)
+            for key_value, records in self._group_by_key(batch, key).items():
+                if key_value in grouped:
+                    grouped[key_value].extend(records)
+                else:
+                    grouped[key_value] = records
+
+        return grouped, count
 
-        # Try different encodings
-        for encoding in [self.encoding, 'utf-8-sig', 'latin-1', 'cp1252']:
+    def _load_csv_batched(
+        self,
+        file_path: Path,
+        field_map: Dict[str, str],
+        block_size: int = CSV_BLOCK_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Load CSV file as batches of records with normalized field names.
+
+        With PyArrow the file is streamed through its C++ CSV reader one
+        block at a time. If Arrow rejects the file (ragged rows, or bytes
+        that need the encoding fallback), the remaining records come from
+        csv.DictReader instead.
+
+        Args:
+            file_path: Path to CSV file
+            field_map: Field name mappings
+            block_size: Bytes of CSV text parsed per batch (PyArrow only)
+
+        Yields:
+            Lists of records with normalized field names
+        """
+        loaded = 0
+
+        if PYARROW_AVAILABLE:
             try:
-                with open(file_path, 'r', encoding=encoding, newline='') as f:
-                    sample = f.read(4096)
-                    f.seek(0)
-                    delimiter = self._detect_delimiter(sample)
+                headers, reader = self._open_csv_arrow(file_path, block_size)
+                if reader is None:
+                    return
+                for batch in reader:
+                    records = self._normalize_columns(headers, batch.columns, field_map)
+                    loaded += len(records)
+                    yield records
+                return
+            except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+                logger.debug(f"Arrow CSV read failed for {file_path}, using csv module: {e}")
+
+        yield self._load_csv_python(file_path, field_map)[loaded:]
+
+    def _open_csv_arrow(
+        self,
+        file_path: Path,
+        block_size: int
+    ) -> Tuple[List[str], Optional['pa_csv.CSVStreamingReader']]:
+        """
+        Open a CSV file for streaming with PyArrow.
 
-                    reader = csv.DictReader(f, delimiter=delimiter)
+        Every column is read as text so that values go through the same
+        cleanup as on the csv.reader path, and column names come from
+        csv.reader so they normalize the same way.
 
-                    for row in reader:
-                        normalized_row = {}
+        Returns:
+            Tuple of (header row, record batch reader or None if no header)
+        """
+        encoding, delimiter = self._csv_format(file_path)
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            headers = next(csv.reader(f, delimiter=delimiter), [])
+
+        if not headers:
+            return headers, None
+
+        reader = pa_csv.open_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(
+                encoding=encoding,
+                column_names=headers,
+                skip_rows=1,
+                block_size=block_size,
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=delimiter,
+                newlines_in_values=True,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={header: pa.string() for header in headers},
+            ),
+        )
+        return headers, reader
 
-                        for header, value in row.items():
-                            if header is None:
-                                continue
-                            header_clean = header.strip()
+    def _normalize_columns(
+        self,
+        headers: List[str],
+        columns: List['pa.Array'],
+        field_map: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn Arrow text columns into records with normalized field names.
 
-                            # Normalize field name
-                            if header_clean in field_map:
-                                normalized_name = field_map[header_clean]
-                            else:
-                                # Keep original name if not mapped
-                                normalized_name = header_clean.lower().replace(' ', '_')
+        Values are cleaned once per distinct value in each column.
+        """
+        names = []
+        cleaned_columns = []
+        for (normalized_name, convert), column in zip(
+            self._header_plan(headers, field_map), columns
+        ):
+            values = column.to_pylist()
+            cleaned = {v: convert(v) for v in set(values)}
 
-                            # Clean and convert value
-                            # Keep string fields as strings (document numbers, etc.)
-                            if normalized_name in self.STRING_FIELDS:
-                                normalized_row[normalized_name] = str(value).strip() if value else ''
-                            else:
-                                normalized_row[normalized_name] = self._clean_value(value)
+            names.append(normalized_name)
+            cleaned_columns.append([cleaned[v] for v in values])
 
-                        records.append(normalized_row)
+        return [dict(zip(names, row)) for row in zip(*cleaned_columns)]
 
-                    break  # Successfully loaded
+    def _header_plan(
+        self,
+        headers: Sequence[str],
+        field_map: Dict[str, str]
+    ) -> List[Tuple[str, Callable[[Any], Any]]]:
+        """
+        Resolve each header to its normalized name and converter once per file.
 
-            except UnicodeDecodeError:
-                continue
+        String fields (document numbers, codes) are kept as stripped strings,
+        interned so values repeated across rows, batches and tables share one
+        object. Numeric fields go straight to number parsing; everything else
+        gets the generic cleaning of _clean_value.
 
-        return records
+        Args:
+            headers: Raw header row
+            field_map: Field name mappings
 
-    def _clean_value(self, value: Any) -> Any:
-        """Clean and convert a cell value."""
-        if value is None:
-            return None
+        Returns:
+            List of (normalized_name, converter) per column position
+        """
+        plan = []
+        for header in headers:
+            header_clean = header.strip()
 
-        if isinstance(value, str):
-            value = value.strip()
+            # Normalize field name, keeping unmapped names in snake case
+            if header_clean in field_map:
+                normalized_name = field_map[header_clean]
+            else:
+                normalized_name = header_clean.lower().replace(' ', '_')
+
+            if normalized_name in self.CATEGORY_FIELDS:
+                convert = _clean_category_cell
+            elif normalized_name in self.STRING_FIELDS:
+                convert = _clean_string_cell
+            elif normalized_name in self.NUMERIC_FIELDS:
+                convert = _to_number
+            else:
+                convert = self._clean_value
+            plan.append((normalized_name, convert))
 
-            if value == '' or value.upper() in ('NULL', 'NA', 'N/A', '#N/A'):
-                return None
+        return plan
 
-            # Try numeric conversion
-            try:
-                # Check for integer
-                if value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
-                    return int(value)
+    def _load_csv_python(
+        self,
+        file_path: Path,
+        field_map: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Load CSV file with csv.reader and normalize field names.
 
-                # Check for float (handle European format with comma decimal)
-                if ',' in value and '.' not in value:
-                    value = value.replace(',', '.')
+        Args:
+            file_path: Path to CSV file
+            field_map: Field name mappings
 
-                float_val = float(value.replace(',', ''))
-                return float_val
-            except (ValueError, AttributeError):
-                pass
+        Returns:
+            List of records with normalized field names
+        """
+        records = []
+
+        encoding, delimiter = self._csv_format(file_path)
+        with open(file_path, 'r', encoding=encoding, newline='',
+                  buffering=CSV_READ_BUFFER) as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            headers = next(reader, [])
+
+            # Resolve headers and value cleaners once, then map
+            # cells positionally instead of per-cell dict lookups
+            plan = self._header_plan(headers, field_map)
+            names = [name for name, _ in plan]
+            cleaners = [convert for _, convert in plan]
+            width = len(plan)
+
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    # Missing trailing cells read as empty, like DictReader
+                    row = row + [None] * (width - len(row))
+
+                # Extra cells beyond the header are dropped by zip
+                records.append(dict(zip(
+                    names,
+                    [clean(value) for clean, value in zip(cleaners, row)]
+                )))
+
+        return records
+
+    @staticmethod
+    def _clean_value(value: Any) -> Any:
+        """Clean and convert a cell value."""
+        if isinstance(value, str):
+            return _clean_str(value)
 
         return value
 
@@ -661,53 +1201,112 @@ class CSVLoader:
         vbap_records: List[Dict],
         text_records: List[Dict],
         vbfa_records: List[Dict],
-    ) -> List[Dict[str, Any]]:
+        items_by_order: Optional[Dict[str, List[Dict]]] = None,
+        lazy: bool = False,
+    ) -> Union[List[UnifiedDocument], Iterator[UnifiedDocument]]:
         """
         Convert CSV records to unified document format.
 
-        This creates the same structure expected by the pattern engine's
-        DataLoader.load_all() method.
+        Documents are built in compact form; UnifiedDocument.to_dict()
+        gives the structure expected by the pattern engine's
+        DataLoader.load_all() method. Items already grouped by order can
+        be passed as items_by_order instead of vbap_records.
+
+        Indexes, dates, timing and synthetic text draws are computed
+        up front either way, so a lazy result yields the same documents
+        whenever it is consumed; lazy only defers building each document.
         """
         # Build indices for efficient lookups
-        items_by_order = self._group_by_key(vbap_records, 'vbeln')
+        if items_by_order is None:
+            items_by_order = self._group_by_key(vbap_records, 'vbeln')
         texts_by_order = self._group_texts_by_order(text_records)
 
         # Build document flow index if available
-        deliveries_by_order: Dict[str, List[Dict]] = {}
-        invoices_by_delivery: Dict[str, List[Dict]] = {}
-
-        if vbfa_records:
-            for flow in vbfa_records:
-                source_cat = str(flow.get('vbtyp_v', '')).upper()
-                target_cat = str(flow.get('vbtyp_n', '')).upper()
-                source_doc = str(flow.get('vbelv', ''))
-                target_doc = str(flow.get('vbeln', ''))
-
-                # Order (C) -> Delivery (J)
-                if source_cat == 'C' and target_cat == 'J':
-                    if source_doc not in deliveries_by_order:
-                        deliveries_by_order[source_doc] = []
-                    deliveries_by_order[source_doc].append({
-                        'document_number': target_doc,
-                        'created_date': flow.get('erdat'),
-                    })
-
-                # Delivery (J) -> Invoice (M)
-                if source_cat == 'J' and target_cat == 'M':
-                    if source_doc not in invoices_by_delivery:
-                        invoices_by_delivery[source_doc] = []
-                    invoices_by_delivery[source_doc].append({
-                        'document_number': target_doc,
-                        'billing_date': flow.get('erdat'),
-                    })
-
-        # Create unified documents
-        documents = []
-
-        for vbak in vbak_records:
-            order_num = str(vbak.get('vbeln', '')).strip()
+        deliveries_by_order: Dict[str, List[Dict]] = defaultdict(list)
+        invoices_by_delivery: Dict[str, List[Dict]] = defaultdict(list)
+
+        # Category codes are upper-cased and document numbers kept as
+        # strings when the file is loaded, so rows are compared as-is
+        for flow in vbfa_records:
+            source_cat = flow.get('vbtyp_v', '')
+            target_cat = flow.get('vbtyp_n', '')
+
+            # Order (C) -> Delivery (J)
+            if source_cat == 'C' and target_cat == 'J':
+                deliveries_by_order[flow.get('vbelv', '')].append({
+                    'document_number': flow.get('vbeln', ''),
+                    'created_date': flow.get('erdat'),
+                })
+
+            # Delivery (J) -> Invoice (M)
+            elif source_cat == 'J' and target_cat == 'M':
+                invoices_by_delivery[flow.get('vbelv', '')].append({
+                    'document_number': flow.get('vbeln', ''),
+                    'billing_date': flow.get('erdat'),
+                })
+
+        # Dates and timing for all orders, computed column-wise: each
+        # distinct date value is parsed once, first delivery and invoice
+        # dates are grouped minimums over the joined flows, and day counts
+        # and ISO strings are derived from whole datetime64 columns
+        order_nums = [str(vbak.get('vbeln', '')).strip() for vbak in vbak_records]
+        order_dates = self._date_column([vbak.get('erdat') for vbak in vbak_records])
+        req_del_dates = self._date_column([vbak.get('vdatu') for vbak in vbak_records])
+        delivery_dates, invoice_dates = self._first_flow_dates(
+            order_nums, deliveries_by_order, invoices_by_delivery
+        )
+
+        timing_columns = {
+            'order_to_delivery_days': self._days_between(order_dates, delivery_dates),
+            'delivery_delay_days': self._days_between(req_del_dates, delivery_dates),
+            'invoice_lag_days': self._days_between(delivery_dates, invoice_dates),
+            'order_to_invoice_days': self._days_between(order_dates, invoice_dates),
+        }
+        timings = [
+            dict(zip(timing_columns, row)) for row in zip(*timing_columns.values())
+        ]
+        date_strings = zip(
+            self._format_date_column(order_dates),
+            self._format_date_column(req_del_dates),
+            self._format_date_column(delivery_dates),
+            self._format_date_column(invoice_dates),
+        )
+
+        # Synthetic text draws for all orders in one call
+        draws = self._rng.random((len(vbak_records), self.SYNTHETIC_TEXT_DRAWS)).tolist()
+
+        documents = self._build_documents(
+            zip(vbak_records, order_nums, draws, timings, date_strings),
+            items_by_order, texts_by_order, deliveries_by_order, invoices_by_delivery,
+        )
+        return documents if lazy else list(documents)
+
+    def _build_documents(
+        self,
+        rows: Iterator[Tuple],
+        items_by_order: Dict[str, List[Dict]],
+        texts_by_order: Dict[str, List[str]],
+        deliveries_by_order: Dict[str, List[Dict]],
+        invoices_by_delivery: Dict[str, List[Dict]],
+    ) -> Iterator[UnifiedDocument]:
+        """
+        Build a unified document per order from precomputed columns.
+
+        Args:
+            rows: (vbak, order number, text draws, timing, date strings) per
+                  VBAK record
+            items_by_order: VBAP records by order number
+            texts_by_order: Text lines by order number
+            deliveries_by_order: Delivery flows by order number
+            invoices_by_delivery: Invoice flows by delivery number
+
+        Yields:
+            UnifiedDocument for each record with a document number
+        """
+        for vbak, order_num, order_draws, timing, dates in rows:
             if not order_num:
                 continue
+            order_date, req_del_date, delivery_date, invoice_date = dates
 
             # Get items for this order
             items = items_by_order.get(order_num, [])
@@ -715,7 +1314,7 @@ class CSVLoader:
             # Get or generate texts
             order_texts = texts_by_order.get(order_num, [])
             if not order_texts:
-                order_texts = self._generate_synthetic_text(vbak, items)
+                order_texts = self._generate_synthetic_text(vbak, items, order_draws)
 
             # Consolidate text
             consolidated_text = ' '.join(order_texts)
@@ -729,80 +1328,30 @@ class CSVLoader:
                 del_num = delivery.get('document_number', '')
                 related_invoices.extend(invoices_by_delivery.get(del_num, []))
 
-            # Calculate dates and timing
-            order_date = self._parse_date(vbak.get('erdat'))
-            req_del_date = self._parse_date(vbak.get('vdatu'))
-
-            delivery_date = None
-            if related_deliveries:
-                delivery_dates = [
-                    self._parse_date(d.get('created_date'))
-                    for d in related_deliveries
-                    if d.get('created_date')
-                ]
-                if delivery_dates:
-                    delivery_date = min(d for d in delivery_dates if d)
-
-            invoice_date = None
-            if related_invoices:
-                invoice_dates = [
-                    self._parse_date(i.get('billing_date'))
-                    for i in related_invoices
-                    if i.get('billing_date')
-                ]
-                if invoice_dates:
-                    invoice_date = min(d for d in invoice_dates if d)
-
-            # Build timing metrics
-            timing = self._calculate_timing(
-                order_date, req_del_date, delivery_date, invoice_date
-            )
-
             # Build unified document
-            doc = {
-                'doc_key': order_num,
-                'consolidated_text': consolidated_text,
-                'order': {
-                    'document_number': order_num,
-                    'vbeln': order_num,
-                    'auart': vbak.get('auart', 'OR'),
-                    'vkorg': vbak.get('vkorg', ''),
-                    'vtweg': vbak.get('vtweg', ''),
-                    'spart': vbak.get('spart', ''),
-                    'kunnr': vbak.get('kunnr', ''),
-                    'customer': vbak.get('kunnr', ''),
-                    'created_date': self._format_date(order_date),
-                    'erdat': self._format_date(order_date),
-                    'requested_delivery_date': self._format_date(req_del_date),
-                    'vdatu': self._format_date(req_del_date),
-                    'netwr': vbak.get('netwr', 0),
-                    'waerk': vbak.get('waerk', 'USD'),
-                    'items': self._format_items(items),
-                    'header_texts': [{'text': t} for t in order_texts],
-                },
-                'deliveries': related_deliveries,
-                'invoices': related_invoices,
-                'customer': {
-                    'customer_id': vbak.get('kunnr', ''),
-                    'kunnr': vbak.get('kunnr', ''),
-                },
-                'dates': {
-                    'order_date': self._format_date(order_date),
-                    'requested_delivery_date': self._format_date(req_del_date),
-                    'actual_delivery_date': self._format_date(delivery_date),
-                    'invoice_date': self._format_date(invoice_date),
-                },
-                'timing': timing,
-                'sales_org': vbak.get('vkorg', ''),
-                'customer_industry': '',
-                'source_files': ['csv_import'],
-                'n_deliveries': len(related_deliveries),
-                'n_invoices': len(related_invoices),
-            }
-
-            documents.append(doc)
-
-        return documents
+            yield UnifiedDocument(
+                doc_key=order_num,
+                consolidated_text=consolidated_text,
+                order=UnifiedOrder(
+                    document_number=order_num,
+                    auart=vbak.get('auart', 'OR'),
+                    vkorg=vbak.get('vkorg', ''),
+                    vtweg=vbak.get('vtweg', ''),
+                    spart=vbak.get('spart', ''),
+                    kunnr=vbak.get('kunnr', ''),
+                    created_date=order_date,
+                    requested_delivery_date=req_del_date,
+                    netwr=vbak.get('netwr', 0),
+                    waerk=vbak.get('waerk', 'USD'),
+                    items=items,
+                    header_texts=order_texts,
+                ),
+                deliveries=related_deliveries,
+                invoices=related_invoices,
+                actual_delivery_date=delivery_date,
+                invoice_date=invoice_date,
+                timing=timing,
+            )
 
     def _group_by_key(
         self,
@@ -810,23 +1359,21 @@ class CSVLoader:
         key: str
     ) -> Dict[str, List[Dict]]:
         """Group records by a key field."""
-        grouped: Dict[str, List[Dict]] = {}
+        grouped: Dict[str, List[Dict]] = defaultdict(list)
 
         for record in records:
             key_value = str(record.get(key, '')).strip()
             if key_value:
-                if key_value not in grouped:
-                    grouped[key_value] = []
                 grouped[key_value].append(record)
 
-        return grouped
+        return dict(grouped)
 
     def _group_texts_by_order(
         self,
         text_records: List[Dict]
     ) -> Dict[str, List[str]]:
         """Group text records by order number, extracting text content."""
-        grouped: Dict[str, List[str]] = {}
+        grouped: Dict[str, List[str]] = defaultdict(list)
 
         for record in text_records:
             # Text object key (TDNAME) typically contains the order number
@@ -838,23 +1385,31 @@ class CSVLoader:
                 # Format is typically: VBELN (10 chars) or with additional keys
                 order_num = tdname[:10].strip() if len(tdname) >= 10 else tdname
 
-                if order_num not in grouped:
-                    grouped[order_num] = []
                 grouped[order_num].append(text_content)
 
-        return grouped
+        return dict(grouped)
 
     def _generate_synthetic_text(
         self,
         vbak: Dict,
-        items: List[Dict]
+        items: List[Dict],
+        draws: Optional[Sequence[float]] = None
     ) -> List[str]:
         """
         Generate synthetic document text based on order characteristics.
 
         This mirrors the logic from load_external_datasets.py generate_order_text()
         but adapted for CSV imports.
+
+        Args:
+            vbak: Order header record
+            items: Order item records
+            draws: SYNTHETIC_TEXT_DRAWS uniform values in [0, 1) selecting
+                   patterns; drawn from the loader's generator if omitted
         """
+        if draws is None:
+            draws = self._rng.random(self.SYNTHETIC_TEXT_DRAWS).tolist()
+        patterns = self._text_patterns
         texts = []
 
         # Get order characteristics
@@ -863,8 +1418,12 @@ class CSVLoader:
         net_value = float(vbak.get('netwr', 0) or 0)
         customer = str(vbak.get('kunnr', ''))
 
-        # Generate deterministic but varied text based on order hash
-        order_hash = hash(str(vbak.get('vbeln', '')) + str(self.random_seed))
+        # Generate deterministic but varied text based on order hash: a
+        # Knuth multiplicative hash of the (normally numeric) order number,
+        # which unlike hash() of a string is stable across processes
+        order_key = str(vbak.get('vbeln', ''))
+        order_int = int(order_key) if order_key.isdecimal() else zlib.crc32(order_key.encode())
+        order_hash = (order_int * 2654435761 + self.random_seed) & 0xFFFFFFFF
 
         # Order type description
         type_desc = self.ORDER_TYPE_DESC.get(order_type, 'Standard Order')
@@ -872,8 +1431,8 @@ class CSVLoader:
 
         # Value-based patterns
         if net_value > 100000:
-            texts.append(self._rng.choice(self.TEXT_PATTERNS['high_value']))
-            texts.append(self._rng.choice(self.TEXT_PATTERNS['credit_check']))
+            texts.append(self._pick(patterns['high_value'], draws[0]))
+            texts.append(self._pick(patterns['credit_check'], draws[1]))
         elif net_value > 50000:
             texts.append("Standard order processing.")
         elif net_value < 1000:
@@ -897,33 +1456,50 @@ class CSVLoader:
             texts.append("Standard multi-item order.")
 
         # Random additional patterns based on hash
-        if order_hash % 10 < 2:
-            texts.append(self._rng.choice(self.TEXT_PATTERNS['rush']))
-        elif order_hash % 10 < 4:
-            texts.append(self._rng.choice(self.TEXT_PATTERNS['special_handling']))
-        elif order_hash % 10 < 5:
-            texts.append(self._rng.choice(self.TEXT_PATTERNS['backorder']))
+        bucket_patterns = self._hash_bucket_patterns[order_hash % 10]
+        if bucket_patterns:
+            texts.append(self._pick(bucket_patterns, draws[2]))
 
         return texts
 
-    def _format_items(self, items: List[Dict]) -> List[Dict]:
-        """Format items for the unified document structure."""
+    @staticmethod
+    def _pick(patterns: Tuple[str, ...], draw: float) -> str:
+        """Select a pattern with a uniform draw in [0, 1)."""
+        return patterns[int(draw * len(patterns))]
+
+    @staticmethod
+    def _format_items(items: List[Dict]) -> List[Dict]:
+        """
+        Format items for the unified document structure.
+
+        Each value is listed under its English and SAP names; it is looked
+        up once and both keys reference the same object. Consumers read
+        either name, so the aliases stay in the dict format; compact
+        documents (as_dicts=False) keep the single-keyed VBAP records and
+        only pay for them here.
+        """
         formatted = []
 
         for item in items:
+            posnr = item.get('posnr', '')
+            matnr = item.get('matnr', '')
+            kwmeng = item.get('kwmeng', 0)
+            netwr = item.get('netwr', 0)
+            werks = item.get('werks', '')
+            pstyv = item.get('pstyv', '')
             formatted.append({
-                'item_number': item.get('posnr', ''),
-                'posnr': item.get('posnr', ''),
-                'material_id': item.get('matnr', ''),
-                'matnr': item.get('matnr', ''),
-                'quantity': item.get('kwmeng', 0),
-                'kwmeng': item.get('kwmeng', 0),
-                'net_value': item.get('netwr', 0),
-                'netwr': item.get('netwr', 0),
-                'plant': item.get('werks', ''),
-                'werks': item.get('werks', ''),
-                'item_category': item.get('pstyv', ''),
-                'pstyv': item.get('pstyv', ''),
+                'item_number': posnr,
+                'posnr': posnr,
+                'material_id': matnr,
+                'matnr': matnr,
+                'quantity': kwmeng,
+                'kwmeng': kwmeng,
+                'net_value': netwr,
+                'netwr': netwr,
+                'plant': werks,
+                'werks': werks,
+                'item_category': pstyv,
+                'pstyv': pstyv,
             })
 
         return formatted
@@ -940,58 +1516,139 @@ class CSVLoader:
         if not date_str:
             return None
 
-        # Try common formats
-        formats = [
-            '%Y-%m-%d',
-            '%Y%m%d',
-            '%d.%m.%Y',
-            '%m/%d/%Y',
-            '%d/%m/%Y',
-            '%Y-%m-%dT%H:%M:%S',
-        ]
+        return _parse_date_str(date_str)
 
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str[:len('YYYY-MM-DD')], fmt)
-            except (ValueError, IndexError):
-                continue
+    @staticmethod
+    def _date_column(values: List[Any]) -> np.ndarray:
+        """
+        Parse date values into a datetime64 column (NaT where unparseable).
 
-        return None
+        Vectorized equivalent of _parse_date: the distinct values are parsed
+        together with pd.to_datetime, one DATE_FORMATS entry at a time, each
+        applied only to values no earlier format matched. The format guessed
+        from a sample goes first, so a uniform column takes a single pass.
+        """
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        codes, uniques = pd.factorize(column)
+        distinct = pd.Index(uniques, dtype=object)
+        parsed = np.full(len(distinct), np.datetime64('NaT'), dtype='datetime64[us]')
+
+        is_datetime = np.array([isinstance(v, datetime) for v in distinct], dtype=bool)
+        if is_datetime.any():
+            parsed[is_datetime] = np.array(list(distinct[is_datetime]), dtype='datetime64[us]')
+
+        text = pd.Series(
+            [str(v).strip() if v is not None else '' for v in distinct[~is_datetime]],
+            index=np.flatnonzero(~is_datetime),
+            dtype=object,
+        ).str[:len('YYYY-MM-DD')]
+        pending = text[text != '']
+        for fmt in CSVLoader._date_formats(pending.iloc[:DATE_FORMAT_SAMPLE_SIZE]):
+            if pending.empty:
+                break
+            dates = pd.to_datetime(pending, format=fmt, errors='coerce')
+            matched = dates.notna()
+            parsed[pending.index[matched]] = dates[matched].to_numpy(dtype='datetime64[us]')
+            pending = pending[~matched]
+
+        # Missing values have code -1, which picks the NaT appended here
+        return np.append(parsed, np.datetime64('NaT'))[codes]
+
+    @staticmethod
+    def _date_formats(sample: Sequence[str]) -> List[str]:
+        """DATE_FORMATS with the format most of the sample has moved first."""
+        counts = dict.fromkeys(DATE_FORMATS, 0)
+        for value in sample:
+            for shape, fmt in DATE_FORMAT_SHAPES:
+                if shape.match(value):
+                    counts[fmt] += 1
+                    break
+
+        likely = max(counts, key=counts.get)
+        if not counts[likely]:
+            return DATE_FORMATS
+        return [likely] + [fmt for fmt in DATE_FORMATS if fmt != likely]
+
+    def _first_flow_dates(
+        self,
+        order_nums: List[str],
+        deliveries_by_order: Dict[str, List[Dict]],
+        invoices_by_delivery: Dict[str, List[Dict]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Earliest delivery and invoice date of each order.
 
-    def _format_date(self, dt: Optional[datetime]) -> Optional[str]:
-        """Format datetime to ISO date string."""
-        if dt is None:
-            return None
-        return dt.strftime('%Y-%m-%d')
+        Invoices reach an order through its deliveries, so they are joined
+        to the order's deliveries before taking the per-order minimum.
+        Both minimums are grouped aggregations over all flows at once, so
+        flows need no per-order ordering and no order's list is scanned.
 
-    def _calculate_timing(
-        self,
-        order_date: Optional[datetime],
-        req_del_date: Optional[datetime],
-        delivery_date: Optional[datetime],
-        invoice_date: Optional[datetime],
-    ) -> Dict[str, Optional[float]]:
-        """Calculate timing metrics from dates."""
-        timing = {
-            'order_to_delivery_days': None,
-            'delivery_delay_days': None,
-            'invoice_lag_days': None,
-            'order_to_invoice_days': None,
-        }
+        Returns:
+            Tuple of datetime64 columns aligned with order_nums
+        """
+        deliveries = [
+            (order, delivery.get('document_number', ''), delivery.get('created_date'))
+            for order, order_deliveries in deliveries_by_order.items()
+            for delivery in order_deliveries
+        ]
+        invoices = [
+            (delivery, invoice.get('billing_date'))
+            for delivery, delivery_invoices in invoices_by_delivery.items()
+            for invoice in delivery_invoices
+        ]
 
-        if order_date and delivery_date:
-            timing['order_to_delivery_days'] = (delivery_date - order_date).days
+        delivery_frame = pd.DataFrame({
+            'order': [flow[0] for flow in deliveries],
+            'delivery': [flow[1] for flow in deliveries],
+            'date': self._date_column([flow[2] for flow in deliveries]),
+        })
+        invoice_frame = pd.DataFrame({
+            'delivery': [flow[0] for flow in invoices],
+            'date': self._date_column([flow[1] for flow in invoices]),
+        })
+
+        first_delivery = delivery_frame.groupby('order')['date'].min()
+        first_invoice = (
+            delivery_frame[['order', 'delivery']]
+            .merge(invoice_frame, on='delivery')
+            .groupby('order')['date'].min()
+        )
 
-        if req_del_date and delivery_date:
-            timing['delivery_delay_days'] = (delivery_date - req_del_date).days
+        return (
+            first_delivery.reindex(order_nums).to_numpy(dtype='datetime64[us]'),
+            first_invoice.reindex(order_nums).to_numpy(dtype='datetime64[us]'),
+        )
 
-        if delivery_date and invoice_date:
-            timing['invoice_lag_days'] = (invoice_date - delivery_date).days
+    @staticmethod
+    def _days_between(
+        start: np.ndarray,
+        end: np.ndarray
+    ) -> List[Optional[int]]:
+        """Whole days from start to end per row, None where either is missing."""
+        delta = end - start
+        valid = ~np.isnat(delta)
+        days = np.where(valid, delta, np.timedelta64(0, 'us')) // np.timedelta64(1, 'D')
+        return [
+            day if is_valid else None
+            for day, is_valid in zip(days.tolist(), valid.tolist())
+        ]
 
-        if order_date and invoice_date:
-            timing['order_to_invoice_days'] = (invoice_date - order_date).days
+    @staticmethod
+    def _format_date_column(dates: np.ndarray) -> List[Optional[str]]:
+        """
+        Format a datetime64 column as ISO date strings (None for NaT).
 
-        return timing
+        Dates repeat heavily across orders, so each distinct date is
+        formatted once and its string shared by every order on that date.
+        """
+        codes, distinct = pd.factorize(dates)
+        texts = np.datetime_as_string(
+            np.asarray(distinct, dtype='datetime64[us]'), unit='D'
+        ).tolist()
+        # NaT gets code -1, which indexes this trailing None
+        texts.append(None)
+        return [texts[code] for code in codes.tolist()]
 
 
 def convert_csv_to_orders(
@@ -1038,11 +1695,11 @@ def load_csv_directory(
     """
     Load all CSV files from a directory.
 
-    Expects files named:
-    - VBAK.csv or vbak.csv (required)
-    - VBAP.csv or vbap.csv (required)
+    Expects files named (case-insensitive):
+    - VBAK.csv or sales_orders.csv (required)
+    - VBAP.csv or sales_order_items.csv (required)
     - STXH.csv, STXL.csv, or texts.csv (optional)
-    - VBFA.csv or vbfa.csv (optional)
+    - VBFA.csv or doc_flow.csv (optional)
 
     Args:
         csv_dir: Directory containing CSV exports
@@ -1056,43 +1713,28 @@ def load_csv_directory(
     if not csv_dir.exists():
         raise ValueError(f"Directory not found: {csv_dir}")
 
-    # Find VBAK file
-    vbak_csv = None
-    for name in ['VBAK.csv', 'vbak.csv', 'VBAK.CSV', 'sales_orders.csv']:
-        path = csv_dir / name
-        if path.exists():
-            vbak_csv = path
-            break
+    # One directory scan, matched case-insensitively; on a case-sensitive
+    # filesystem the upper-case spelling wins when both exist
+    entries: Dict[str, Path] = {}
+    with os.scandir(csv_dir) as scan:
+        for entry in sorted(scan, key=lambda e: e.name):
+            if entry.is_file():
+                entries.setdefault(entry.name.lower(), Path(entry.path))
+
+    def find(*names: str) -> Optional[Path]:
+        return next((entries[name] for name in names if name in entries), None)
 
+    vbak_csv = find('vbak.csv', 'sales_orders.csv')
     if not vbak_csv:
         raise ValueError(f"VBAK CSV not found in {csv_dir}")
 
-    # Find VBAP file
-    vbap_csv = None
-    for name in ['VBAP.csv', 'vbap.csv', 'VBAP.CSV', 'sales_order_items.csv']:
-        path = csv_dir / name
-        if path.exists():
-            vbap_csv = path
-            break
-
+    vbap_csv = find('vbap.csv', 'sales_order_items.csv')
     if not vbap_csv:
         raise ValueError(f"VBAP CSV not found in {csv_dir}")
 
-    # Find optional text file
-    text_csv = None
-    for name in ['STXH.csv', 'stxh.csv', 'STXL.csv', 'stxl.csv', 'texts.csv', 'TEXTS.csv']:
-        path = csv_dir / name
-        if path.exists():
-            text_csv = path
-            break
-
-    # Find optional document flow file
-    vbfa_csv = None
-    for name in ['VBFA.csv', 'vbfa.csv', 'VBFA.CSV', 'doc_flow.csv']:
-        path = csv_dir / name
-        if path.exists():
-            vbfa_csv = path
-            break
+    # Optional text and document flow files
+    text_csv = find('stxh.csv', 'stxl.csv', 'texts.csv')
+    vbfa_csv = find('vbfa.csv', 'doc_flow.csv')
 
     return convert_csv_to_orders(
         vbak_csv=vbak_csv,
@@ -32,8 +32,14 @@ Example Usage:
 """
 
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import json
@@ -42,12 +48,32 @@ logger = logging.getLogger(__name__)
 
 # Optional imports for dataset loading
 try:
+    import numpy as np
     import pandas as pd
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
+    np = None
     pd = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pc = None
+    pq = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 try:
     from datasets import load_dataset
     HF_AVAILABLE = True
@@ -55,7 +81,114 @@ except ImportError:
     HF_AVAILABLE = False
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Rows per record batch when streaming SALT tables from Hugging Face
+HF_BATCH_SIZE = 100_000
+
+
+def _column(df: 'pd.DataFrame', name: str, default: Any = None) -> 'pd.Series':
+    """Return a column, or a constant object Series if it is missing."""
+    if name in df.columns:
+        return df[name]
+    # A list, not a scalar: pandas fills Series(None, dtype=object) with NaN
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+@lru_cache(maxsize=65536)
+def _parse_date_str(date_str: str) -> str:
+    """Normalize a date string (see SALTAdapter._parse_date)."""
+    # Handle SAP date format (YYYYMMDD) or ISO format
+    if len(date_str) == 8 and date_str.isdigit():
+        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+    return date_str
+
+
+def _str_column(series: 'pd.Series') -> 'pd.Series':
+    """
+    Convert a column to str the way str() converts each value.
+
+    String columns without missing values are returned as they are, and
+    integer columns are cast by Arrow when available; anything else
+    (floats, missing values, categoricals, objects) goes through str().
+    """
+    if isinstance(series.dtype, pd.StringDtype) and not series.hasnans:
+        return series
+    if PYARROW_AVAILABLE and pd.api.types.is_integer_dtype(series.dtype) \
+            and not isinstance(series.dtype, pd.CategoricalDtype) and not series.hasnans:
+        strings = pa.array(series.to_numpy()).cast(pa.string()).to_pandas()
+        return pd.Series(strings.array, index=series.index)
+    return series.map(str)
+
+
+def _arrow_backed(series: 'pd.Series') -> bool:
+    """Whether a column's values are stored in an Arrow array."""
+    dtype = series.dtype
+    return isinstance(dtype, pd.ArrowDtype) or (
+        isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'
+    )
+
+
+def _records(df: 'pd.DataFrame', missing_as_none: bool = True) -> List[Dict[str, Any]]:
+    """
+    Convert a frame to record dicts, one column list at a time.
+
+    Gives the values of df.to_dict('records') (pd.NA becomes None) at a
+    fraction of the cost, since to_dict boxes every cell and is slowest on
+    categoricals.
+
+    Args:
+        df: Frame to convert
+        missing_as_none: Also turn NaN and NaT into None
+
+    Returns:
+        One dict per row
+    """
+    names = list(df.columns)
+    columns = []
+    for name in names:
+        column = df[name]
+        values = column.tolist()
+        if (missing_as_none or getattr(column.dtype, 'na_value', None) is pd.NA) \
+                and column.hasnans:
+            values = [
+                None if missing else value
+                for value, missing in zip(values, column.isna().tolist())
+            ]
+        columns.append(values)
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def _write_json_array(file_path: Path, records: List[Dict[str, Any]]) -> None:
+    """
+    Write records as a JSON array, one compact record per line.
+
+    Records are encoded and written one at a time, so the whole document
+    never exists as a single string. orjson is used when installed (it
+    writes NaN as null); otherwise json's C encoder, which needs no indent.
+    """
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            separator = b'[\n'
+            for record in records:
+                f.write(separator)
+                f.write(orjson.dumps(record, default=str))
+                separator = b',\n'
+            f.write(b'\n]\n' if separator != b'[\n' else b'[]\n')
+        return
+
+    encode = json.JSONEncoder(default=str).encode
+    with open(file_path, 'w') as f:
+        separator = '[\n'
+        for record in records:
+            f.write(separator)
+            f.write(encode(record))
+            separator = ',\n'
+        f.write('\n]\n' if separator != '[\n' else '[]\n')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SALTLoadResult:
     """Result of loading SALT dataset."""
 
@@ -157,6 +290,18 @@ class SALTAdapter:
         'POSTALCODE': 'postal_code',
     }
 
+    # Fields of the customer records, in output order
+    CUSTOMER_COLUMNS = ['customer_id', 'name', 'country', 'region', 'city', 'account_group']
+
+    # Low-cardinality sales columns held as pandas categoricals after
+    # loading, so grouping and unique() work on integer codes
+    CATEGORY_COLUMNS = {
+        'SALESDOCUMENTTYPE', 'SALESORGANIZATION', 'DISTRIBUTIONCHANNEL',
+        'ORGANIZATIONDIVISION', 'SOLDTOPARTY', 'CUSTOMERPAYMENTTERMS',
+        'SHIPPINGCONDITION', 'HEADERINCOTERMSCLASSIFICATION',
+        'MATERIAL', 'PLANT', 'SHIPPINGPOINT', 'ITEMINCOTERMSCLASSIFICATION',
+    }
+
     def __init__(self, dataset_name: str = "sap-ai-research/SALT"):
         """
         Initialize the SALT adapter.
@@ -175,14 +320,22 @@ class SALTAdapter:
     def load_from_huggingface(
         self,
         split: str = "train",
-        use_joined: bool = False
+        use_joined: bool = False,
+        streaming: bool = False,
+        batch_size: int = HF_BATCH_SIZE
     ) -> SALTLoadResult:
         """
         Load SALT dataset from Hugging Face.
 
+        Only the columns the SALT mappings use are kept. With streaming,
+        tables are read in record batches instead of being downloaded and
+        cached whole, and are converted to pandas once at the end.
+
         Args:
             split: Dataset split ("train" or "test")
             use_joined: If True, load pre-joined table instead of individual tables
+            streaming: Stream tables in batches (needs PyArrow)
+            batch_size: Rows per batch when streaming
 
         Returns:
             SALTLoadResult with load statistics
@@ -205,31 +358,38 @@ class SALTAdapter:
         try:
             if use_joined:
                 # Load pre-joined table (more convenient but less flexible)
-                ds = load_dataset(self.dataset_name, "joined_table", split=split)
-                self._joined = ds.to_pandas()
+                self._joined = self._categorize(self._load_hf_table(
+                    "joined_table", split,
+                    {**self.SALES_DOC_MAPPING, **self.SALES_ITEM_MAPPING},
+                    streaming, batch_size,
+                ))
                 result.sales_documents = len(self._joined['SALESDOCUMENT'].unique())
                 result.sales_items = len(self._joined)
                 logger.info(f"Loaded joined table: {len(self._joined):,} rows")
             else:
                 # Load individual tables (recommended for flexibility)
                 logger.info("Loading sales documents...")
-                ds_docs = load_dataset(self.dataset_name, "salesdocuments", split=split)
-                self._sales_documents = ds_docs.to_pandas()
+                self._sales_documents = self._categorize(self._load_hf_table(
+                    "salesdocuments", split, self.SALES_DOC_MAPPING, streaming, batch_size
+                ))
                 result.sales_documents = len(self._sales_documents)
 
                 logger.info("Loading sales items...")
-                ds_items = load_dataset(self.dataset_name, "salesdocument_items", split=split)
-                self._sales_items = ds_items.to_pandas()
+                self._sales_items = self._categorize(self._load_hf_table(
+                    "salesdocument_items", split, self.SALES_ITEM_MAPPING, streaming, batch_size
+                ))
                 result.sales_items = len(self._sales_items)
 
                 logger.info("Loading customers...")
-                ds_cust = load_dataset(self.dataset_name, "customers", split=split)
-                self._customers = ds_cust.to_pandas()
+                self._customers = self._load_hf_table(
+                    "customers", split, self.CUSTOMER_MAPPING, streaming, batch_size
+                )
                 result.customers = len(self._customers)
 
                 logger.info("Loading addresses...")
-                ds_addr = load_dataset(self.dataset_name, "addresses", split=split)
-                self._addresses = ds_addr.to_pandas()
+                self._addresses = self._load_hf_table(
+                    "addresses", split, None, streaming, batch_size
+                )
                 result.addresses = len(self._addresses)
 
         except Exception as e:
@@ -265,11 +425,26 @@ class SALTAdapter:
             'addresses': ['I_AddrOrg*.parquet', 'addresses*.parquet'],
         }
 
+        # Only the columns the mappings use are read from the wide SALT
+        # tables; addresses have no mapping and are read whole
+        table_mappings = {
+            'sales_documents': self.SALES_DOC_MAPPING,
+            'sales_items': self.SALES_ITEM_MAPPING,
+            'customers': self.CUSTOMER_MAPPING,
+        }
+
+        # One directory scan shared by all patterns, in the order glob()
+        # would list them; directories are kept as partitioned datasets
+        with os.scandir(dir_path) as scan:
+            file_names = [entry.name for entry in scan]
+
         for table_name, patterns in file_patterns.items():
             for pattern in patterns:
-                files = list(dir_path.glob(pattern))
+                files = [dir_path / name for name in file_names if fnmatchcase(name, pattern)]
                 if files:
-                    df = pd.read_parquet(files[0])
+                    df = self._read_parquet(files[0], table_mappings.get(table_name))
+                    if table_name in ('sales_documents', 'sales_items'):
+                        df = self._categorize(df)
                     setattr(self, f'_{table_name}', df)
                     if table_name == 'sales_documents':
                         result.sales_documents = len(df)
@@ -285,12 +460,105 @@ class SALTAdapter:
         self._load_result = result
         return result
 
+    def _load_hf_table(
+        self,
+        config: str,
+        split: str,
+        mapping: Optional[Dict[str, str]],
+        streaming: bool,
+        batch_size: int
+    ) -> pd.DataFrame:
+        """
+        Load one SALT table from Hugging Face, projected to the mapped columns.
+
+        Args:
+            config: Dataset configuration (table) name
+            split: Dataset split
+            mapping: SALT column mapping (None keeps every column)
+            streaming: Read record batches from an IterableDataset
+            batch_size: Rows per streamed batch
+
+        Returns:
+            DataFrame with the projected columns
+        """
+        if streaming and not PYARROW_AVAILABLE:
+            raise ImportError("PyArrow required for streaming. Install with: pip install pyarrow")
+
+        ds = load_dataset(self.dataset_name, config, split=split, streaming=streaming)
+
+        if mapping is not None and ds.column_names:
+            wanted = {col.upper() for col in mapping}
+            columns = [name for name in ds.column_names if name.upper() in wanted]
+            if columns:
+                ds = ds.select_columns(columns)
+
+        if not streaming:
+            return ds.to_pandas()
+
+        # Declared features give every batch the same Arrow schema; without
+        # them, columns that are all null in a batch are unified afterwards
+        schema = ds.features.arrow_schema if ds.features is not None else None
+        batches = [
+            pa.Table.from_pydict(batch, schema=schema)
+            for batch in ds.iter(batch_size=batch_size)
+        ]
+        if not batches:
+            return pd.DataFrame(columns=ds.column_names or [])
+        if schema is None:
+            schema = pa.unify_schemas([batch.schema for batch in batches])
+            batches = [batch.cast(schema) for batch in batches]
+        return pa.concat_tables(batches).to_pandas(self_destruct=True)
+
+    @staticmethod
+    def _read_parquet(path: Path, mapping: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Read a parquet file, projected to the columns named in mapping.
+
+        Column names are matched case-insensitively, as in
+        _normalize_columns(). With PyArrow the table is converted with
+        self_destruct so Arrow buffers are released as columns convert.
+
+        Args:
+            path: Parquet file
+            mapping: SALT column mapping (None reads every column)
+
+        Returns:
+            DataFrame with the projected columns
+        """
+        columns = None
+        if mapping is not None and PYARROW_AVAILABLE:
+            wanted = {col.upper() for col in mapping}
+            columns = [
+                name for name in pq.ParquetDataset(path).schema.names
+                if name.upper() in wanted
+            ] or None
+
+        if PYARROW_AVAILABLE:
+            table = pq.read_table(path, columns=columns, use_pandas_metadata=True)
+            return table.to_pandas(self_destruct=True)
+
+        return pd.read_parquet(path)
+
+    def _categorize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the CATEGORY_COLUMNS present in df to categorical dtype."""
+        columns = {
+            col: 'category' for col in df.columns
+            if col.upper() in self.CATEGORY_COLUMNS
+            and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        }
+        return df.astype(columns) if columns else df
+
     def _normalize_columns(
         self,
         df: pd.DataFrame,
         mapping: Dict[str, str]
     ) -> pd.DataFrame:
-        """Normalize column names using mapping."""
+        """
+        Normalize column names using mapping.
+
+        rename() returns a new frame that shares data with df (copy on
+        write), so callers pass the loaded tables without copying them.
+        """
         # Find columns that exist in the dataframe (case-insensitive)
         df_cols_upper = {col.upper(): col for col in df.columns}
 
@@ -307,13 +575,7 @@ class SALTAdapter:
             return None
 
         if isinstance(date_val, str):
-            # Handle SAP date format (YYYYMMDD) or ISO format
-            if len(date_val) == 8 and date_val.isdigit():
-                try:
-                    return f"{date_val[:4]}-{date_val[4:6]}-{date_val[6:8]}"
-                except:
-                    return None
-            return date_val
+            return _parse_date_str(date_val)
 
         if hasattr(date_val, 'isoformat'):
             return date_val.isoformat()
@@ -352,128 +614,42 @@ class SALTAdapter:
             result['invoices'] = []
             result['doc_flow'] = []
 
-        # Use joined table if available, otherwise individual tables
-        if self._joined is not None:
-            sales_df = self._normalize_columns(self._joined, {
-                **self.SALES_DOC_MAPPING,
-                **self.SALES_ITEM_MAPPING
-            })
-        else:
-            sales_df = self._normalize_columns(
-                self._sales_documents.copy(),
-                self.SALES_DOC_MAPPING
+        sales_df, headers = self._sales_headers(sample_size)
+
+        # Orders and their items are built column-wise and turned into
+        # records once; sales_df is sorted by document, so each order's
+        # items are one consecutive run
+        order_table = self._order_columns(headers)
+        orders = _records(order_table, missing_as_none=False)
+        result['sales_orders'] = orders
+
+        items = None
+        if include_items and 'item_number' in sales_df.columns:
+            items = self._item_columns(sales_df)
+            runs = groupby(
+                zip(
+                    sales_df['document_number'].to_numpy(),
+                    _records(items.drop(columns='document_number'), missing_as_none=False),
+                ),
+                key=itemgetter(0),
             )
+            for order, (_, run) in zip(orders, runs):
+                order['items'] = [item for _, item in run]
 
-        if sample_size:
-            unique_docs = sales_df['document_number'].unique()[:sample_size]
-            sales_df = sales_df[sales_df['document_number'].isin(unique_docs)]
-
-        # Group by document for header-level data
-        doc_groups = sales_df.groupby('document_number')
-
-        for doc_num, group in doc_groups:
-            first_row = group.iloc[0]
-
-            order = {
-                'document_number': str(doc_num),
-                'created_date': self._parse_date(first_row.get('created_date')),
-                'order_type': first_row.get('order_type', 'OR'),
-                'sales_org': first_row.get('sales_org'),
-                'customer': str(first_row.get('customer', '')),
-                'payment_terms': first_row.get('payment_terms'),
-                'shipping_condition': first_row.get('shipping_condition'),
-                'incoterms': first_row.get('incoterms'),
-                'requested_delivery_date': self._parse_date(
-                    first_row.get('requested_delivery_date')
-                ),
-            }
-
-            # Add items if requested and available
-            if include_items and 'item_number' in group.columns:
-                items = []
-                for _, item_row in group.iterrows():
-                    items.append({
-                        'item_number': str(item_row.get('item_number', '')),
-                        'material_id': str(item_row.get('material_id', '')),
-                        'quantity': float(item_row.get('quantity', 0)) if pd.notna(item_row.get('quantity')) else 0,
-                        'net_value': float(item_row.get('net_value', 0)) if pd.notna(item_row.get('net_value')) else 0,
-                        'plant': item_row.get('plant'),
-                        'shipping_point': item_row.get('shipping_point'),
-                    })
-                order['items'] = items
-
-            result['sales_orders'].append(order)
-
-            # Generate synthetic delivery and invoice events
-            if generate_events and order['created_date']:
-                delivery_num = f"8{doc_num}"  # SAP convention: deliveries start with 8
-                invoice_num = f"9{doc_num}"   # SAP convention: invoices start with 9
-
-                # Synthetic delivery (created_date + 3 days)
-                try:
-                    created = datetime.fromisoformat(order['created_date'][:10])
-                    delivery_date = (created + pd.Timedelta(days=3)).isoformat()[:10]
-                    gi_date = (created + pd.Timedelta(days=4)).isoformat()[:10]
-                    invoice_date = (created + pd.Timedelta(days=5)).isoformat()[:10]
-                except:
-                    delivery_date = order['created_date']
-                    gi_date = order['created_date']
-                    invoice_date = order['created_date']
-
-                result['deliveries'].append({
-                    'document_number': delivery_num,
-                    'created_date': delivery_date,
-                    'actual_gi_date': gi_date,
-                    'customer': order['customer'],
-                    'shipping_point': first_row.get('shipping_point'),
-                })
-
-                result['invoices'].append({
-                    'document_number': invoice_num,
-                    'billing_date': invoice_date,
-                    'customer': order['customer'],
-                    'net_value': sum(item.get('net_value', 0) for item in order.get('items', [])),
-                })
-
-                # Document flow links
-                result['doc_flow'].extend([
-                    {
-                        'preceding_doc': str(doc_num),
-                        'subsequent_doc': delivery_num,
-                        'preceding_category': 'C',  # Order
-                        'subsequent_category': 'J',  # Delivery
-                    },
-                    {
-                        'preceding_doc': delivery_num,
-                        'subsequent_doc': invoice_num,
-                        'preceding_category': 'J',  # Delivery
-                        'subsequent_category': 'M',  # Invoice
-                    },
-                ])
+        if generate_events:
+            events = self._synthetic_event_columns(order_table, headers, items)
+            for name, table in events.items():
+                result[name] = _records(table)
 
         # Process customers
         if self._customers is not None:
-            cust_df = self._normalize_columns(self._customers.copy(), self.CUSTOMER_MAPPING)
-            for _, row in cust_df.iterrows():
-                result['customers'].append({
-                    'customer_id': str(row.get('customer_id', '')),
-                    'name': row.get('name'),
-                    'country': row.get('country'),
-                    'region': row.get('region'),
-                    'city': row.get('city'),
-                    'account_group': row.get('account_group'),
-                })
+            result['customers'] = _records(self._customer_columns())
 
         # Extract unique materials from items
-        if self._joined is not None or self._sales_items is not None:
-            items_df = self._joined if self._joined is not None else self._sales_items
-            if 'MATERIAL' in items_df.columns or 'material_id' in items_df.columns:
-                mat_col = 'MATERIAL' if 'MATERIAL' in items_df.columns else 'material_id'
-                unique_mats = items_df[mat_col].dropna().unique()
-                for mat in unique_mats:
-                    result['materials'].append({
-                        'material_id': str(mat),
-                    })
+        result['materials'] = [
+            {'material_id': material_id}
+            for material_id in self._material_ids().tolist()
+        ]
 
         logger.info(
             f"Converted to workflow format: "
@@ -485,9 +661,277 @@ class SALTAdapter:
 
         return result
 
+    def to_workflow_columns(
+        self,
+        include_items: bool = True,
+        generate_events: bool = True,
+        sample_size: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Convert SALT data to workflow tables as DataFrames.
+
+        Column-oriented counterpart of to_workflow_format(): the same tables,
+        built with pandas operations over the loaded frames instead of
+        per-order dictionaries. Line items are returned as a separate
+        'sales_order_items' table keyed by document_number.
+
+        Args:
+            include_items: Include the sales_order_items table
+            generate_events: Generate synthetic delivery/invoice events
+            sample_size: Limit number of orders (None for all)
+
+        Returns:
+            Dictionary with sales_orders, customers, materials, and optionally
+            sales_order_items, deliveries, invoices, doc_flow DataFrames
+        """
+        if self._sales_documents is None and self._joined is None:
+            raise ValueError("No data loaded. Call load_from_huggingface() first.")
+
+        sales_df, headers = self._sales_headers(sample_size)
+
+        orders = self._order_columns(headers)
+        tables: Dict[str, pd.DataFrame] = {'sales_orders': orders}
+
+        items = None
+        if include_items and 'item_number' in sales_df.columns:
+            items = self._item_columns(sales_df)
+            tables['sales_order_items'] = items
+
+        if generate_events:
+            tables.update(self._synthetic_event_columns(orders, headers, items))
+
+        # Process customers
+        if self._customers is not None:
+            tables['customers'] = self._customer_columns()
+        else:
+            tables['customers'] = pd.DataFrame(columns=self.CUSTOMER_COLUMNS)
+
+        # Extract unique materials from items
+        tables['materials'] = pd.DataFrame({'material_id': self._material_ids()})
+
+        logger.info(
+            f"Converted to workflow columns: "
+            f"{len(orders)} orders, "
+            f"{len(tables.get('deliveries', ()))} deliveries, "
+            f"{len(tables.get('invoices', ()))} invoices, "
+            f"{len(tables['customers'])} customers"
+        )
+
+        return tables
+
+    def _sales_headers(
+        self,
+        sample_size: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Normalized sales rows sorted by document, and each document's first row.
+
+        Uses the joined table if available, otherwise the sales documents.
+        Rows without a document number are dropped, and the stable sort keeps
+        documents and header rows in the order groupby('document_number')
+        would give.
+
+        Args:
+            sample_size: Limit number of orders (None for all)
+
+        Returns:
+            Tuple of (sales rows, header rows)
+        """
+        if self._joined is not None:
+            sales_df = self._normalize_columns(self._joined, {
+                **self.SALES_DOC_MAPPING,
+                **self.SALES_ITEM_MAPPING
+            })
+        else:
+            sales_df = self._normalize_columns(self._sales_documents, self.SALES_DOC_MAPPING)
+
+        if sample_size:
+            unique_docs = sales_df['document_number'].unique()[:sample_size]
+            sales_df = sales_df[sales_df['document_number'].isin(unique_docs)]
+
+        sales_df = sales_df[sales_df['document_number'].notna()].sort_values(
+            'document_number', kind='mergesort'
+        )
+        headers = sales_df.drop_duplicates('document_number').reset_index(drop=True)
+        return sales_df, headers
+
+    def _order_columns(self, headers: pd.DataFrame) -> pd.DataFrame:
+        """Build the sales order table from document header rows."""
+        return pd.DataFrame({
+            'document_number': _str_column(headers['document_number']),
+            'created_date': self._date_column(headers, 'created_date'),
+            'order_type': _column(headers, 'order_type', 'OR'),
+            'sales_org': _column(headers, 'sales_org'),
+            'customer': _str_column(_column(headers, 'customer', '')),
+            'payment_terms': _column(headers, 'payment_terms'),
+            'shipping_condition': _column(headers, 'shipping_condition'),
+            'incoterms': _column(headers, 'incoterms'),
+            'requested_delivery_date': self._date_column(
+                headers, 'requested_delivery_date'
+            ),
+        })
+
+    def _date_column(self, df: pd.DataFrame, name: str) -> pd.Series:
+        """
+        Apply _parse_date to a date column, keeping unparseable dates as None.
+
+        Typed columns (datetime64, strings, categoricals) are factorized so
+        each distinct date is parsed once; the column's missing marker (NaT,
+        NaN or pd.NA) is parsed once from its first occurrence. Object
+        columns that are not all strings are parsed value by value, since
+        factorize would equate e.g. 1, 1.0 and True.
+        """
+        column = _column(df, name)
+        if column.dtype == object and pd.api.types.infer_dtype(column) not in ('string', 'empty'):
+            parsed = [self._parse_date(value) for value in column]
+            return pd.Series(parsed, index=df.index, dtype=object)
+
+        codes, uniques = pd.factorize(column)
+        parsed = [self._parse_date(value) for value in uniques]
+        missing = np.flatnonzero(codes < 0)
+        if len(missing):
+            # Code -1 picks this last entry
+            parsed.append(self._parse_date(column.iloc[missing[0]]))
+        lookup = np.empty(len(parsed), dtype=object)
+        lookup[:] = parsed
+        return pd.Series(lookup[codes], index=df.index, dtype=object)
+
+    @staticmethod
+    def _item_columns(sales_df: pd.DataFrame) -> pd.DataFrame:
+        """Build the sales order item table; missing amounts become 0."""
+        return pd.DataFrame({
+            'document_number': _str_column(sales_df['document_number']),
+            'item_number': _str_column(_column(sales_df, 'item_number', '')),
+            'material_id': _column(sales_df, 'material_id', '').map(str),
+            'quantity': pd.to_numeric(
+                _column(sales_df, 'quantity'), errors='coerce'
+            ).fillna(0),
+            'net_value': pd.to_numeric(
+                _column(sales_df, 'net_value'), errors='coerce'
+            ).fillna(0),
+            'plant': _column(sales_df, 'plant'),
+            'shipping_point': _column(sales_df, 'shipping_point'),
+        }).reset_index(drop=True)
+
+    def _customer_columns(self) -> pd.DataFrame:
+        """Build the customer table from the loaded customers."""
+        cust_df = self._normalize_columns(self._customers, self.CUSTOMER_MAPPING)
+        customers = pd.DataFrame({
+            col: _column(cust_df, col) for col in self.CUSTOMER_COLUMNS
+        })
+        customers['customer_id'] = _column(cust_df, 'customer_id', '').map(str)
+        return customers.reset_index(drop=True)
+
+    def _material_ids(self) -> pd.Series:
+        """
+        Distinct material IDs of the loaded items, in order of first use.
+
+        A categorical material column is deduplicated on its integer codes
+        and only the used categories are converted to strings; an
+        Arrow-backed column is deduplicated by Arrow on its buffers.
+        """
+        material_ids = pd.Series([], dtype=object)
+        items_df = self._joined if self._joined is not None else self._sales_items
+        if items_df is None:
+            return material_ids
+
+        mat_col = next((c for c in ('MATERIAL', 'material_id') if c in items_df.columns), None)
+        if mat_col is None:
+            return material_ids
+
+        materials = items_df[mat_col]
+        if isinstance(materials.dtype, pd.CategoricalDtype):
+            codes = materials.cat.codes.to_numpy()
+            unique_mats = materials.cat.categories.take(pd.unique(codes[codes >= 0]))
+        elif PYARROW_AVAILABLE and _arrow_backed(materials):
+            unique_mats = pc.drop_null(pc.unique(pa.array(materials.array)))
+            if pa.types.is_string(unique_mats.type) or pa.types.is_large_string(unique_mats.type):
+                return pd.Series(unique_mats.to_pylist(), dtype=object)
+            unique_mats = unique_mats.to_pylist()
+        else:
+            unique_mats = materials.dropna().unique()
+        return pd.Series(unique_mats, dtype=object).map(str)
+
+    def _synthetic_event_columns(
+        self,
+        orders: pd.DataFrame,
+        headers: pd.DataFrame,
+        items: Optional[pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Generate synthetic deliveries, invoices and doc flow for dated orders.
+
+        Shared by to_workflow_format() and to_workflow_columns(): delivery,
+        goods issue and invoice fall 3, 4 and 5 days after creation, and
+        unparseable creation dates are reused as-is. items, if given, holds
+        each order's rows as one run in order sequence (see _item_columns).
+        """
+        created = orders['created_date']
+        dated = (created.notna() & (created != '')).to_numpy()
+        doc_nums = orders['document_number'][dated]
+        created = created[dated]
+        delivery_num = '8' + doc_nums  # SAP convention: deliveries start with 8
+        invoice_num = '9' + doc_nums   # SAP convention: invoices start with 9
+
+        base = pd.to_datetime(created.str[:10], format='%Y-%m-%d', errors='coerce')
+        # Dates whose +5 day shift leaves the datetime range (e.g. 9999-12-31)
+        # keep the creation date for all three events
+        valid = base.notna() & ((base + pd.Timedelta(days=5)).dt.year <= 9999)
+
+        def shifted(days: int) -> pd.Series:
+            out = (base + pd.Timedelta(days=days)).dt.strftime('%Y-%m-%d')
+            return out.where(valid, created)
+
+        if items is not None and len(items):
+            # Items come in one run per order, in order sequence, so each
+            # order's value is a positional sum over its run
+            item_docs = items['document_number'].to_numpy()
+            starts = np.flatnonzero(np.r_[True, item_docs[1:] != item_docs[:-1]])
+            order_value = np.add.reduceat(items['net_value'].to_numpy(dtype=float), starts)
+            net_value = pd.Series(order_value[dated], index=doc_nums.index)
+        else:
+            net_value = pd.Series(0, index=doc_nums.index)
+
+        deliveries = pd.DataFrame({
+            'document_number': delivery_num,
+            'created_date': shifted(3),
+            'actual_gi_date': shifted(4),
+            'customer': orders['customer'][dated],
+            'shipping_point': _column(headers, 'shipping_point')[dated],
+        }).reset_index(drop=True)
+
+        invoices = pd.DataFrame({
+            'document_number': invoice_num,
+            'billing_date': shifted(5),
+            'customer': orders['customer'][dated],
+            'net_value': net_value,
+        }).reset_index(drop=True)
+
+        # Two links per order, kept in order -> delivery -> invoice sequence
+        positions = pd.Series(range(len(doc_nums)), index=doc_nums.index)
+        doc_flow = pd.concat([
+            pd.DataFrame({
+                'preceding_doc': doc_nums,
+                'subsequent_doc': delivery_num,
+                'preceding_category': 'C',  # Order
+                'subsequent_category': 'J',  # Delivery
+                '_order': positions * 2,
+            }),
+            pd.DataFrame({
+                'preceding_doc': delivery_num,
+                'subsequent_doc': invoice_num,
+                'preceding_category': 'J',  # Delivery
+                'subsequent_category': 'M',  # Invoice
+                '_order': positions * 2 + 1,
+            }),
+        ]).sort_values('_order', kind='mergesort').drop(columns='_order').reset_index(drop=True)
+
+        return {'deliveries': deliveries, 'invoices': invoices, 'doc_flow': doc_flow}
+
     def save_to_json(
         self,
         output_dir: str,
+        workers: int = 1,
         **kwargs
     ) -> Dict[str, str]:
         """
@@ -495,6 +939,8 @@ class SALTAdapter:
 
         Args:
             output_dir: Directory to save JSON files
+            workers: Threads writing files concurrently; encoding holds the
+                     GIL, so this mainly overlaps writes to slow storage
             **kwargs: Arguments passed to to_workflow_format()
 
         Returns:
@@ -504,14 +950,26 @@ class SALTAdapter:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
+        tables = {
+            table_name: (output_path / f"{table_name}.json", records)
+            for table_name, records in data.items() if records
+        }
+
+        if workers <= 1 or len(tables) <= 1:
+            for file_path, records in tables.values():
+                _write_json_array(file_path, records)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(tables)), thread_name_prefix="salt-save"
+            ) as pool:
+                futures = [pool.submit(_write_json_array, *table) for table in tables.values()]
+                for future in futures:
+                    future.result()
+
         saved_files = {}
-        for table_name, records in data.items():
-            if records:
-                file_path = output_path / f"{table_name}.json"
-                with open(file_path, 'w') as f:
-                    json.dump(records, f, indent=2, default=str)
-                saved_files[table_name] = str(file_path)
-                logger.info(f"Saved {len(records)} records to {file_path}")
+        for table_name, (file_path, records) in tables.items():
+            saved_files[table_name] = str(file_path)
+            logger.info(f"Saved {len(records)} records to {file_path}")
 
         return saved_files
 
@@ -540,7 +998,8 @@ class SALTAdapter:
 def load_salt_dataset(
     split: str = "train",
     sample_size: Optional[int] = None,
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    streaming: bool = False
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Convenience function to load SALT dataset.
@@ -549,12 +1008,13 @@ def load_salt_dataset(
         split: Dataset split ("train" or "test")
         sample_size: Limit number of orders
         output_dir: If provided, save to JSON files
+        streaming: Stream tables from Hugging Face in batches
 
     Returns:
         Workflow mining format data
     """
     adapter = SALTAdapter()
-    adapter.load_from_huggingface(split=split)
+    adapter.load_from_huggingface(split=split, streaming=streaming)
 
     if output_dir:
         adapter.save_to_json(output_dir, sample_size=sample_size)
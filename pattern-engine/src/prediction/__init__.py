@@ -97,6 +97,7 @@ from .models import (
     ModelConfig,
     ModelType,
     Prediction,
+    PredictionBatch,
     PredictionType,
     PredictiveModel,
     PredictiveMonitor,
@@ -138,6 +139,7 @@ __all__ = [
     "ModelConfig",
     "ModelType",
     "Prediction",
+    "PredictionBatch",
     "PredictionType",
     "PredictiveModel",
     "PredictiveMonitor",
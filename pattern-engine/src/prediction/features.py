@@ -27,9 +27,39 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _duration_stats(offsets):
+        """Mean, max, min and std of successive differences, in one pass."""
+        n = offsets.shape[0] - 1
+        mean = 0.0
+        m2 = 0.0
+        largest = -np.inf
+        smallest = np.inf
+        for i in range(n):
+            duration = offsets[i + 1] - offsets[i]
+            delta = duration - mean
+            mean += delta / (i + 1)
+            m2 += delta * (duration - mean)
+            largest = max(largest, duration)
+            smallest = min(smallest, duration)
+        return mean, largest, smallest, np.sqrt(m2 / n)
+else:
+    def _duration_stats(offsets):
+        """Mean, max, min and std of successive differences."""
+        durations = np.diff(offsets)
+        return durations.mean(), durations.max(), durations.min(), durations.std()
+
+
 class FeatureType(Enum):
     """Types of features that can be extracted."""
 
@@ -406,16 +436,19 @@ class FeatureExtractor:
         time_since_start = (current_time - first_ts).total_seconds()
         features["time_since_start"] = time_since_start / divisor
 
-        # Inter-event durations
+        # Inter-event durations: one pass to float64 offsets, then a
+        # Numba-compiled kernel when installed (np.diff otherwise)
         if len(timestamps) > 1:
-            durations = [
-                (timestamps[i] - timestamps[i - 1]).total_seconds()
-                for i in range(1, len(timestamps))
-            ]
-            features["avg_activity_duration"] = np.mean(durations) / divisor
-            features["max_activity_duration"] = np.max(durations) / divisor
-            features["min_activity_duration"] = np.min(durations) / divisor
-            features["std_activity_duration"] = np.std(durations) / divisor
+            offsets = np.fromiter(
+                ((ts - first_ts).total_seconds() for ts in timestamps),
+                dtype=np.float64,
+                count=len(timestamps),
+            )
+            mean, largest, smallest, std = _duration_stats(offsets)
+            features["avg_activity_duration"] = mean / divisor
+            features["max_activity_duration"] = largest / divisor
+            features["min_activity_duration"] = smallest / divisor
+            features["std_activity_duration"] = std / divisor
         else:
             features["avg_activity_duration"] = 0.0
             features["max_activity_duration"] = 0.0
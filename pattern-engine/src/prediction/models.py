@@ -12,7 +12,8 @@ Supported Predictions:
 
 Model Types:
 - RandomForestClassifier/Regressor: Good for interpretability
-- GradientBoostingClassifier/Regressor: Often best performance
+- HistGradientBoostingClassifier/Regressor: Often best performance, fast
+  binned training (exact GradientBoosting* via use_histogram=False)
 - Ensemble models: Combines multiple predictors
 
 References:
@@ -22,12 +23,11 @@ References:
 """
 
 import logging
-import pickle
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import warnings
 
 import numpy as np
@@ -36,6 +36,8 @@ try:
     from sklearn.ensemble import (
         GradientBoostingClassifier,
         GradientBoostingRegressor,
+        HistGradientBoostingClassifier,
+        HistGradientBoostingRegressor,
         RandomForestClassifier,
         RandomForestRegressor,
         VotingClassifier,
@@ -54,14 +56,36 @@ try:
         mean_squared_error,
         r2_score,
     )
+    from sklearn.utils.parallel import Parallel, delayed
+    import joblib
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import lz4  # enables joblib's lz4 compressor
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
 from .features import FeatureExtractor, FeatureConfig, ExtractedFeatures
 
 logger = logging.getLogger(__name__)
 
+# Symmetric AbsMax ranges for quantized features and leaf values; both are
+# stored as int16, so each uses the full int16 range
+QUANT_FEATURE_RANGE = 32767
+QUANT_LEAF_RANGE = 32767
+
+# joblib compression for saved models: lz4 when installed, else zlib
+MODEL_COMPRESSION = ("lz4", 3) if LZ4_AVAILABLE else ("zlib", 3)
+
 
 class ModelType(Enum):
     """Types of ML models available."""
@@ -119,6 +143,11 @@ class ModelConfig:
         test_size: Fraction of data for testing
         cv_folds: Number of cross-validation folds
         scale_features: Whether to standardize features
+        use_histogram: Use HistGradientBoosting* (binned features, no
+            scaling) instead of exact GradientBoosting* for boosted trees
+        dtype: Floating dtype feature matrices are cast to for training and
+            inference (float32 halves memory traffic; trees split on
+            float32 values regardless)
     """
     model_type: ModelType = ModelType.GRADIENT_BOOSTING
     n_estimators: int = 100
@@ -127,6 +156,8 @@ class ModelConfig:
     test_size: float = 0.2
     cv_folds: int = 5
     scale_features: bool = True
+    use_histogram: bool = True
+    dtype: Any = np.float32
 
 
 @dataclass
@@ -221,6 +252,329 @@ class Prediction:
         return self.value_type == ValueType.PROBABILITY and self.probability is not None
 
 
+@dataclass
+class PredictionBatch:
+    """
+    Column-oriented predictions from a single model call.
+
+    Holds one NumPy array per field instead of one Prediction object per
+    case, so large batches cost a few arrays rather than thousands of
+    dataclass instances. Materialize Prediction objects only when needed.
+
+    Attributes:
+        case_ids: Identifiers for the process instances
+        prediction_type: Type of prediction
+        predicted_values: Predicted labels (bool) or values (float)
+        confidences: Confidence level per prediction
+        value_type: Type of the predicted values
+        probabilities: Class-1 probabilities (ONLY for classifiers)
+        prediction_intervals: Optional (n, 2) array of lower/upper bounds
+        timestamp: When the batch was predicted
+    """
+    case_ids: List[str]
+    prediction_type: PredictionType
+    predicted_values: np.ndarray
+    confidences: np.ndarray
+    value_type: ValueType = ValueType.RAW
+    probabilities: Optional[np.ndarray] = None
+    prediction_intervals: Optional[np.ndarray] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def __len__(self) -> int:
+        """Number of predictions in the batch."""
+        return len(self.case_ids)
+
+    def _columns(self) -> Tuple[List[Any], ...]:
+        """Python-native column lists, converted once per batch."""
+        n = len(self.case_ids)
+        probabilities = (
+            self.probabilities.tolist() if self.probabilities is not None
+            else [None] * n
+        )
+        intervals = (
+            list(map(tuple, self.prediction_intervals.tolist()))
+            if self.prediction_intervals is not None else [None] * n
+        )
+        return (
+            self.case_ids,
+            self.predicted_values.tolist(),
+            probabilities,
+            self.confidences.tolist(),
+            intervals,
+        )
+
+    def to_predictions(self) -> List[Prediction]:
+        """Materialize one Prediction object per case."""
+        return [
+            Prediction(
+                case_id=case_id,
+                prediction_type=self.prediction_type,
+                predicted_value=value,
+                probability=probability,
+                confidence=confidence,
+                timestamp=self.timestamp,
+                value_type=self.value_type,
+                prediction_interval=interval,
+            )
+            for case_id, value, probability, confidence, interval in zip(
+                *self._columns()
+            )
+        ]
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield Prediction.to_dict()-shaped dicts without building objects."""
+        prediction_type = self.prediction_type.value
+        timestamp = self.timestamp.isoformat()
+        value_type = self.value_type.value
+        for case_id, value, probability, confidence, interval in zip(
+            *self._columns()
+        ):
+            result = {
+                "case_id": case_id,
+                "prediction_type": prediction_type,
+                "predicted_value": value,
+                "probability": probability,
+                "confidence": confidence,
+                "timestamp": timestamp,
+                "value_type": value_type,
+            }
+            if interval is not None:
+                result["prediction_interval"] = {
+                    "lower": interval[0],
+                    "upper": interval[1],
+                }
+            yield result
+
+
+if SKLEARN_AVAILABLE:
+    class _ThreadedVotingMixin:
+        """
+        Fit and query voting ensemble members concurrently on threads.
+
+        The members spend their time in sklearn/NumPy code that releases the
+        GIL, so the threading backend parallelizes them without pickling
+        the data to worker processes as loky would.
+        """
+
+        def fit(self, X, y, **fit_params):
+            """Fit the members with sklearn's parallel helpers on threads."""
+            with joblib.parallel_backend("threading"):
+                return super().fit(X, y, **fit_params)
+
+        def _map_estimators(self, method: str, X: np.ndarray) -> np.ndarray:
+            """Call one method on every fitted member concurrently."""
+            return np.asarray(Parallel(n_jobs=self.n_jobs, backend="threading")(
+                delayed(getattr(estimator, method))(X)
+                for estimator in self.estimators_
+            ))
+
+        def _collect_probas(self, X):
+            """Stack member predict_proba outputs (soft voting)."""
+            return self._map_estimators("predict_proba", X)
+
+        def _predict(self, X):
+            """Stack member predict outputs, one column per member."""
+            return self._map_estimators("predict", X).T
+
+    class _ThreadedVotingClassifier(_ThreadedVotingMixin, VotingClassifier):
+        """VotingClassifier whose members fit and predict on threads."""
+
+    class _ThreadedVotingRegressor(_ThreadedVotingMixin, VotingRegressor):
+        """VotingRegressor whose members fit and predict on threads."""
+
+
+def _decode_int16(field_bits):
+    """Sign-extend a 16-bit two's complement field."""
+    return (field_bits ^ 0x8000) - 0x8000
+
+
+if NUMBA_AVAILABLE:
+    _decode_int16 = njit(cache=True)(_decode_int16)
+
+    @njit(parallel=True, cache=True)
+    def _traverse_quantized(nodes, x_q):
+        """Sum quantized leaf values over all trees, one sample per thread."""
+        n_samples = x_q.shape[0]
+        sums = np.zeros(n_samples, dtype=np.int64)
+        for i in prange(n_samples):
+            acc = 0
+            for t in range(nodes.shape[0]):
+                node = nodes[t, 0]
+                left = (node >> 32) & 0xFFFF
+                while left != 0:
+                    threshold = _decode_int16((node >> 16) & 0xFFFF)
+                    if x_q[i, node & 0xFFFF] <= threshold:
+                        node = nodes[t, left]
+                    else:
+                        node = nodes[t, (node >> 48) & 0xFFFF]
+                    left = (node >> 32) & 0xFFFF
+                acc += _decode_int16((node >> 16) & 0xFFFF)
+            sums[i] = acc
+        return sums
+
+    @njit(parallel=True, cache=True)
+    def _forest_mean_std(children_left, children_right, feature, threshold, value, X):
+        """Welford mean/std of per-tree predictions, one sample per thread."""
+        n_samples = X.shape[0]
+        n_trees = children_left.shape[0]
+        mean = np.empty(n_samples)
+        std = np.empty(n_samples)
+        for i in prange(n_samples):
+            mu = 0.0
+            m2 = 0.0
+            for t in range(n_trees):
+                node = 0
+                while children_left[t, node] != -1:
+                    if X[i, feature[t, node]] <= threshold[t, node]:
+                        node = children_left[t, node]
+                    else:
+                        node = children_right[t, node]
+                v = value[t, node]
+                delta = v - mu
+                mu += delta / (t + 1)
+                m2 += delta * (v - mu)
+            mean[i] = mu
+            std[i] = np.sqrt(m2 / n_trees)
+        return mean, std
+else:
+    def _traverse_quantized(nodes, x_q):
+        """Sum quantized leaf values over all trees, one tree level at a time."""
+        rows = np.arange(x_q.shape[0])
+        sums = np.zeros(x_q.shape[0], dtype=np.int64)
+        for tree in nodes:
+            node = np.full(x_q.shape[0], tree[0])
+            left = (node >> 32) & 0xFFFF
+            active = left != 0
+            while active.any():
+                threshold = _decode_int16((node >> 16) & 0xFFFF)
+                go_left = x_q[rows, node & 0xFFFF] <= threshold
+                child = np.where(go_left, left, (node >> 48) & 0xFFFF)
+                node = np.where(active, tree[child], node)
+                left = (node >> 32) & 0xFFFF
+                active = left != 0
+            sums += _decode_int16((node >> 16) & 0xFFFF)
+        return sums
+
+
+def _stack_tree_arrays(forest: Any) -> Tuple[np.ndarray, ...]:
+    """
+    Copy a fitted regression forest's node arrays into padded 2D arrays.
+
+    Returns (children_left, children_right, feature, threshold, value), each
+    indexed [tree_id, node_id]. Padding nodes are leaves and never reached.
+    """
+    trees = [estimator.tree_ for estimator in forest.estimators_]
+    shape = (len(trees), max(tree.node_count for tree in trees))
+    children_left = np.full(shape, -1, dtype=np.int32)
+    children_right = np.full(shape, -1, dtype=np.int32)
+    feature = np.zeros(shape, dtype=np.int32)
+    threshold = np.zeros(shape, dtype=np.float64)
+    value = np.zeros(shape, dtype=np.float64)
+    for t, tree in enumerate(trees):
+        n = tree.node_count
+        children_left[t, :n] = tree.children_left
+        children_right[t, :n] = tree.children_right
+        feature[t, :n] = np.maximum(tree.feature, 0)
+        threshold[t, :n] = tree.threshold
+        value[t, :n] = tree.value[:, 0, 0]
+    return children_left, children_right, feature, threshold, value
+
+
+class _QuantizedForest:
+    """
+    Integer-only copy of a fitted random forest for approximate inference.
+
+    Each node is packed into one int64 word as (feature:16, threshold:16,
+    left:16, right:16), with thresholds stored as int16 on a per-feature
+    AbsMax scale. Leaves have left == 0 (the root is never a child) and keep
+    their int16 leaf value in the threshold field. Inputs are quantized
+    once per batch; traversal uses integer compares only and the leaf sum
+    is dequantized at the end.
+    """
+
+    def __init__(self, forest: Any, calibration_X: np.ndarray):
+        """
+        Quantize a fitted RandomForestClassifier or RandomForestRegressor.
+
+        Args:
+            forest: Fitted random forest (binary classifier or regressor)
+            calibration_X: Representative (already scaled) feature matrix
+                used to pick the per-feature scales
+        """
+        trees = [estimator.tree_ for estimator in forest.estimators_]
+        n_nodes = max(tree.node_count for tree in trees)
+        if n_nodes > 0xFFFF or forest.n_features_in_ > 0xFFFF:
+            raise ValueError(
+                "Quantized inference supports at most 65535 nodes per tree "
+                "and 65535 features"
+            )
+
+        max_abs = np.abs(np.asarray(calibration_X, dtype=np.float64)).max(axis=0)
+        # Constant-zero features keep a unit scale
+        self._feature_scales = QUANT_FEATURE_RANGE / np.where(
+            max_abs > 0, max_abs, QUANT_FEATURE_RANGE
+        )
+
+        leaves = [self._leaf_values(forest, tree) for tree in trees]
+        leaf_max = max(float(np.abs(values).max()) for values in leaves)
+        self._leaf_scale = QUANT_LEAF_RANGE / leaf_max if leaf_max > 0 else 1.0
+
+        packed = np.zeros((len(trees), n_nodes), dtype=np.uint64)
+        for t, (tree, values) in enumerate(zip(trees, leaves)):
+            is_leaf = tree.children_left < 0
+            feature = np.where(is_leaf, 0, tree.feature)
+            threshold = np.where(
+                is_leaf,
+                np.rint(values * self._leaf_scale),
+                np.floor(tree.threshold * self._feature_scales[feature]),
+            )
+            fields = (
+                feature,
+                np.clip(threshold, -32768, 32767).astype(np.int16).view(np.uint16),
+                np.where(is_leaf, 0, tree.children_left),
+                np.where(is_leaf, 0, tree.children_right),
+            )
+            word = np.zeros(tree.node_count, dtype=np.uint64)
+            for shift, values_u16 in zip((0, 16, 32, 48), fields):
+                word |= values_u16.astype(np.uint64) << np.uint64(shift)
+            packed[t, :tree.node_count] = word
+
+        # Signed words keep every shift/mask in int64 arithmetic
+        self._nodes = packed.view(np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed node array in bytes."""
+        return self._nodes.nbytes
+
+    @staticmethod
+    def _leaf_values(forest: Any, tree: Any) -> np.ndarray:
+        """Per-node output: class-1 fraction for classifiers, mean for regressors."""
+        value = tree.value[:, 0, :]
+        if hasattr(forest, "classes_"):
+            if value.shape[1] != 2:
+                raise ValueError("Quantized inference requires a binary classifier")
+            return value[:, 1] / value.sum(axis=1)
+        return value[:, 0]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Average forest output for each row of X.
+
+        Args:
+            X: Feature matrix (n_samples, n_features), already scaled
+
+        Returns:
+            Array of class-1 probabilities (classifier) or predictions (regressor)
+        """
+        x_q = np.clip(
+            np.floor(np.asarray(X, dtype=np.float64) * self._feature_scales),
+            -32768, 32767,
+        ).astype(np.int16)
+        sums = _traverse_quantized(self._nodes, x_q)
+        return sums / (self._nodes.shape[0] * self._leaf_scale)
+
+
 class PredictiveModel:
     """
     Base class for predictive process monitoring models.
@@ -260,6 +614,9 @@ class PredictiveModel:
         self._is_trained = False
         self._feature_names: List[str] = []
         self._training_result: Optional[TrainingResult] = None
+        self._quantized: Optional[_QuantizedForest] = None
+        # Scaler mean and reciprocal scale in the configured dtype
+        self._scale_params: Optional[Tuple[np.ndarray, np.ndarray]] = None
 
     @property
     def is_trained(self) -> bool:
@@ -281,33 +638,221 @@ class PredictiveModel:
         """Get the training result."""
         return self._training_result
 
+    @property
+    def is_quantized(self) -> bool:
+        """Check if inference runs on a quantized copy of the model."""
+        return self._quantized is not None
+
     def _create_model(self) -> Any:
         """Create the underlying ML model based on configuration."""
         raise NotImplementedError("Subclasses must implement _create_model")
 
+    def quantize(self, calibration_X: np.ndarray) -> None:
+        """
+        Route predict() through an int16-quantized copy of the trained forest.
+
+        Trades a small amount of accuracy for smaller node arrays and
+        integer-only traversal (parallel via Numba when installed). Only
+        random forest models are supported; retraining drops the quantized
+        copy.
+
+        Args:
+            calibration_X: Representative raw feature matrix used to choose
+                per-feature quantization scales
+        """
+        if not self._is_trained:
+            raise RuntimeError("Model must be trained before quantization")
+        if not isinstance(self._model, (RandomForestClassifier, RandomForestRegressor)):
+            raise ValueError("Quantized inference requires a random forest model")
+
+        if self._scaler is not None:
+            calibration_X = self._scaler.transform(calibration_X)
+        self._quantized = _QuantizedForest(self._model, calibration_X)
+
+        logger.info(
+            f"Quantized {self._prediction_type.value} model: "
+            f"{self._quantized.nbytes} bytes of packed nodes"
+        )
+
+    def save(
+        self,
+        path: Union[str, Path],
+        compress: Any = MODEL_COMPRESSION
+    ) -> None:
+        """
+        Save the trained model to a file with joblib.
+
+        joblib writes NumPy arrays (tree nodes, scaler statistics) as raw
+        buffers instead of pickling them element by element, and compresses
+        them on the way out.
+
+        Args:
+            path: File path to write
+            compress: joblib compression setting; pass 0 to allow
+                memory-mapped loading
+        """
+        if not self._is_trained:
+            raise RuntimeError("Model must be trained before saving")
+
+        joblib.dump({
+            "model": self._model,
+            "scaler": self._scaler,
+            "feature_names": self._feature_names,
+            "config": self._config,
+            "training_result": self._training_result,
+        }, path, compress=compress)
+
+    def load(
+        self,
+        path: Union[str, Path],
+        mmap_mode: Optional[str] = None
+    ) -> None:
+        """
+        Load a trained model saved with save().
+
+        Plain pickle files from earlier versions load as well.
+
+        Args:
+            path: File path to read
+            mmap_mode: joblib memory-map mode (e.g. "r") for uncompressed
+                files, sharing array data across processes
+        """
+        data = joblib.load(path, mmap_mode=mmap_mode)
+
+        self._model = data["model"]
+        self._scaler = data["scaler"]
+        self._feature_names = data["feature_names"]
+        self._config = data["config"]
+        self._training_result = data["training_result"]
+        self._quantized = None
+        self._prepare_scaling()
+        self._is_trained = True
+
+    def _prepare_scaling(self) -> None:
+        """Precompute the scaler statistics _scale() applies to each batch."""
+        if self._scaler is None:
+            self._scale_params = None
+            return
+
+        dtype = self._config.dtype
+        self._scale_params = (
+            np.asarray(self._scaler.mean_, dtype=dtype),
+            np.asarray(1.0 / self._scaler.scale_, dtype=dtype),
+        )
+
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """
+        Apply the fitted StandardScaler with two ufunc calls.
+
+        Gives the values of self._scaler.transform(X), up to rounding of
+        the reciprocal scale, but skips sklearn's input validation and
+        allocates a single output array per call instead of two. The
+        result is a fresh array, so concurrent predict() calls are safe.
+        """
+        if self._scale_params is None:
+            return X
+
+        X = np.asarray(X)
+        dtype = X.dtype if X.dtype in (np.float32, np.float64) else np.float64
+        mean, inv_scale = self._scale_params
+
+        out = np.subtract(X, mean, dtype=dtype)
+        np.multiply(out, inv_scale, out=out)
+        return out
+
+    def predict(
+        self,
+        X: np.ndarray,
+        case_ids: Optional[List[str]] = None
+    ) -> List[Prediction]:
+        """Make predictions on feature matrix."""
+        raise NotImplementedError("Subclasses must implement predict")
+
+    def predict_from_trace(
+        self,
+        trace: List[Dict[str, Any]],
+        case_id: str = ""
+    ) -> Prediction:
+        """
+        Make prediction from an event trace.
+
+        Args:
+            trace: List of events with 'activity' and 'timestamp' fields
+            case_id: Identifier for the process instance
+
+        Returns:
+            Prediction object
+        """
+        return self.predict_from_traces([trace], [case_id])[0]
+
+    def predict_from_traces(
+        self,
+        traces: List[List[Dict[str, Any]]],
+        case_ids: Optional[List[str]] = None
+    ) -> List[Prediction]:
+        """
+        Make predictions for many event traces with a single model call.
+
+        Feature vectors are stacked into one matrix so the estimator's
+        fixed per-call overhead is paid once per batch rather than once
+        per trace. Prefer this over repeated predict_from_trace calls.
+
+        Args:
+            traces: Event traces, each a list of events with 'activity'
+                and 'timestamp' fields
+            case_ids: Identifiers for the process instances (default "")
+
+        Returns:
+            List of Prediction objects, one per trace
+        """
+        if not traces:
+            return []
+        if case_ids is None:
+            case_ids = [""] * len(traces)
+
+        features = [
+            self._feature_extractor.extract(trace, case_id)
+            for trace, case_id in zip(traces, case_ids)
+        ]
+        predictions = self.predict(
+            np.vstack([f.feature_vector for f in features]),
+            case_ids=list(case_ids),
+        )
+        for prediction, extracted in zip(predictions, features):
+            prediction.features_used = extracted.feature_dict
+        return predictions
+
     def _get_feature_importances(self) -> Dict[str, float]:
         """Get feature importance scores."""
         if self._model is None or not self._feature_names:
             return {}
 
-        importances = {}
         if hasattr(self._model, "feature_importances_"):
-            for name, importance in zip(
-                self._feature_names, self._model.feature_importances_
-            ):
-                importances[name] = float(importance)
+            importances = np.asarray(self._model.feature_importances_)
         elif hasattr(self._model, "coef_"):
             coef = self._model.coef_
             if coef.ndim > 1:
                 coef = coef[0]
-            for name, importance in zip(self._feature_names, np.abs(coef)):
-                importances[name] = float(importance)
+            importances = np.abs(coef)
+        elif hasattr(self._model, "_predictors"):
+            # HistGradientBoosting: total split gain per feature, normalized
+            importances = np.zeros(len(self._feature_names))
+            for predictors in self._model._predictors:
+                for predictor in predictors:
+                    splits = predictor.nodes[~predictor.nodes["is_leaf"].astype(bool)]
+                    np.add.at(importances, splits["feature_idx"], splits["gain"])
+            if importances.sum() > 0:
+                importances /= importances.sum()
+        else:
+            return {}
 
-        # Sort by importance
-        importances = dict(
-            sorted(importances.items(), key=lambda x: x[1], reverse=True)
-        )
-        return importances
+        # Sort by importance (stable, so ties keep feature order)
+        importances = importances[:len(self._feature_names)].astype(np.float64)
+        order = np.argsort(-importances, kind="stable")
+        return dict(zip(
+            [self._feature_names[i] for i in order],
+            importances[order].tolist(),
+        ))
 
 
 class ClassificationModel(PredictiveModel):
@@ -344,11 +889,7 @@ class ClassificationModel(PredictiveModel):
                 n_jobs=-1,
             )
         elif config.model_type == ModelType.GRADIENT_BOOSTING:
-            return GradientBoostingClassifier(
-                n_estimators=config.n_estimators,
-                max_depth=config.max_depth,
-                random_state=config.random_state,
-            )
+            return self._gradient_boosting(config.n_estimators)
         elif config.model_type == ModelType.LOGISTIC_REGRESSION:
             return LogisticRegression(
                 random_state=config.random_state,
@@ -361,25 +902,34 @@ class ClassificationModel(PredictiveModel):
                 random_state=config.random_state,
                 n_jobs=-1,
             )
-            gb = GradientBoostingClassifier(
-                n_estimators=config.n_estimators // 2,
-                max_depth=config.max_depth,
-                random_state=config.random_state,
-            )
+            gb = self._gradient_boosting(config.n_estimators // 2)
             lr = LogisticRegression(
                 random_state=config.random_state,
                 max_iter=1000,
             )
-            return VotingClassifier(
+            return _ThreadedVotingClassifier(
                 estimators=[("rf", rf), ("gb", gb), ("lr", lr)],
                 voting="soft",
+                n_jobs=-1,
             )
         else:
-            return GradientBoostingClassifier(
-                n_estimators=config.n_estimators,
+            return self._gradient_boosting(config.n_estimators)
+
+    def _gradient_boosting(self, n_estimators: int) -> Any:
+        """Create the boosted-tree classifier (histogram-based unless disabled)."""
+        config = self._config
+        if config.use_histogram:
+            return HistGradientBoostingClassifier(
+                max_iter=n_estimators,
                 max_depth=config.max_depth,
                 random_state=config.random_state,
+                early_stopping=False,
             )
+        return GradientBoostingClassifier(
+            n_estimators=n_estimators,
+            max_depth=config.max_depth,
+            random_state=config.random_state,
+        )
 
     def train(
         self,
@@ -398,16 +948,22 @@ class ClassificationModel(PredictiveModel):
         Returns:
             TrainingResult with evaluation metrics
         """
+        X = np.ascontiguousarray(X, dtype=self._config.dtype)
         self._feature_names = feature_names or [
             f"feature_{i}" for i in range(X.shape[1])
         ]
 
-        # Scale features if configured
-        if self._config.scale_features:
+        # Scale features if configured; histogram GBMs bin features instead
+        model = self._create_model()
+        if self._config.scale_features and not isinstance(
+            model, (HistGradientBoostingClassifier, HistGradientBoostingRegressor)
+        ):
             self._scaler = StandardScaler()
             X_scaled = self._scaler.fit_transform(X)
         else:
+            self._scaler = None
             X_scaled = X
+        self._prepare_scaling()
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
@@ -417,8 +973,9 @@ class ClassificationModel(PredictiveModel):
             stratify=y,
         )
 
-        # Create and train model
-        self._model = self._create_model()
+        # Train model
+        self._model = model
+        self._quantized = None
         self._model.fit(X_train, y_train)
 
         # Evaluate
@@ -460,17 +1017,20 @@ class ClassificationModel(PredictiveModel):
     def predict(
         self,
         X: np.ndarray,
-        case_ids: Optional[List[str]] = None
-    ) -> List[Prediction]:
+        case_ids: Optional[List[str]] = None,
+        return_batch: bool = False
+    ) -> Union[List[Prediction], PredictionBatch]:
         """
         Make predictions on feature matrix.
 
         Args:
             X: Feature matrix (n_samples, n_features)
             case_ids: Optional case identifiers
+            return_batch: Return a column-oriented PredictionBatch instead
+                of a list of Prediction objects
 
         Returns:
-            List of Prediction objects
+            List of Prediction objects (or a PredictionBatch)
         """
         if not self._is_trained:
             raise RuntimeError("Model must be trained before prediction")
@@ -479,52 +1039,27 @@ class ClassificationModel(PredictiveModel):
             case_ids = [f"case_{i}" for i in range(X.shape[0])]
 
         # Scale features
-        if self._scaler is not None:
-            X_scaled = self._scaler.transform(X)
-        else:
-            X_scaled = X
-
-        # Predict
-        y_pred = self._model.predict(X_scaled)
-        y_proba = self._model.predict_proba(X_scaled)[:, 1]
-
-        predictions = []
-        for i, (case_id, pred, proba) in enumerate(zip(case_ids, y_pred, y_proba)):
-            confidence = self._get_confidence_level(proba)
-            predictions.append(Prediction(
-                case_id=case_id,
-                prediction_type=self._prediction_type,
-                predicted_value=bool(pred),
-                probability=float(proba),
-                confidence=confidence,
-                value_type=ValueType.PROBABILITY,  # This IS a real probability
-            ))
-
-        return predictions
-
-    def predict_from_trace(
-        self,
-        trace: List[Dict[str, Any]],
-        case_id: str = ""
-    ) -> Prediction:
-        """
-        Make prediction from an event trace.
+        X_scaled = self._scale(np.ascontiguousarray(X, dtype=self._config.dtype))
 
-        Args:
-            trace: List of events with 'activity' and 'timestamp' fields
-            case_id: Identifier for the process instance
+        # Predict: one predict_proba pass; labels are the argmax class, which
+        # is what predict() would have returned for these estimators
+        if self._quantized is not None:
+            y_proba = self._quantized.predict(X_scaled)
+            proba_matrix = np.column_stack((1.0 - y_proba, y_proba))
+        else:
+            proba_matrix = self._model.predict_proba(X_scaled)
+        y_pred = self._model.classes_.take(np.argmax(proba_matrix, axis=1))
+        y_proba = proba_matrix[:, 1].astype(np.float64, copy=False)
 
-        Returns:
-            Prediction object
-        """
-        features = self._feature_extractor.extract(trace, case_id)
-        predictions = self.predict(
-            features.feature_vector.reshape(1, -1),
-            case_ids=[case_id]
+        batch = PredictionBatch(
+            case_ids=list(case_ids),
+            prediction_type=self._prediction_type,
+            predicted_values=y_pred.astype(bool),
+            confidences=self._get_confidence_levels(y_proba),
+            value_type=ValueType.PROBABILITY,  # This IS a real probability
+            probabilities=y_proba,
         )
-        prediction = predictions[0]
-        prediction.features_used = features.feature_dict
-        return prediction
+        return batch if return_batch else batch.to_predictions()
 
     def _get_confidence_level(self, probability: float) -> str:
         """Determine confidence level from probability."""
@@ -535,6 +1070,18 @@ class ClassificationModel(PredictiveModel):
         else:
             return "low"
 
+    @staticmethod
+    def _get_confidence_levels(probabilities: np.ndarray) -> np.ndarray:
+        """Vectorized _get_confidence_level over an array of probabilities."""
+        return np.select(
+            [
+                (probabilities < 0.3) | (probabilities > 0.7),
+                (probabilities < 0.4) | (probabilities > 0.6),
+            ],
+            ["high", "medium"],
+            default="low",
+        )
+
 
 class RegressionModel(PredictiveModel):
     """
@@ -558,6 +1105,9 @@ class RegressionModel(PredictiveModel):
         print(f"Estimated completion: {prediction.predicted_value} hours")
     """
 
+    # (forest, stacked node arrays) for the Numba interval kernel
+    _tree_arrays: Optional[Tuple[Any, Tuple[np.ndarray, ...]]] = None
+
     def _create_model(self) -> Any:
         """Create the regression model."""
         config = self._config
@@ -570,11 +1120,7 @@ class RegressionModel(PredictiveModel):
                 n_jobs=-1,
             )
         elif config.model_type == ModelType.GRADIENT_BOOSTING:
-            return GradientBoostingRegressor(
-                n_estimators=config.n_estimators,
-                max_depth=config.max_depth,
-                random_state=config.random_state,
-            )
+            return self._gradient_boosting(config.n_estimators)
         elif config.model_type == ModelType.RIDGE_REGRESSION:
             return Ridge(random_state=config.random_state)
         elif config.model_type == ModelType.ENSEMBLE:
@@ -584,21 +1130,30 @@ class RegressionModel(PredictiveModel):
                 random_state=config.random_state,
                 n_jobs=-1,
             )
-            gb = GradientBoostingRegressor(
-                n_estimators=config.n_estimators // 2,
-                max_depth=config.max_depth,
-                random_state=config.random_state,
-            )
+            gb = self._gradient_boosting(config.n_estimators // 2)
             ridge = Ridge(random_state=config.random_state)
-            return VotingRegressor(
+            return _ThreadedVotingRegressor(
                 estimators=[("rf", rf), ("gb", gb), ("ridge", ridge)],
+                n_jobs=-1,
             )
         else:
-            return GradientBoostingRegressor(
-                n_estimators=config.n_estimators,
+            return self._gradient_boosting(config.n_estimators)
+
+    def _gradient_boosting(self, n_estimators: int) -> Any:
+        """Create the boosted-tree regressor (histogram-based unless disabled)."""
+        config = self._config
+        if config.use_histogram:
+            return HistGradientBoostingRegressor(
+                max_iter=n_estimators,
                 max_depth=config.max_depth,
                 random_state=config.random_state,
+                early_stopping=False,
             )
+        return GradientBoostingRegressor(
+            n_estimators=n_estimators,
+            max_depth=config.max_depth,
+            random_state=config.random_state,
+        )
 
     def train(
         self,
@@ -617,16 +1172,22 @@ class RegressionModel(PredictiveModel):
         Returns:
             TrainingResult with evaluation metrics
         """
+        X = np.ascontiguousarray(X, dtype=self._config.dtype)
         self._feature_names = feature_names or [
             f"feature_{i}" for i in range(X.shape[1])
         ]
 
-        # Scale features if configured
-        if self._config.scale_features:
+        # Scale features if configured; histogram GBMs bin features instead
+        model = self._create_model()
+        if self._config.scale_features and not isinstance(
+            model, (HistGradientBoostingClassifier, HistGradientBoostingRegressor)
+        ):
             self._scaler = StandardScaler()
             X_scaled = self._scaler.fit_transform(X)
         else:
+            self._scaler = None
             X_scaled = X
+        self._prepare_scaling()
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
@@ -635,8 +1196,9 @@ class RegressionModel(PredictiveModel):
             random_state=self._config.random_state,
         )
 
-        # Create and train model
-        self._model = self._create_model()
+        # Train model
+        self._model = model
+        self._quantized = None
         self._model.fit(X_train, y_train)
 
         # Evaluate
@@ -676,17 +1238,20 @@ class RegressionModel(PredictiveModel):
     def predict(
         self,
         X: np.ndarray,
-        case_ids: Optional[List[str]] = None
-    ) -> List[Prediction]:
+        case_ids: Optional[List[str]] = None,
+        return_batch: bool = False
+    ) -> Union[List[Prediction], PredictionBatch]:
         """
         Make predictions on feature matrix.
 
         Args:
             X: Feature matrix (n_samples, n_features)
             case_ids: Optional case identifiers
+            return_batch: Return a column-oriented PredictionBatch instead
+                of a list of Prediction objects
 
         Returns:
-            List of Prediction objects
+            List of Prediction objects (or a PredictionBatch)
         """
         if not self._is_trained:
             raise RuntimeError("Model must be trained before prediction")
@@ -695,76 +1260,93 @@ class RegressionModel(PredictiveModel):
             case_ids = [f"case_{i}" for i in range(X.shape[0])]
 
         # Scale features
-        if self._scaler is not None:
-            X_scaled = self._scaler.transform(X)
-        else:
-            X_scaled = X
+        X_scaled = self._scale(np.ascontiguousarray(X, dtype=self._config.dtype))
 
         # Predict
-        y_pred = self._model.predict(X_scaled)
+        if self._quantized is not None:
+            y_pred = self._quantized.predict(X_scaled)
+        else:
+            y_pred = self._model.predict(X_scaled)
 
         # Estimate prediction intervals using ensemble variance (if available)
         # For RandomForest, we can use individual tree predictions
+        y_pred = np.asarray(y_pred, dtype=np.float64)
         prediction_intervals = self._estimate_prediction_intervals(X_scaled, y_pred)
 
-        predictions = []
-        for i, (case_id, pred) in enumerate(zip(case_ids, y_pred)):
+        batch = PredictionBatch(
+            case_ids=list(case_ids),
+            prediction_type=self._prediction_type,
+            predicted_values=y_pred,
             # Derive confidence from prediction interval width
-            interval = prediction_intervals[i] if prediction_intervals else None
-            confidence = self._get_regression_confidence(pred, interval)
-
-            predictions.append(Prediction(
-                case_id=case_id,
-                prediction_type=self._prediction_type,
-                predicted_value=float(pred),
-                probability=None,  # Regression models DON'T produce probabilities
-                confidence=confidence,
-                value_type=ValueType.RAW,  # This is RAW hours, NOT a probability
-                prediction_interval=interval,
-            ))
-
-        return predictions
+            confidences=self._get_regression_confidences(y_pred, prediction_intervals),
+            value_type=ValueType.RAW,  # This is RAW hours, NOT a probability
+            prediction_intervals=prediction_intervals,
+        )
+        return batch if return_batch else batch.to_predictions()
 
     def _estimate_prediction_intervals(
         self,
         X: np.ndarray,
         y_pred: np.ndarray,
         confidence_level: float = 0.9
-    ) -> Optional[List[Tuple[float, float]]]:
+    ) -> Optional[np.ndarray]:
         """
         Estimate prediction intervals for regression predictions.
 
         For ensemble models, uses variance across trees.
-        Returns None if intervals cannot be estimated.
+        Returns an (n_samples, 2) array of lower/upper bounds, or None if
+        intervals cannot be estimated.
         """
+        z = 1.645 if confidence_level == 0.9 else 1.96
         try:
-            if hasattr(self._model, 'estimators_'):
-                # RandomForest or ensemble: use tree predictions variance
-                tree_preds = np.array([
-                    tree.predict(X) for tree in self._model.estimators_
-                ])
-                std = np.std(tree_preds, axis=0)
-                # Approximate 90% CI: mean +/- 1.645 * std
-                z = 1.645 if confidence_level == 0.9 else 1.96
-                intervals = [
-                    (float(pred - z * s), float(pred + z * s))
-                    for pred, s in zip(y_pred, std)
-                ]
-                return intervals
-            else:
+            if isinstance(self._model, RandomForestRegressor):
+                # RandomForest: spread of the individual tree predictions
+                std = self._forest_std(X)
+            elif hasattr(self._model, 'estimators_'):
+                # Other ensembles: spread of the member predictions
+                std = np.std(
+                    [estimator.predict(X) for estimator in self._model.estimators_],
+                    axis=0,
+                )
+            elif self._training_result and 'rmse' in self._training_result.metrics:
                 # Single model: use training RMSE as rough estimate
-                if self._training_result and 'rmse' in self._training_result.metrics:
-                    rmse = self._training_result.metrics['rmse']
-                    z = 1.645 if confidence_level == 0.9 else 1.96
-                    intervals = [
-                        (float(pred - z * rmse), float(pred + z * rmse))
-                        for pred in y_pred
-                    ]
-                    return intervals
+                std = self._training_result.metrics['rmse']
+            else:
+                return None
+
+            # Approximate 90% CI: mean +/- z * std
+            y_pred = np.asarray(y_pred, dtype=np.float64)
+            return np.column_stack((y_pred - z * std, y_pred + z * std))
         except Exception:
             pass
         return None
 
+    def _forest_std(self, X: np.ndarray) -> np.ndarray:
+        """
+        Standard deviation of per-tree predictions of the random forest.
+
+        Streams over trees with Welford's algorithm, so memory stays
+        O(n_samples) instead of O(n_trees * n_samples). With Numba the
+        traversal runs in parallel over samples on node arrays extracted
+        once per fitted forest.
+        """
+        forest = self._model
+        if NUMBA_AVAILABLE:
+            if self._tree_arrays is None or self._tree_arrays[0] is not forest:
+                self._tree_arrays = (forest, _stack_tree_arrays(forest))
+            # Trees compare float32 features against float64 thresholds
+            X = np.ascontiguousarray(X, dtype=np.float32)
+            return _forest_mean_std(*self._tree_arrays[1], X)[1]
+
+        mean = np.zeros(X.shape[0])
+        m2 = np.zeros(X.shape[0])
+        for k, tree in enumerate(forest.estimators_, start=1):
+            value = tree.predict(X)
+            delta = value - mean
+            mean += delta / k
+            m2 += delta * (value - mean)
+        return np.sqrt(m2 / len(forest.estimators_))
+
     def _get_regression_confidence(
         self,
         prediction: float,
@@ -798,29 +1380,25 @@ class RegressionModel(PredictiveModel):
         else:
             return "low"
 
-    def predict_from_trace(
-        self,
-        trace: List[Dict[str, Any]],
-        case_id: str = ""
-    ) -> Prediction:
-        """
-        Make prediction from an event trace.
-
-        Args:
-            trace: List of events with 'activity' and 'timestamp' fields
-            case_id: Identifier for the process instance
-
-        Returns:
-            Prediction object
-        """
-        features = self._feature_extractor.extract(trace, case_id)
-        predictions = self.predict(
-            features.feature_vector.reshape(1, -1),
-            case_ids=[case_id]
+    @staticmethod
+    def _get_regression_confidences(
+        predictions: np.ndarray,
+        intervals: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Vectorized _get_regression_confidence over a batch."""
+        if intervals is None:
+            return np.full(len(predictions), "unknown")
+
+        lower, upper = intervals[:, 0], intervals[:, 1]
+        scale = np.where(
+            predictions > 0, predictions, np.fmax(1.0, np.abs(upper))
+        )
+        relative_width = (upper - lower) / scale
+        return np.select(
+            [relative_width < 0.2, relative_width < 0.5],
+            ["high", "medium"],
+            default="low",
         )
-        prediction = predictions[0]
-        prediction.features_used = features.feature_dict
-        return prediction
 
 
 class PredictiveMonitor:
@@ -842,6 +1420,10 @@ class PredictiveMonitor:
         predictions = monitor.predict_all(trace, case_id="ORDER001")
         for pred in predictions:
             print(f"{pred.prediction_type.value}: {pred.predicted_value}")
+
+        # Scoring many cases: accumulate them and call batch_predict, which
+        # issues one model call per prediction type for the whole batch
+        results = monitor.batch_predict(open_cases)
     """
 
     def __init__(
@@ -1002,6 +1584,8 @@ class PredictiveMonitor:
         """
         Make predictions for multiple cases.
 
+        Each trained model scores all cases in a single batched call.
+
         Args:
             cases: List of cases with events
             case_id_field: Field name for case ID
@@ -1010,16 +1594,35 @@ class PredictiveMonitor:
         Returns:
             Dictionary mapping case_id to list of predictions
         """
-        results: Dict[str, List[Prediction]] = {}
-
-        for case in cases:
-            case_id = str(case.get(case_id_field, "unknown"))
-            events = case.get(events_field, [])
+        case_ids = [str(case.get(case_id_field, "unknown")) for case in cases]
+        traces = [case.get(events_field, []) for case in cases]
+        per_case: List[List[Prediction]] = [[] for _ in cases]
 
-            predictions = self.predict_all(events, case_id)
-            results[case_id] = predictions
-
-        return results
+        for prediction_type, model in self._models.items():
+            if not model.is_trained:
+                continue
+            try:
+                batch = model.predict_from_traces(traces, case_ids)
+            except Exception as e:
+                # Fall back to per-case prediction so one bad trace only
+                # drops its own result
+                logger.warning(
+                    f"Batch prediction failed for {prediction_type.value}: {e}"
+                )
+                batch = []
+                for trace, case_id in zip(traces, case_ids):
+                    try:
+                        batch.append(model.predict_from_trace(trace, case_id))
+                    except Exception as e:
+                        logger.warning(
+                            f"Prediction failed for {prediction_type.value}: {e}"
+                        )
+                        batch.append(None)
+            for predictions, prediction in zip(per_case, batch):
+                if prediction is not None:
+                    predictions.append(prediction)
+
+        return dict(zip(case_ids, per_case))
 
     def save(self, path: Union[str, Path]) -> None:
         """
@@ -1033,15 +1636,7 @@ class PredictiveMonitor:
 
         for prediction_type, model in self._models.items():
             if model.is_trained:
-                model_path = path / f"{prediction_type.value}.pkl"
-                with open(model_path, "wb") as f:
-                    pickle.dump({
-                        "model": model._model,
-                        "scaler": model._scaler,
-                        "feature_names": model._feature_names,
-                        "config": model._config,
-                        "training_result": model._training_result,
-                    }, f)
+                model.save(path / f"{prediction_type.value}.pkl")
 
         logger.info(f"Saved models to {path}")
 
@@ -1062,20 +1657,12 @@ class PredictiveMonitor:
                 logger.warning(f"Unknown prediction type: {prediction_type_str}")
                 continue
 
-            with open(model_file, "rb") as f:
-                data = pickle.load(f)
-
             # Determine model class from prediction type
             if prediction_type == PredictionType.COMPLETION_TIME:
-                model = RegressionModel(prediction_type, data["config"])
+                model = RegressionModel(prediction_type)
             else:
-                model = ClassificationModel(prediction_type, data["config"])
-
-            model._model = data["model"]
-            model._scaler = data["scaler"]
-            model._feature_names = data["feature_names"]
-            model._training_result = data["training_result"]
-            model._is_trained = True
+                model = ClassificationModel(prediction_type)
+            model.load(model_file)
 
             self._models[prediction_type] = model
 
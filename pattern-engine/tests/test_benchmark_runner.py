@@ -0,0 +1,328 @@
+"""
+Tests for the benchmark runner.
+
+Uses in-process stub benchmarks so no dataset is downloaded or read.
+"""
+
+import gzip
+import json
+import os
+import time
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from src.benchmark import runner as runner_module
+from src.benchmark.runner import (
+    BPI2019Benchmark,
+    BenchmarkResult,
+    BenchmarkRunner,
+    DatasetBenchmark,
+    MAX_RESULT_WARNINGS,
+    _WarningLog,
+)
+
+
+class StubBenchmark(DatasetBenchmark):
+    """Benchmark that returns a canned result and counts its runs."""
+
+    def __init__(self, name, success=True, fingerprint=None):
+        self._name = name
+        self.success = success
+        self.fingerprint = fingerprint
+        self.runs = 0
+        self.prefetched = 0
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def description(self):
+        return f"Stub benchmark {self._name}"
+
+    def prefetch(self):
+        self.prefetched += 1
+
+    def dataset_fingerprint(self):
+        return self.fingerprint
+
+    def run(self, sample_size=None):
+        self.runs += 1
+        return BenchmarkResult(
+            dataset_name=self._name,
+            success=self.success,
+            duration_seconds=0.0,
+            metrics={'load': {'total_events': 10}},
+            errors=[] if self.success else ['download failed'],
+        )
+
+
+@pytest.fixture
+def runner():
+    """Runner without prefetch or default benchmarks."""
+    runner = BenchmarkRunner(prefetch=False)
+    runner.benchmarks = []
+    return runner
+
+
+class TestRunBenchmarkCache:
+    """Tests for run_benchmark() result memoization."""
+
+    def test_success_is_cached(self, runner):
+        """Test a successful result is reused until forced."""
+        stub = StubBenchmark('Stub')
+        runner.add_benchmark(stub)
+
+        first = runner.run_benchmark('stub', sample_size=10)
+        second = runner.run_benchmark('stub', sample_size=10)
+
+        assert second is first
+        assert stub.runs == 1
+
+        runner.run_benchmark('stub', sample_size=10, force=True)
+        assert stub.runs == 2
+
+    def test_failure_is_not_cached(self, runner):
+        """Test a failed result is re-run on the next call."""
+        stub = StubBenchmark('Stub', success=False)
+        runner.add_benchmark(stub)
+
+        runner.run_benchmark('stub', sample_size=10)
+        runner.run_benchmark('stub', sample_size=10)
+
+        assert stub.runs == 2
+
+    def test_disk_cache_shared_across_runners(self, tmp_path):
+        """Test a persisted result is reused by a new runner."""
+        stubs = [StubBenchmark('Stub', fingerprint='abc123') for _ in range(2)]
+        results = []
+        for stub in stubs:
+            runner = BenchmarkRunner(prefetch=False, cache_dir=str(tmp_path))
+            runner.benchmarks = []
+            runner.add_benchmark(stub)
+            results.append(runner.run_benchmark('stub', sample_size=10))
+
+        assert [stub.runs for stub in stubs] == [1, 0]
+        assert results[1].dataset_name == results[0].dataset_name
+
+    def test_unknown_benchmark(self, runner):
+        """Test an unregistered name returns None."""
+        assert runner.run_benchmark('missing') is None
+
+
+class TestPrefetch:
+    """Tests for background dataset prefetch."""
+
+    def test_registration_does_not_prefetch(self):
+        """Test adding a benchmark starts no background load."""
+        runner = BenchmarkRunner()
+        stub = StubBenchmark('Stub')
+        runner.add_benchmark(stub)
+
+        assert stub.prefetched == 0
+
+    def test_prefetch_selected_only(self):
+        """Test only the named benchmarks are prefetched."""
+        runner = BenchmarkRunner()
+        runner.benchmarks = []
+        first, second = StubBenchmark('First'), StubBenchmark('Second')
+        runner.add_benchmark(first)
+        runner.add_benchmark(second)
+
+        runner.prefetch_benchmarks(['second'])
+
+        assert (first.prefetched, second.prefetched) == (0, 1)
+
+    def test_prefetch_disabled(self, runner):
+        """Test prefetch=False turns prefetch_benchmarks() into a no-op."""
+        stub = StubBenchmark('Stub')
+        runner.add_benchmark(stub)
+
+        runner.prefetch_benchmarks()
+
+        assert stub.prefetched == 0
+
+
+class TestGenerateReport:
+    """Tests for markdown report generation."""
+
+    def test_returns_text(self, runner):
+        """Test the report text lists each result."""
+        runner.add_benchmark(StubBenchmark('Stub'))
+        runner.run_benchmark('stub')
+
+        report = runner.generate_report()
+
+        assert report.startswith("# SAP Workflow Mining Benchmark Results")
+        assert "| Stub | ✅ PASS |" in report
+        assert "10 events loaded" in report
+
+    def test_file_matches_returned_text(self, runner, tmp_path):
+        """Test writing to a file still returns the same text."""
+        runner.add_benchmark(StubBenchmark('Stub'))
+        runner.run_benchmark('stub')
+        path = tmp_path / 'report.md'
+
+        report = runner.generate_report(str(path))
+
+        assert report == path.read_text(encoding='utf-8')
+
+    def test_stream_only(self, runner, tmp_path):
+        """Test return_text=False writes the file and returns None."""
+        runner.add_benchmark(StubBenchmark('Stub'))
+        runner.run_benchmark('stub')
+        path = tmp_path / 'report.md'
+
+        assert runner.generate_report(str(path), return_text=False) is None
+        assert "| Stub | ✅ PASS |" in path.read_text(encoding='utf-8')
+
+    def test_warning_overflow_counted(self, runner):
+        """Test the report counts warnings beyond those kept."""
+        runner.results = [BenchmarkResult(
+            dataset_name='Stub',
+            success=True,
+            duration_seconds=0.0,
+            warnings=[f"warning {i}" for i in range(MAX_RESULT_WARNINGS)],
+            warnings_dropped=50,
+        )]
+
+        report = runner.generate_report()
+
+        assert "- warning 0\n" in report
+        assert f"- ... and {MAX_RESULT_WARNINGS + 45} more" in report
+
+
+class TestWarningLog:
+    """Tests for per-result warning collection."""
+
+    def test_keeps_first_warnings(self):
+        """Test the earliest warnings are kept and later ones counted."""
+        log = _WarningLog(limit=3)
+        log.append('first')
+        log.extend(['second', 'third', 'fourth'])
+        log.append('fifth')
+
+        assert log.kept == ['first', 'second', 'third']
+        assert log.dropped == 2
+
+
+class SlowStubBenchmark(StubBenchmark):
+    """Stub that finishes after a delay, to reorder completion."""
+
+    def __init__(self, name, delay):
+        super().__init__(name)
+        self.delay = delay
+
+    def run(self, sample_size=None):
+        time.sleep(self.delay)
+        return super().run(sample_size)
+
+
+class TestRunAllBenchmarks:
+    """Tests for concurrent run_all_benchmarks()."""
+
+    def test_registration_order(self, runner, capsys):
+        """Test results and printed summaries follow registration order."""
+        runner.add_benchmark(SlowStubBenchmark('Slow', delay=0.2))
+        runner.add_benchmark(SlowStubBenchmark('Fast', delay=0.0))
+
+        results = runner.run_all_benchmarks(sample_size=10)
+        out = capsys.readouterr().out
+
+        assert [r.dataset_name for r in results] == ['Slow', 'Fast']
+        assert out.index('Slow') < out.index('Fast')
+
+    def test_crash_becomes_failed_result(self, runner):
+        """Test an exception in run() is reported as a failed result."""
+        crashing = StubBenchmark('Crash')
+        crashing.run = lambda sample_size=None: 1 / 0
+        runner.add_benchmark(crashing)
+        runner.add_benchmark(StubBenchmark('Stub'))
+
+        results = runner.run_all_benchmarks()
+
+        assert [r.success for r in results] == [False, True]
+        assert 'division by zero' in results[0].errors[0]
+
+
+BPI_CSV = (
+    "case concept:name,event concept:name,event time:timestamp\n"
+    "4500000001_00001,Create Purchase Order Item,2018-01-02 10:00:00.000\n"
+)
+
+
+class TestBPI2019Source:
+    """Tests for BPI 2019 Parquet snapshot reuse."""
+
+    def test_fresh_snapshot_reused(self, tmp_path):
+        """Test a snapshot newer than the CSV is used as is."""
+        csv_path = tmp_path / 'BPI_Challenge_2019.csv'
+        csv_path.write_text(BPI_CSV)
+        snapshot = tmp_path / 'BPI_Challenge_2019.parquet'
+        snapshot.write_bytes(b'placeholder')
+
+        benchmark = BPI2019Benchmark(csv_path=str(csv_path))
+        benchmark._resolve_source(True)
+
+        assert benchmark.parquet_path == str(snapshot)
+        assert snapshot.read_bytes() == b'placeholder'
+
+    def test_stale_snapshot_rebuilt(self, tmp_path):
+        """Test a snapshot older than the CSV is rebuilt from it."""
+        csv_path = tmp_path / 'BPI_Challenge_2019.csv'
+        csv_path.write_text(BPI_CSV)
+        snapshot = tmp_path / 'BPI_Challenge_2019.parquet'
+        snapshot.write_bytes(b'stale')
+        os.utime(snapshot, (0, 0))
+
+        benchmark = BPI2019Benchmark(csv_path=str(csv_path))
+        benchmark._resolve_source(True)
+
+        assert benchmark.parquet_path == str(snapshot)
+        assert snapshot.read_bytes()[:4] == b'PAR1'
+
+    def test_gzipped_csv_snapshot_path(self, tmp_path):
+        """Test a .csv.gz export shares load_from_csv's snapshot path."""
+        csv_path = tmp_path / 'BPI_Challenge_2019.csv.gz'
+        with gzip.open(csv_path, 'wt') as f:
+            f.write(BPI_CSV)
+
+        benchmark = BPI2019Benchmark(csv_path=str(csv_path))
+        benchmark._resolve_source(True)
+
+        assert benchmark.parquet_path == str(tmp_path / 'BPI_Challenge_2019.parquet')
+
+
+METRICS = {
+    'naive': datetime(2024, 1, 2, 3, 4, 5),
+    'day': date(2024, 1, 2),
+    'counts': np.arange(3),
+    'total': np.int64(5),
+    'vendor': 'Müller',
+}
+
+
+class TestDumps:
+    """The json fallback of _dumps() must write what orjson writes."""
+
+    def test_fallback_values(self, monkeypatch):
+        """Test datetimes and NumPy values are rendered as orjson renders them."""
+        monkeypatch.setattr(runner_module, 'ORJSON_AVAILABLE', False)
+
+        assert json.loads(runner_module._dumps(METRICS)) == {
+            'naive': '2024-01-02T03:04:05+00:00',
+            'day': '2024-01-02',
+            'counts': [0, 1, 2],
+            'total': 5,
+            'vendor': 'Müller',
+        }
+
+    @pytest.mark.skipif(not runner_module.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_fallback_matches_orjson(self, monkeypatch):
+        """Test both encoders write the same text."""
+        with_orjson = runner_module._dumps(METRICS)
+        monkeypatch.setattr(runner_module, 'ORJSON_AVAILABLE', False)
+
+        assert runner_module._dumps(METRICS) == with_orjson
@@ -0,0 +1,296 @@
+"""
+Tests for the BPI Challenge 2019 adapter.
+
+Each fast path (columnar conversion, DataFrame event log, Parquet and
+streaming ingest) is checked against the row-oriented path it replaces on
+a small synthetic export.
+"""
+
+import csv
+import math
+import os
+
+import pandas as pd
+import pytest
+
+from src.ingest import bpi2019_adapter
+from src.ingest.bpi2019_adapter import BPI2019Adapter
+
+
+HEADER = [
+    'case concept:name', 'event concept:name', 'event time:timestamp',
+    'case Purchasing Document', 'case Item', 'case Vendor', 'case Name',
+    'case Company', 'case Document Type', 'case Item Category',
+    'case Spend area text', 'event org:resource',
+]
+
+
+def _row(doc, item, activity, timestamp, vendor='vendorID_0001', user='user_001'):
+    """One CSV row of the synthetic export."""
+    return [
+        f'{doc}_{item}', activity, timestamp, doc, item, vendor,
+        f'Name of {vendor}', 'companyID_0000', 'Standard PO',
+        '3-way match', 'Packaging', user,
+    ]
+
+
+FULL_ROWS = [
+    _row('4500000001', '00001', 'Create Purchase Order Item', '2018-01-02 10:00:00.000'),
+    _row('4500000001', '00001', 'Record Goods Receipt', '2018-01-05 12:00:00.000'),
+    _row('4500000001', '00002', 'Create Purchase Order Item', '2018-01-02 10:05:00.000'),
+    _row('4500000001', '00001', 'Record Invoice Receipt', '2018-01-09 08:00:00.000', user='user_002'),
+    _row('4500000001', '00001', 'Clear Invoice', '2018-01-20 08:00:00.000', user='user_002'),
+    _row('4500000002', '00001', 'Create Purchase Order Item', '2018-01-03 09:00:00.000', vendor='vendorID_0002'),
+    _row('4500000002', '00001', 'Vendor creates invoice', '2018-01-04 09:00:00.000', vendor='vendorID_0002'),
+    _row('4500000003', '00001', 'Create Purchase Order Item', '', vendor='vendorID_0002'),
+    _row('4500000003', '00001', 'Change Price', '2018-02-01 09:30:00.000', vendor='vendorID_0002'),
+]
+
+NO_INVOICE_ROWS = [
+    _row('4500000001', '00001', 'Create Purchase Order Item', '2018-01-02 10:00:00.000'),
+    _row('4500000001', '00001', 'Record Goods Receipt', '2018-01-05 12:00:00.000'),
+    _row('4500000002', '00001', 'Create Purchase Order Item', '2018-01-03 09:00:00.000', vendor='vendorID_0002'),
+    _row('4500000002', '00001', 'Record Goods Receipt', '2018-01-06 11:00:00.000', vendor='vendorID_0002'),
+]
+
+
+def _write_csv(path, rows, header=HEADER):
+    """Write a synthetic BPI 2019 CSV export."""
+    with open(path, 'w', newline='', encoding='latin-1') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+def _plain(value):
+    """Normalize missing values so pandas and dict output compare equal."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+def _records(frame):
+    """DataFrame rows as dicts with missing values normalized."""
+    return [
+        {k: _plain(v) for k, v in row.items()}
+        for row in frame.to_dict('records')
+    ]
+
+
+def _workflow_columns_as_format(tables):
+    """Reshape to_workflow_columns() output like to_workflow_format()."""
+    items = {}
+    for item in _records(tables['sales_order_items']):
+        doc = item.pop('document_number')
+        items.setdefault(doc, []).append(item)
+    orders = _records(tables['sales_orders'])
+    for order in orders:
+        order['items'] = items.get(order['document_number'], [])
+    result = {name: _records(frame) for name, frame in tables.items()}
+    del result['sales_order_items']
+    result['sales_orders'] = orders
+    return result
+
+
+@pytest.fixture
+def full_csv(tmp_path):
+    """Export with creates, goods receipts, invoices and a blank timestamp."""
+    return _write_csv(tmp_path / 'BPI_Challenge_2019.csv', FULL_ROWS)
+
+
+@pytest.fixture
+def adapter(full_csv):
+    """Adapter loaded from the full export with the default reader."""
+    adapter = BPI2019Adapter()
+    adapter.load_from_csv(str(full_csv), prefer_parquet=False)
+    return adapter
+
+
+class TestWorkflowColumns:
+    """to_workflow_columns() must match to_workflow_format()."""
+
+    def test_matches_workflow_format(self, adapter):
+        """Test columnar tables hold the same rows as the dict tables."""
+        expected = {
+            name: [{k: _plain(v) for k, v in row.items()} for row in rows]
+            for name, rows in adapter.to_workflow_format().items()
+        }
+        for order in expected['sales_orders']:
+            order['items'] = [
+                {k: _plain(v) for k, v in item.items()} for item in order['items']
+            ]
+
+        assert _workflow_columns_as_format(adapter.to_workflow_columns()) == expected
+
+    def test_log_without_invoices(self, tmp_path):
+        """Test documents with no invoice events convert without error."""
+        path = _write_csv(tmp_path / 'no_invoices.csv', NO_INVOICE_ROWS)
+        adapter = BPI2019Adapter()
+        adapter.load_from_csv(str(path), prefer_parquet=False)
+
+        tables = adapter.to_workflow_columns()
+        expected = adapter.to_workflow_format()
+
+        assert len(tables['invoices']) == 0
+        assert _records(tables['deliveries']) == expected['deliveries']
+        assert tables['sales_orders']['created_date'].tolist() == [
+            order['created_date'] for order in expected['sales_orders']
+        ]
+
+
+class TestEventLog:
+    """to_event_log(as_dataframe=True) must match the list of dicts."""
+
+    @pytest.mark.parametrize('map_activities', [True, False])
+    def test_dataframe_matches_list(self, adapter, map_activities):
+        """Test both paths produce identical rows, activity mapping on or off."""
+        frame = adapter.to_event_log(map_activities=map_activities, as_dataframe=True)
+
+        assert frame.to_dict('records') == adapter.to_event_log(map_activities=map_activities)
+
+    def test_missing_timestamp_is_none(self, adapter):
+        """Test an event with a blank timestamp yields None on both paths."""
+        events = adapter.to_event_log()
+        frame = adapter.to_event_log(as_dataframe=True)
+
+        missing = [i for i, event in enumerate(events) if event['timestamp'] is None]
+        assert len(missing) == 1
+        assert frame['timestamp'].iloc[missing[0]] is None
+
+
+class TestCsvFallback:
+    """The csv.reader fallback must load what the Arrow reader loads."""
+
+    @pytest.fixture
+    def ragged_csv(self, tmp_path):
+        """Export with a short row, a long row and a blank line."""
+        rows = FULL_ROWS[:2] + [FULL_ROWS[2][:5], [], FULL_ROWS[3] + ['extra']] + FULL_ROWS[4:]
+        return _write_csv(tmp_path / 'ragged.csv', rows)
+
+    @staticmethod
+    def _load(path, arrow, monkeypatch, **kwargs):
+        monkeypatch.setattr(bpi2019_adapter, 'PYARROW_AVAILABLE', arrow)
+        adapter = BPI2019Adapter()
+        result = adapter.load_from_csv(str(path), prefer_parquet=False, **kwargs)
+        return adapter, result
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_invalid_rows_skipped_alike(self, ragged_csv, monkeypatch, workers):
+        """Test wrong-field-count rows are skipped with the same warnings."""
+        arrow, arrow_result = self._load(ragged_csv, True, monkeypatch)
+        fallback, fallback_result = self._load(
+            ragged_csv, False, monkeypatch, workers=workers
+        )
+
+        assert arrow_result.warnings == [
+            f"Row 4: expected {len(HEADER)} fields, got 5",
+            f"Row 5: expected {len(HEADER)} fields, got {len(HEADER) + 1}",
+        ]
+        assert fallback_result.warnings == arrow_result.warnings
+        assert list(fallback.iter_events()) == list(arrow.iter_events())
+        assert arrow_result.total_events == len(FULL_ROWS) - 2
+
+    @pytest.mark.parametrize('arrow,workers', [(True, 1), (False, 1), (False, 2)])
+    def test_parse_failures_numbered_by_row(self, ragged_csv, monkeypatch, arrow, workers):
+        """Test parse failures after skipped rows carry their CSV row number."""
+        parse_timestamp = BPI2019Adapter._parse_timestamp
+
+        def failing_parse(ts_str):
+            if ts_str == FULL_ROWS[5][2]:
+                raise ValueError("bad timestamp")
+            return parse_timestamp(ts_str)
+
+        monkeypatch.setattr(BPI2019Adapter, '_parse_timestamp', staticmethod(failing_parse))
+        _, result = self._load(ragged_csv, arrow, monkeypatch, workers=workers)
+
+        # Header is row 1; the blank line is not counted
+        assert result.warnings[2:] == ["Row 7: bad timestamp"]
+
+
+class TestLoadPaths:
+    """Every ingest path must yield the events of a plain CSV load."""
+
+    @staticmethod
+    def _statistics(adapter):
+        """get_statistics() with the activity set in a stable order."""
+        stats = adapter.get_statistics()
+        stats['activities'] = sorted(stats['activities'])
+        return stats
+
+    @pytest.fixture
+    def expected(self, adapter):
+        """Events and load statistics of the default CSV load."""
+        return list(adapter.iter_events()), self._statistics(adapter)
+
+    def test_worker_processes(self, full_csv, expected, monkeypatch):
+        """Test the byte-range split across processes merges in file order."""
+        monkeypatch.setattr(bpi2019_adapter, 'PYARROW_AVAILABLE', False)
+        adapter = BPI2019Adapter()
+        adapter.load_from_csv(str(full_csv), prefer_parquet=False, workers=3)
+
+        assert list(adapter.iter_events()) == expected[0]
+        assert self._statistics(adapter) == expected[1]
+
+    def test_streaming(self, full_csv, adapter, expected):
+        """Test streaming=True re-reads the same events and statistics."""
+        streamed = BPI2019Adapter()
+        streamed.load_from_csv(str(full_csv), prefer_parquet=False, streaming=True)
+
+        assert list(streamed.iter_events()) == expected[0]
+        assert self._statistics(streamed) == expected[1]
+        assert streamed.to_event_log() == adapter.to_event_log()
+
+        assert streamed.materialize() == len(expected[0])
+        assert streamed.to_workflow_format() == adapter.to_workflow_format()
+
+    def test_parquet_snapshot(self, full_csv, expected, caplog):
+        """Test a fresh sibling snapshot is preferred and loads the same events."""
+        snapshot = BPI2019Adapter.convert_csv_to_parquet(str(full_csv))
+        assert snapshot == str(full_csv.with_suffix('.parquet'))
+
+        adapter = BPI2019Adapter()
+        with caplog.at_level('INFO', logger=bpi2019_adapter.__name__):
+            adapter.load_from_csv(str(full_csv))
+
+        assert f"Using Parquet snapshot {snapshot}" in caplog.text
+
+        assert list(adapter.iter_events()) == expected[0]
+        assert self._statistics(adapter) == expected[1]
+
+    def test_parquet_snapshot_write_is_atomic(self, full_csv, monkeypatch):
+        """Test a failed snapshot write leaves no file behind."""
+        def failing_write(table, where, **kwargs):
+            with open(where, 'wb') as f:
+                f.write(b'PAR1 partial')
+            raise OSError("disk full")
+
+        monkeypatch.setattr(bpi2019_adapter.pq, 'write_table', failing_write)
+
+        with pytest.raises(OSError):
+            BPI2019Adapter.convert_csv_to_parquet(str(full_csv))
+        assert sorted(p.name for p in full_csv.parent.iterdir()) == [full_csv.name]
+
+    def test_stale_parquet_snapshot_ignored(self, full_csv, expected):
+        """Test a snapshot older than the CSV is not used."""
+        snapshot = full_csv.with_suffix('.parquet')
+        BPI2019Adapter.convert_csv_to_parquet(str(full_csv), str(snapshot))
+        _write_csv(full_csv, FULL_ROWS[:3])
+        os.utime(snapshot, (0, 0))
+
+        adapter = BPI2019Adapter()
+        adapter.load_from_csv(str(full_csv))
+
+        assert list(adapter.iter_events()) == expected[0][:3]
+
+
+class TestLoadFromPandas:
+    """load_from_pandas() must match a CSV load of the same export."""
+
+    def test_matches_csv_load(self, full_csv, adapter):
+        """Test a DataFrame of the export loads the same events."""
+        df = pd.read_csv(full_csv, dtype=str, encoding='latin-1')
+        loaded = BPI2019Adapter()
+        loaded.load_from_pandas(df)
+
+        assert list(loaded.iter_events()) == list(adapter.iter_events())
@@ -292,6 +292,25 @@ class TestConformanceChecker:
         assert hasattr(result, 'fitness_score')
         assert hasattr(result, 'deviations')
 
+    def test_quick_reject_conforming_trace(self, o2c_model, conforming_trace):
+        """A conforming trace must never be quick-rejected."""
+        checker = ConformanceChecker(o2c_model)
+        activities = [e["activity"] for e in conforming_trace]
+
+        assert checker.quick_reject(activities) is False
+        assert checker.quick_reject([]) is False
+
+    def test_quick_reject_matches_full_check(self, o2c_model):
+        """Quick-rejected traces have fitness below the threshold."""
+        checker = ConformanceChecker(o2c_model)
+        trace = [
+            {"activity": "UnknownStep"},
+            {"activity": "AnotherUnknownStep"},
+        ]
+
+        assert checker.quick_reject([e["activity"] for e in trace], threshold=0.8)
+        assert checker.check_trace(trace).fitness_score < 0.8
+
 
 class TestDefaultSeverityRules:
     """Tests for default severity rules."""
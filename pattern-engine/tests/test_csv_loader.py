@@ -13,10 +13,12 @@ from datetime import datetime
 
 from src.ingest.csv_loader import (
     CSVLoader,
+    UnifiedDocument,
     convert_csv_to_orders,
     load_csv_directory,
     VBAK_FIELD_MAP,
     VBAP_FIELD_MAP,
+    VBFA_FIELD_MAP,
 )
 
 
@@ -132,6 +134,52 @@ class TestCSVLoader:
         assert 'auart' in order
         assert 'items' in order
 
+    def test_compact_documents(self, csv_dir):
+        """Test that compact documents expand to the dict documents."""
+        kwargs = dict(
+            vbak_csv=csv_dir / 'VBAK.csv',
+            vbap_csv=csv_dir / 'VBAP.csv',
+            text_csv=csv_dir / 'texts.csv',
+        )
+        dicts = CSVLoader().load_from_csv(**kwargs).documents
+        compact = CSVLoader().load_from_csv(as_dicts=False, **kwargs).documents
+
+        assert isinstance(compact[0], UnifiedDocument)
+        assert compact[0].order.document_number == '0000000001'
+        assert [doc.to_dict() for doc in compact] == dicts
+
+    def test_parallel_load(self, csv_dir):
+        """Test that loading files concurrently gives the same result."""
+        kwargs = dict(
+            vbak_csv=csv_dir / 'VBAK.csv',
+            vbap_csv=csv_dir / 'VBAP.csv',
+            text_csv=csv_dir / 'texts.csv',
+        )
+        sequential = CSVLoader().load_from_csv(**kwargs)
+        parallel = CSVLoader().load_from_csv(workers=3, **kwargs)
+
+        assert parallel.success
+        assert parallel.documents == sequential.documents
+        assert parallel.stats == sequential.stats
+
+    def test_streaming_documents(self, csv_dir):
+        """Test that streamed documents are built on demand, once."""
+        kwargs = dict(
+            vbak_csv=csv_dir / 'VBAK.csv',
+            vbap_csv=csv_dir / 'VBAP.csv',
+        )
+        loaded = CSVLoader().load_from_csv(**kwargs)
+        streamed = CSVLoader().load_from_csv(streaming=True, **kwargs)
+
+        assert streamed.documents == []
+        assert streamed.stats['documents'] == 3
+        assert list(streamed.documents_iter()) == loaded.documents
+        assert list(streamed.documents_iter()) == []
+
+        materialized = CSVLoader().load_from_csv(streaming=True, **kwargs)
+        assert materialized.materialize() == loaded.documents
+        assert list(materialized.documents_iter()) == loaded.documents
+
     def test_items_linked_to_orders(self, csv_dir):
         """Test that items are correctly linked to orders."""
         loader = CSVLoader()
@@ -189,6 +237,35 @@ class TestCSVLoader:
             assert parsed is not None
             assert parsed.date() == expected.date()
 
+    def test_date_column_guessed_format(self):
+        """Test that the sampled format goes first without changing precedence."""
+        loader = CSVLoader()
+
+        assert loader._date_formats(['15.01.2024', '16.01.2024'])[0] == '%d.%m.%Y'
+        assert loader._date_formats(['03/04/2024'])[:2] == ['%m/%d/%Y', '%Y-%m-%d']
+
+        values = ['03/04/2024', '13/04/2024', '20240115', 'bad', None]
+        parsed = loader._date_column(values)
+        for value, date in zip(values, parsed):
+            expected = loader._parse_date(value)
+            if expected is None:
+                assert str(date) == 'NaT'
+            else:
+                assert date.astype(datetime) == expected
+
+    def test_date_column_missing_values(self):
+        """Test missing values stay NaT among integer SAP dates."""
+        loader = CSVLoader()
+
+        parsed = loader._date_column([20240118, None, 20240301])
+        assert [str(date)[:10] for date in parsed] == ['2024-01-18', 'NaT', '2024-03-01']
+
+        values = [20240118, None, 20240301, float('nan'), datetime(2024, 2, 1), '']
+        parsed = loader._date_column(values)
+        assert [str(date)[:10] for date in parsed] == [
+            '2024-01-18', 'NaT', '2024-03-01', 'NaT', '2024-02-01', 'NaT',
+        ]
+
     def test_missing_vbak_file(self, csv_dir):
         """Test error handling for missing VBAK file."""
         loader = CSVLoader()
@@ -283,6 +360,21 @@ class TestCSVDirectoryLoader:
             with pytest.raises(ValueError, match='VBAK'):
                 load_csv_directory(tmppath)
 
+    def test_load_csv_directory_case_insensitive(self):
+        """Test that export names are matched regardless of case."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / 'Vbak.Csv').write_text('VBELN,ERDAT\n0001,2024-01-10\n')
+            (tmppath / 'sales_order_items.CSV').write_text('VBELN,POSNR\n0001,10\n')
+            (tmppath / 'Doc_Flow.csv').write_text(
+                'VBELV,VBELN,VBTYP_V,VBTYP_N,ERDAT\n0001,8001,C,J,2024-01-15\n'
+            )
+
+            documents = load_csv_directory(tmppath)
+
+            assert len(documents) == 1
+            assert documents[0]['dates']['actual_delivery_date'] == '2024-01-15'
+
 
 class TestConvertCSVToOrders:
     """Tests for convert_csv_to_orders function."""
@@ -426,6 +518,91 @@ class TestEdgeCases:
         assert loader._clean_value('1234,56') == 1234.56
         assert loader._clean_value('1000') == 1000
 
+    def test_ragged_rows(self):
+        """Test that short and long rows load like csv.DictReader rows."""
+        loader = CSVLoader()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'VBAK.csv'
+            path.write_text('VBELN,NETWR,ERDAT\n0001,1000\n0002,2000,2024-01-15,extra\n')
+
+            records = loader._load_csv(path, VBAK_FIELD_MAP)
+
+            assert records == [
+                {'vbeln': '0001', 'netwr': 1000, 'erdat': None},
+                {'vbeln': '0002', 'netwr': 2000, 'erdat': '2024-01-15'},
+            ]
+
+    def test_encoding_detected_past_sample(self):
+        """Test that a non-UTF-8 byte late in the file selects latin-1 once."""
+        loader = CSVLoader()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'VBAK.csv'
+            rows = [f'{i:010d},OR' for i in range(10000)] + ['0000099999,Z\xe9']
+            path.write_bytes('VBELN,AUART\n'.encode() + '\n'.join(rows).encode('latin-1'))
+
+            records = loader._load_csv(path, VBAK_FIELD_MAP)
+
+            assert loader._detect_encoding(path) == 'latin-1'
+            assert len(records) == 10001
+            assert records[-1] == {'vbeln': '0000099999', 'auart': 'Z\xe9'}
+
+    def test_document_flow_categories(self):
+        """Test that flow categories are upper-cased on load and linked."""
+        loader = CSVLoader()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / 'VBAK.csv').write_text('VBELN,ERDAT\n0001,2024-01-10\n')
+            (tmppath / 'VBAP.csv').write_text('VBELN,POSNR\n0001,10\n')
+            (tmppath / 'VBFA.csv').write_text(
+                'VBELV,VBELN,VBTYP_V,VBTYP_N,ERDAT\n'
+                '0001,8001,c,j,2024-01-12\n'
+                '8001,9001, J ,m,2024-01-15\n'
+            )
+
+            records = loader._load_csv(tmppath / 'VBFA.csv', VBFA_FIELD_MAP)
+            result = loader.load_from_csv(
+                vbak_csv=tmppath / 'VBAK.csv',
+                vbap_csv=tmppath / 'VBAP.csv',
+                vbfa_csv=tmppath / 'VBFA.csv',
+            )
+
+            assert [(r['vbtyp_v'], r['vbtyp_n']) for r in records] == [('C', 'J'), ('J', 'M')]
+            doc = result.documents[0]
+            assert doc['deliveries'][0]['document_number'] == '8001'
+            assert doc['invoices'][0]['document_number'] == '9001'
+            assert doc['timing']['order_to_invoice_days'] == 5
+
+    def test_first_flow_dates_unordered(self):
+        """Test that the earliest delivery and invoice win regardless of order."""
+        loader = CSVLoader()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / 'VBAK.csv').write_text('VBELN,ERDAT\n0001,2024-01-10\n')
+            (tmppath / 'VBAP.csv').write_text('VBELN,POSNR\n0001,10\n')
+            (tmppath / 'VBFA.csv').write_text(
+                'VBELV,VBELN,VBTYP_V,VBTYP_N,ERDAT\n'
+                '8002,9002,J,M,2024-01-25\n'
+                '0001,8002,C,J,2024-01-20\n'
+                '8001,9001,J,M,2024-01-30\n'
+                '0001,8001,C,J,2024-01-15\n'
+                '8002,9003,J,M,2024-01-22\n'
+            )
+
+            result = loader.load_from_csv(
+                vbak_csv=tmppath / 'VBAK.csv',
+                vbap_csv=tmppath / 'VBAP.csv',
+                vbfa_csv=tmppath / 'VBFA.csv',
+            )
+
+            dates = result.documents[0]['dates']
+            assert dates['actual_delivery_date'] == '2024-01-15'
+            assert dates['invoice_date'] == '2024-01-22'
+            assert result.documents[0]['n_invoices'] == 3
+
     def test_reproducible_text_generation(self):
         """Test that synthetic text generation is reproducible with same seed."""
         with tempfile.TemporaryDirectory() as tmpdir:
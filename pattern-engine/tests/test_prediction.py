@@ -35,6 +35,7 @@ from src.prediction import (
     ModelConfig,
     ModelType,
     Prediction,
+    PredictionBatch,
     PredictionType,
     TrainingResult,
     create_late_delivery_model,
@@ -165,6 +166,16 @@ class TestFeatureExtractor:
         # Should have positive durations
         assert result.feature_dict["total_duration"] > 0
 
+    def test_inter_event_durations(self, extractor, sample_trace):
+        """Test inter-event duration statistics, in hours."""
+        result = extractor.extract(sample_trace, case_id="case_001")
+
+        # Gaps between events are 1, 23, 24 and 24 hours
+        assert result.feature_dict["avg_activity_duration"] == pytest.approx(18.0)
+        assert result.feature_dict["max_activity_duration"] == pytest.approx(24.0)
+        assert result.feature_dict["min_activity_duration"] == pytest.approx(1.0)
+        assert result.feature_dict["std_activity_duration"] == pytest.approx(np.sqrt(96.5))
+
     def test_count_features(self, extractor, sample_trace):
         """Test count features are extracted."""
         result = extractor.extract(sample_trace, case_id="case_001")
@@ -393,6 +404,45 @@ class TestClassificationModel:
 
         assert len(result.feature_importances) > 0
 
+    def test_histogram_boosting_skips_scaling(self, model, training_data):
+        """Test histogram gradient boosting trains without a scaler."""
+        X, y = training_data
+
+        model.train(X, y)
+
+        assert type(model._model).__name__ == "HistGradientBoostingClassifier"
+        assert model._scaler is None
+
+    def test_exact_gradient_boosting(self, training_data):
+        """Test use_histogram=False keeps exact gradient boosting."""
+        X, y = training_data
+        model = ClassificationModel(
+            PredictionType.LATE_DELIVERY, ModelConfig(use_histogram=False)
+        )
+
+        model.train(X, y)
+
+        assert type(model._model).__name__ == "GradientBoostingClassifier"
+        assert model._scaler is not None
+
+    def test_scale_returns_new_array(self, training_data):
+        """Test each scaled batch is a fresh array matching the scaler."""
+        X, y = training_data
+        model = ClassificationModel(
+            PredictionType.LATE_DELIVERY, ModelConfig(use_histogram=False)
+        )
+        model.train(X, y)
+
+        X = X.astype(np.float32)
+        first = model._scale(X[:10])
+        second = model._scale(X[10:20])
+
+        assert not np.shares_memory(first, second)
+        for batch, scaled in ((X[:10], first), (X[10:20], second)):
+            np.testing.assert_allclose(
+                scaled, model._scaler.transform(batch), rtol=1e-5, atol=1e-6
+            )
+
     def test_training_result_cv_scores(self, model, training_data):
         """Test training result contains CV scores."""
         X, y = training_data
@@ -411,6 +461,25 @@ class TestClassificationModel:
         assert len(predictions) == 10
         assert all(isinstance(p, Prediction) for p in predictions)
 
+    def test_model_predict_batch(self, model, training_data):
+        """Test column-oriented prediction batch matches Prediction list."""
+        X, y = training_data
+        model.train(X, y)
+
+        batch = model.predict(X[:10], return_batch=True)
+        predictions = model.predict(X[:10])
+
+        assert isinstance(batch, PredictionBatch)
+        assert len(batch) == 10
+        assert batch.probabilities.tolist() == [p.probability for p in predictions]
+        assert [
+            {k: v for k, v in d.items() if k != "timestamp"}
+            for d in batch.iter_dicts()
+        ] == [
+            {k: v for k, v in p.to_dict().items() if k != "timestamp"}
+            for p in predictions
+        ]
+
     def test_model_predict_untrained_raises(self, model, training_data):
         """Test predicting with untrained model raises error."""
         X, y = training_data
@@ -447,6 +516,60 @@ class TestClassificationModel:
         assert prediction.case_id == "case_001"
         assert len(prediction.features_used) > 0
 
+    def test_predict_from_traces(self, model, training_data):
+        """Test batched prediction matches per-trace prediction."""
+        X, y = training_data
+        model.train(X, y)
+
+        traces = [
+            [{"activity": "OrderCreated", "timestamp": "2024-01-15T10:00:00"}],
+            [
+                {"activity": "OrderCreated", "timestamp": "2024-01-15T10:00:00"},
+                {"activity": "DeliveryCreated", "timestamp": "2024-01-20T10:00:00"},
+            ],
+        ]
+
+        predictions = model.predict_from_traces(traces, case_ids=["a", "b"])
+
+        assert [p.case_id for p in predictions] == ["a", "b"]
+        for trace, prediction in zip(traces, predictions):
+            single = model.predict_from_trace(trace, case_id=prediction.case_id)
+            assert prediction.probability == single.probability
+            assert prediction.features_used == single.features_used
+        assert model.predict_from_traces([]) == []
+
+    def test_quantized_predict(self, training_data):
+        """Test quantized random forest inference tracks the float model."""
+        X, y = training_data
+        model = ClassificationModel(
+            PredictionType.LATE_DELIVERY,
+            ModelConfig(model_type=ModelType.RANDOM_FOREST, n_estimators=20),
+        )
+        model.train(X, y)
+        expected = model.predict(X)
+
+        model.quantize(X)
+        predictions = model.predict(X)
+
+        assert model.is_quantized is True
+        assert all(0 <= p.probability <= 1 for p in predictions)
+        error = max(
+            abs(p.probability - e.probability)
+            for p, e in zip(predictions, expected)
+        )
+        assert error < 1e-3
+        assert [p.predicted_value for p in predictions] == [
+            e.predicted_value for e in expected
+        ]
+
+    def test_quantize_requires_random_forest(self, model, training_data):
+        """Test quantizing a non-forest model raises error."""
+        X, y = training_data
+        model.train(X, y)
+
+        with pytest.raises(ValueError):
+            model.quantize(X)
+
 
 class TestRegressionModel:
     """Tests for RegressionModel class."""
@@ -650,6 +773,29 @@ class TestPredictiveMonitor:
         assert "001" in results
         assert "002" in results
 
+    def test_save_and_load(self, monitor, training_data):
+        """Test models round-trip through save and load."""
+        X, y_class, y_reg = training_data
+
+        monitor.add_classifier(PredictionType.LATE_DELIVERY)
+        monitor.add_regressor(PredictionType.COMPLETION_TIME)
+        monitor.train_model(PredictionType.LATE_DELIVERY, X, y_class)
+        monitor.train_model(PredictionType.COMPLETION_TIME, X, y_reg)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monitor.save(tmpdir)
+            loaded = PredictiveMonitor()
+            loaded.load(tmpdir)
+
+        for prediction_type in (
+            PredictionType.LATE_DELIVERY, PredictionType.COMPLETION_TIME
+        ):
+            original = monitor.get_model(prediction_type).predict(X[:5])
+            restored = loaded.get_model(prediction_type).predict(X[:5])
+            assert [p.predicted_value for p in restored] == [
+                p.predicted_value for p in original
+            ]
+
 
 class TestAlertSeverity:
     """Tests for AlertSeverity enumeration."""
@@ -0,0 +1,265 @@
+"""
+Tests for the SAP SALT adapter.
+
+Uses small SALT-shaped tables written to Parquet, so no Hugging Face
+download is needed. The columnar conversion and both JSON encoders are
+checked against the record-oriented output they must reproduce.
+"""
+
+import json
+import math
+
+import pandas as pd
+import pytest
+
+from src.ingest import salt_adapter
+from src.ingest.salt_adapter import SALTAdapter
+
+
+SALES_ROWS = [
+    # SALESDOCUMENT, CREATIONDATE, type, customer, requested delivery,
+    # item, material, quantity, net amount
+    (1002, '20240115', 'OR', 5, '20240120', 10, 'M1', 2.0, 10.0),
+    (1001, '2024-02-03', 'TA', 6, None, 10, 'M2', 1.0, 3.25),
+    (1002, '20240115', 'OR', 5, '20240120', 20, 'M2', 1.5, None),
+    (1003, None, 'OR', 5, None, 10, 'M1', None, 4.0),
+    (1004, '99991231', None, 6, None, 10, None, 3.0, 1.0),
+]
+
+
+def _sales_frame():
+    """Joined SALT sales rows (header and item columns)."""
+    return pd.DataFrame(SALES_ROWS, columns=[
+        'SALESDOCUMENT', 'CREATIONDATE', 'SALESDOCUMENTTYPE', 'SOLDTOPARTY',
+        'REQUESTEDDELIVERYDATE', 'SALESDOCUMENTITEM', 'MATERIAL',
+        'REQUESTEDQUANTITY', 'NETAMOUNT',
+    ]).assign(
+        SALESORGANIZATION='1000',
+        SHIPPINGPOINT='S1',
+        UNUSEDCOLUMN='x',
+    )
+
+
+# Stands in for NaN, which never compares equal to itself; None stays None
+# so a NaN where None is expected still fails
+NAN = 'NaN'
+
+
+def _plain(value):
+    """Replace NaN with a comparable marker."""
+    if isinstance(value, float) and math.isnan(value):
+        return NAN
+    return value
+
+
+def _plain_records(records):
+    """Records with missing values normalized, nested items included."""
+    plain = []
+    for record in records:
+        record = {k: _plain(v) for k, v in record.items()}
+        if 'items' in record:
+            record['items'] = _plain_records(record['items'])
+        plain.append(record)
+    return plain
+
+
+def _columns_as_format(tables):
+    """
+    Reshape to_workflow_columns() output like to_workflow_format().
+
+    Frames are turned into records with the adapter's own conversion, using
+    the missing-value handling to_workflow_format() applies to each table.
+    """
+    raw = {'sales_orders', 'sales_order_items'}  # converted with missing_as_none=False
+    records = {
+        name: _plain_records(salt_adapter._records(frame, missing_as_none=name not in raw))
+        for name, frame in tables.items()
+    }
+    items = records.pop('sales_order_items', None)
+    if items is not None:
+        by_order = {}
+        for item in items:
+            by_order.setdefault(item.pop('document_number'), []).append(item)
+        for order in records['sales_orders']:
+            order['items'] = by_order.get(order['document_number'], [])
+    return records
+
+
+def _nan_as_null(records):
+    """Records as orjson writes them: NaN becomes null."""
+    return [
+        {k: (None if v == NAN else _nan_as_null(v) if k == 'items' else v)
+         for k, v in record.items()}
+        for record in records
+    ]
+
+
+@pytest.fixture
+def salt_dir(tmp_path):
+    """Directory of SALT Parquet tables."""
+    sales = _sales_frame()
+    sales.drop_duplicates('SALESDOCUMENT').drop(columns=[
+        'SALESDOCUMENTITEM', 'MATERIAL', 'REQUESTEDQUANTITY', 'NETAMOUNT',
+    ]).to_parquet(tmp_path / 'I_SalesDocument_train.parquet')
+    # Named so the I_SalesDocument* pattern cannot pick up the items table
+    sales[['SALESDOCUMENT', 'SALESDOCUMENTITEM', 'MATERIAL', 'SHIPPINGPOINT']].to_parquet(
+        tmp_path / 'salesdocument_items_train.parquet'
+    )
+    pd.DataFrame({
+        'CUSTOMER': [5, 6],
+        'CUSTOMERNAME': ['Acme', None],
+        'COUNTRY': ['DE', 'US'],
+        'CityName': ['Berlin', 'Boston'],
+    }).to_parquet(tmp_path / 'I_Customer_train.parquet')
+    return tmp_path
+
+
+@pytest.fixture
+def adapter(salt_dir):
+    """Adapter loaded from the Parquet tables."""
+    adapter = SALTAdapter()
+    adapter.load_from_parquet(str(salt_dir))
+    return adapter
+
+
+@pytest.fixture
+def joined_adapter():
+    """Adapter holding a joined sales table, as load_from_huggingface(use_joined=True) does."""
+    adapter = SALTAdapter()
+    adapter._joined = adapter._categorize(_sales_frame())
+    return adapter
+
+
+class TestLoadFromParquet:
+    """Tests for loading SALT tables from Parquet files."""
+
+    def test_counts(self, adapter):
+        """Test row counts of each table are reported."""
+        stats = adapter.get_statistics()
+
+        assert (stats['sales_documents'], stats['sales_items'], stats['customers']) == (4, 5, 2)
+
+    def test_projection(self, adapter):
+        """Test only mapped columns of the sales tables are read."""
+        assert 'UNUSEDCOLUMN' not in adapter.get_statistics()['sales_document_columns']
+
+
+class TestWorkflowFormat:
+    """Tests for to_workflow_format() output values."""
+
+    def test_orders(self, adapter):
+        """Test orders are sorted by document with normalized dates."""
+        orders = adapter.to_workflow_format()['sales_orders']
+
+        assert [o['document_number'] for o in orders] == ['1001', '1002', '1003', '1004']
+        assert [o['created_date'] for o in orders] == [
+            '2024-02-03', '2024-01-15', None, '9999-12-31',
+        ]
+        assert [o['customer'] for o in orders] == ['6', '5', '5', '6']
+
+    def test_absent_fields_are_none(self, joined_adapter):
+        """Test fields with no source column are None, not NaN."""
+        data = joined_adapter.to_workflow_format()
+        order = data['sales_orders'][0]
+
+        assert order['payment_terms'] is None
+        assert order['shipping_condition'] is None
+        assert order['incoterms'] is None
+        assert order['items'][0]['plant'] is None
+
+    def test_synthetic_events(self, joined_adapter):
+        """Test dated orders get a delivery and invoice summing their items."""
+        data = joined_adapter.to_workflow_format()
+
+        assert [d['document_number'] for d in data['deliveries']] == ['81001', '81002', '81004']
+        assert data['deliveries'][1]['created_date'] == '2024-01-18'
+        assert data['deliveries'][1]['actual_gi_date'] == '2024-01-19'
+        assert [(i['billing_date'], i['net_value']) for i in data['invoices']] == [
+            ('2024-02-08', 3.25), ('2024-01-20', 10.0), ('9999-12-31', 1.0),
+        ]
+        assert [(f['preceding_doc'], f['subsequent_doc']) for f in data['doc_flow'][:2]] == [
+            ('1001', '81001'), ('81001', '91001'),
+        ]
+
+    def test_items_and_materials(self, joined_adapter):
+        """Test joined rows become per-order items and distinct materials."""
+        data = joined_adapter.to_workflow_format()
+
+        items = data['sales_orders'][1]['items']
+        assert [(i['item_number'], i['material_id'], i['net_value']) for i in items] == [
+            ('10', 'M1', 10.0), ('20', 'M2', 0.0),
+        ]
+        assert data['materials'] == [{'material_id': 'M1'}, {'material_id': 'M2'}]
+
+    def test_sample_size(self, adapter):
+        """Test sample_size limits the number of orders."""
+        assert len(adapter.to_workflow_format(sample_size=2)['sales_orders']) == 2
+
+    def test_requires_data(self):
+        """Test converting before loading raises ValueError."""
+        with pytest.raises(ValueError):
+            SALTAdapter().to_workflow_format()
+
+
+class TestWorkflowColumns:
+    """to_workflow_columns() must match to_workflow_format()."""
+
+    @pytest.mark.parametrize('fixture', ['adapter', 'joined_adapter'])
+    def test_matches_workflow_format(self, fixture, request):
+        """Test columnar tables hold the same rows as the dict tables."""
+        adapter = request.getfixturevalue(fixture)
+
+        expected = {
+            name: _plain_records(records)
+            for name, records in adapter.to_workflow_format().items()
+        }
+
+        assert _columns_as_format(adapter.to_workflow_columns()) == expected
+
+    def test_without_events(self, joined_adapter):
+        """Test generate_events=False leaves out the synthetic tables."""
+        tables = joined_adapter.to_workflow_columns(generate_events=False)
+
+        assert set(tables) == {'sales_orders', 'sales_order_items', 'customers', 'materials'}
+
+
+class TestSaveToJson:
+    """Tests for writing the workflow tables as JSON."""
+
+    @staticmethod
+    def _read_all(saved):
+        """Parse each saved file, with NaN replaced by a comparable marker."""
+        tables = {}
+        for name, path in saved.items():
+            with open(path, encoding='utf-8') as f:
+                tables[name] = _plain_records(json.load(f))
+        return tables
+
+    def test_round_trip(self, joined_adapter, tmp_path, monkeypatch):
+        """Test each non-empty table is written and parses back to its records."""
+        monkeypatch.setattr(salt_adapter, 'ORJSON_AVAILABLE', False)
+        saved = joined_adapter.save_to_json(str(tmp_path / 'out'))
+        expected = {
+            name: _plain_records(json.loads(json.dumps(records, default=str)))
+            for name, records in joined_adapter.to_workflow_format().items() if records
+        }
+
+        assert self._read_all(saved) == expected
+
+    @pytest.mark.skipif(not salt_adapter.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_matches_json(self, joined_adapter, tmp_path, monkeypatch):
+        """Test orjson writes the json encoder's records, with NaN as null."""
+        orjson_dir = tmp_path / 'orjson'
+        with_orjson = self._read_all(joined_adapter.save_to_json(str(orjson_dir)))
+        monkeypatch.setattr(salt_adapter, 'ORJSON_AVAILABLE', False)
+        with_json = self._read_all(joined_adapter.save_to_json(str(tmp_path / 'json')))
+
+        assert with_orjson == {name: _nan_as_null(records) for name, records in with_json.items()}
+        assert 'NaN' not in (orjson_dir / 'sales_orders.json').read_text(encoding='utf-8')
+
+    def test_threaded_writes(self, joined_adapter, tmp_path):
+        """Test workers > 1 writes the same files."""
+        sequential = joined_adapter.save_to_json(str(tmp_path / 'one'))
+        threaded = joined_adapter.save_to_json(str(tmp_path / 'many'), workers=4)
+
+        assert self._read_all(threaded) == self._read_all(sequential)